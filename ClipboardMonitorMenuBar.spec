@@ -5,7 +5,7 @@ a = Analysis(
     ['menu_bar_app.py'],
     pathex=[],
     binaries=[],
-    datas=[('unified_memory_dashboard.py', '.'), ('memory_monitoring_dashboard.py', '.'), ('memory_visualizer.py', '.'), ('modules', 'modules'), ('config.json', '.'), ('constants.py', '.'), ('config_manager.py', '.'), ('utils.py', '.'), ('clipboard_reader.py', '.'), ('module_manager.py', '.'), ('history_viewer.py', '.'), ('web_history_viewer.py', '.'), ('cli_history_viewer.py', '.'), ('com.clipboardmonitor.plist', '.'), ('com.clipboardmonitor.menubar.plist', '.'), ('icon-windowed.icns', '.')],
+    datas=[('unified_memory_dashboard.py', '.'), ('memory_monitoring_dashboard.py', '.'), ('memory_visualizer.py', '.'), ('modules', 'modules'), ('config.json', '.'), ('constants.py', '.'), ('config_manager.py', '.'), ('utils.py', '.'), ('clipboard_reader.py', '.'), ('module_manager.py', '.'), ('control_server.py', '.'), ('adaptive_scheduler.py', '.'), ('clipboard_event.py', '.'), ('content_tracker.py', '.'), ('content_hashing.py', '.'), ('module_executor.py', '.'), ('module_api.py', '.'), ('module_profile.py', '.'), ('module_memory.py', '.'), ('content_router.py', '.'), ('module_watchdog.py', '.'), ('module_metrics.py', '.'), ('process_pool.py', '.'), ('side_effects.py', '.'), ('clipboard_writer.py', '.'), ('result_cache.py', '.'), ('event_queue.py', '.'), ('history_viewer.py', '.'), ('web_history_viewer.py', '.'), ('cli_history_viewer.py', '.'), ('com.clipboardmonitor.plist', '.'), ('com.clipboardmonitor.menubar.plist', '.'), ('icon-windowed.icns', '.')],
     hiddenimports=['Cocoa', 'modules.code_formatter_module', 'modules.drawio_module', 'modules.markdown_module', 'modules.mermaid_module'],
     hookspath=[],
     hooksconfig={},
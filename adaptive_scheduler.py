@@ -0,0 +1,125 @@
+"""
+AdaptiveScheduler class - Chooses the next clipboard check interval from observed activity.
+Used by the "auto" scheduling mode in place of the fixed polling/enhanced intervals.
+"""
+
+import time
+import logging
+
+from constants import (
+    DEFAULT_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    ADAPTIVE_BACKOFF_FACTOR, ADAPTIVE_EWMA_ALPHA, ADAPTIVE_MAX_DUTY_CYCLE,
+    ADAPTIVE_REPORT_INTERVAL
+)
+
+logger = logging.getLogger("adaptive_scheduler")
+
+
+class AdaptiveScheduler:
+    """
+    Models clipboard change rate and per-tick cost with exponentially weighted
+    moving averages, and backs the check interval off exponentially while the
+    clipboard is quiet.
+
+    Right after a change the interval drops to the minimum so follow-up copies are
+    picked up quickly; every quiet tick multiplies it by the backoff factor, up to
+    the maximum. The interval is never allowed below what keeps the checks
+    themselves under ADAPTIVE_MAX_DUTY_CYCLE of wall time.
+    """
+
+    def __init__(self, min_interval=DEFAULT_ADAPTIVE_MIN_INTERVAL, max_interval=DEFAULT_ADAPTIVE_MAX_INTERVAL,
+                 backoff_factor=ADAPTIVE_BACKOFF_FACTOR, alpha=ADAPTIVE_EWMA_ALPHA, clock=time.monotonic):
+        """
+        Initialize the scheduler.
+
+        Args:
+            min_interval (float): Shortest allowed interval in seconds
+            max_interval (float): Longest allowed interval in seconds
+            backoff_factor (float): Multiplier applied to the interval on each quiet tick
+            alpha (float): EWMA smoothing factor (0-1, higher reacts faster)
+            clock (callable): Monotonic time source (injectable for tests)
+        """
+        self.min_interval = float(min_interval)
+        self.max_interval = max(float(max_interval), self.min_interval)
+        self.backoff_factor = max(float(backoff_factor), 1.0)
+        self.alpha = alpha
+        self.clock = clock
+
+        self.interval = self.min_interval
+        self.change_rate = 0.0      # EWMA of changes per second
+        self.tick_cost = 0.0        # EWMA of seconds spent per check
+        self.wakeups = 0
+        self.changes = 0
+        self.started_at = self.clock()
+        self._last_tick = self.started_at
+        self._last_report = self.started_at
+
+    def record_tick(self, changed, tick_cost=0.0):
+        """
+        Record the outcome of a check and return the interval until the next one.
+
+        Args:
+            changed (bool): Whether the clipboard changed on this tick
+            tick_cost (float): Seconds spent performing the check
+
+        Returns:
+            float: Seconds to wait before the next check
+        """
+        now = self.clock()
+        elapsed = max(now - self._last_tick, 1e-6)
+        self._last_tick = now
+        self.wakeups += 1
+
+        observed_rate = (1.0 if changed else 0.0) / elapsed
+        self.change_rate += self.alpha * (observed_rate - self.change_rate)
+        self.tick_cost += self.alpha * (max(tick_cost, 0.0) - self.tick_cost)
+
+        if changed:
+            self.changes += 1
+            interval = self.min_interval
+        else:
+            interval = self.interval * self.backoff_factor
+            # While changes are still arriving, keep checking at least twice per expected change
+            if self.change_rate > 0:
+                interval = min(interval, max(0.5 / self.change_rate, self.min_interval))
+
+        # Never spend more than the duty-cycle budget on the checks themselves
+        interval = max(interval, self.tick_cost / ADAPTIVE_MAX_DUTY_CYCLE)
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+
+        if now - self._last_report >= ADAPTIVE_REPORT_INTERVAL:
+            self._last_report = now
+            logger.info(
+                f"Adaptive scheduler: {self.wakeups_per_hour():.0f} wakeups/hour "
+                f"(current interval {self.interval:.2f}s, change rate {self.change_rate * 3600:.1f}/hour)"
+            )
+        return self.interval
+
+    def wakeups_per_hour(self):
+        """
+        Get the average number of checks per hour since the scheduler started.
+
+        Returns:
+            float: Wakeups per hour
+        """
+        elapsed = max(self.clock() - self.started_at, 1e-6)
+        return self.wakeups * 3600.0 / elapsed
+
+    def get_stats(self):
+        """
+        Get scheduler statistics.
+
+        Returns:
+            dict: Current interval, EWMA estimates and wakeup counts
+        """
+        return {
+            "mode": "auto",
+            "interval": self.interval,
+            "min_interval": self.min_interval,
+            "max_interval": self.max_interval,
+            "change_rate_per_hour": self.change_rate * 3600.0,
+            "tick_cost_ms": self.tick_cost * 1000.0,
+            "wakeups": self.wakeups,
+            "changes": self.changes,
+            "wakeups_per_hour": self.wakeups_per_hour(),
+        }
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark clipboard content hashing.
+
+Compares the previous approach (MD5 over a full UTF-8 copy of the content) with
+content_hashing.hash_text (chunked encoding through BLAKE2b, or xxhash when
+installed) for 1-10MB clipboards, reporting CPU time and peak allocation.
+
+Usage:
+    python3 benchmark_hashing.py [--repeat N]
+"""
+
+import argparse
+import hashlib
+import time
+import tracemalloc
+
+from content_hashing import hash_text, HASH_ALGORITHM
+
+
+def md5_full_copy(text):
+    """The hashing previously used throughout the app."""
+    return hashlib.md5(str(text).encode('utf-8')).hexdigest()
+
+
+def measure(func, text, repeat):
+    """Return (CPU ms per call, peak allocated MB) for hashing text with func."""
+    start = time.process_time()
+    for _ in range(repeat):
+        func(text)
+    cpu_ms = (time.process_time() - start) * 1000 / repeat
+
+    tracemalloc.start()
+    func(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu_ms, peak / (1024 * 1024)
+
+
+def make_content(size_mb):
+    """Build mixed ASCII/non-ASCII text of roughly size_mb megabytes."""
+    line = "def handler(event):  # café ✓ résumé\n"
+    return line * (size_mb * 1024 * 1024 // len(line.encode('utf-8')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark clipboard content hashing")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print(f"Streaming algorithm: {HASH_ALGORITHM}")
+    print(f"{'size':>6}  {'md5 CPU':>10}  {'md5 peak':>10}  {'new CPU':>10}  {'new peak':>10}")
+    for size_mb in (1, 2, 5, 10):
+        text = make_content(size_mb)
+        old_cpu, old_peak = measure(md5_full_copy, text, args.repeat)
+        new_cpu, new_peak = measure(hash_text, text, args.repeat)
+        print(f"{size_mb:>4}MB  {old_cpu:>8.2f}ms  {old_peak:>8.2f}MB  {new_cpu:>8.2f}ms  {new_peak:>8.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
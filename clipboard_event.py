@@ -0,0 +1,148 @@
+"""
+ClipboardEvent class - One clipboard change as it flows through the module pipeline.
+Shared derivations (hash, stripped text, lines, byte length, detected type) are
+computed lazily, at most once per change, no matter how many modules use them.
+"""
+
+from functools import cached_property
+
+from content_hashing import hash_text
+
+# Diagram types recognised by their first word (shared with the markdown/mermaid detectors)
+MERMAID_STARTERS = (
+    "graph ", "flowchart", "sequenceDiagram", "classDiagram", "stateDiagram",
+    "erDiagram", "journey", "gantt", "pie", "mindmap", "timeline", "gitGraph",
+    "quadrantChart", "requirementDiagram", "C4Context", "C4Container",
+    "C4Component", "C4Dynamic",
+)
+
+
+class ClipboardEvent(str):
+    """
+    Clipboard content plus memoized derivations of it.
+
+    ClipboardEvent is a str subclass, so modules whose process() expects a plain
+    string keep working unchanged; modules that know about events can use the
+    cached properties instead of re-deriving them.
+
+    Oversized content (see utils.read_clipboard_bounded) is represented by an event
+    whose text is only a prefix window; 'truncated' is then True, and
+    'total_bytes'/'content_hash' describe the full content. Such events compare
+    equal by full-content hash rather than by their prefix.
+    """
+
+    truncated = False
+
+    def __new__(cls, content="", total_bytes=None, content_hash=None, truncated=False):
+        obj = super().__new__(cls, content)
+        if truncated:
+            obj.truncated = True
+        if total_bytes is not None:
+            obj.__dict__['byte_length'] = total_bytes
+        if content_hash is not None:
+            obj.__dict__['content_hash'] = content_hash
+        return obj
+
+    @classmethod
+    def from_content(cls, content):
+        """
+        Wrap content in an event, reusing it if it already is one.
+
+        Args:
+            content (str or ClipboardEvent): Clipboard content
+
+        Returns:
+            ClipboardEvent or None: The event, or None for None content
+        """
+        if content is None or isinstance(content, ClipboardEvent):
+            return content
+        return cls(content)
+
+    @property
+    def text(self):
+        """The content as a plain string."""
+        return str.__str__(self)
+
+    @property
+    def total_bytes(self):
+        """Size in bytes of the full content (same as byte_length)."""
+        return self.byte_length
+
+    @cached_property
+    def content_hash(self):
+        """Hex digest of the UTF-8 encoded content (see content_hashing)."""
+        return hash_text(self)
+
+    @cached_property
+    def byte_length(self):
+        """Length of the UTF-8 encoded content in bytes."""
+        return len(self.encode('utf-8'))
+
+    @cached_property
+    def stripped(self):
+        """The content with leading and trailing whitespace removed."""
+        return self.strip()
+
+    @cached_property
+    def lines(self):
+        """The content split on newlines."""
+        return tuple(self.split('\n'))
+
+    @cached_property
+    def non_empty_lines(self):
+        """Stripped lines, excluding blank ones."""
+        return tuple(line for line in (raw.strip() for raw in self.lines) if line)
+
+    @cached_property
+    def content_type(self):
+        """
+        Cheap first guess at the content type from its opening characters.
+
+        Returns:
+            str: 'rtf', 'drawio', 'mermaid' or 'text'
+        """
+        head = self.stripped[:64]
+        if head.startswith('{\\rtf'):
+            return 'rtf'
+        if head.startswith('<mxfile'):
+            return 'drawio'
+        if head.startswith(MERMAID_STARTERS):
+            return 'mermaid'
+        return 'text'
+
+    def derive(self, key, compute):
+        """
+        Memoize a module's own derivation of this content, such as the verdict its
+        detect() reached, so process() can reuse it for the same change.
+
+        Args:
+            key (str): Name of the derivation, prefixed with the module name
+            compute (callable): Called with the event to compute the value once
+
+        Returns:
+            The memoized value
+        """
+        derived = self.__dict__.setdefault('derived', {})
+        if key not in derived:
+            derived[key] = compute(self)
+        return derived[key]
+
+    def __eq__(self, other):
+        if self.truncated or getattr(other, 'truncated', False):
+            return isinstance(other, ClipboardEvent) and self.content_hash == other.content_hash
+        return str.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        if self.truncated:
+            return hash(self.content_hash)
+        return str.__hash__(self)
+
+    def __reduce__(self):
+        # Keep memoized derivations (and the truncation metadata) when pickled
+        return (self.__class__, (self.text,), dict(self.__dict__, truncated=self.truncated))
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
@@ -0,0 +1,210 @@
+"""
+Clipboard writer - Writes the clipboard on behalf of modules and remembers each
+write, so the watcher can tell its own changes from the user's.
+
+Every write records the content hash and, on macOS, the pasteboard change count
+(NSPasteboard changeCount) the write produced, once the write has returned and the
+count shows that nobody else wrote in between. The enhanced watcher looks a new
+change count up before reading the clipboard, so a confirmed write of our own is
+skipped without a read or a pipeline pass. Any other change is read: the watcher
+checks the count again after the read, and then the content hash. Without AppKit
+(polling mode, other platforms) there is no change count, and only the content
+hash is matched.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+
+from content_hashing import hash_text
+from constants import SELF_WRITE_REGISTRY_SIZE, SELF_WRITE_TTL
+
+try:
+    from AppKit import NSPasteboard
+except ImportError:
+    NSPasteboard = None
+
+logger = logging.getLogger("clipboard_writer")
+
+
+def _pasteboard_change_count():
+    """Get the general pasteboard's change count, or None without AppKit."""
+    if NSPasteboard is None:
+        return None
+    try:
+        return NSPasteboard.generalPasteboard().changeCount()
+    except Exception:
+        return None
+
+
+class SelfWriteRegistry:
+    """
+    Remembers recent clipboard writes made by modules.
+
+    The content hash is registered before the write. The change count is only
+    recorded after it, and only if the count moved by exactly one during the write.
+    Otherwise another application wrote at the same time, the count is ambiguous, and
+    only the content hash is kept. A change count is therefore never matched
+    before the write that produced it is confirmed, so a user's copy is never
+    skipped unread.
+
+    In a worker process, `announce` is set to a callable that hands each finished
+    write's (change count or None, content hash) to the service process.
+    """
+
+    def __init__(self, max_entries=SELF_WRITE_REGISTRY_SIZE, ttl=SELF_WRITE_TTL,
+                 change_count=_pasteboard_change_count, clock=time.monotonic):
+        """
+        Initialize the registry.
+
+        Args:
+            max_entries (int): Number of recent writes remembered
+            ttl (float): Seconds a write's content hash can still be matched
+            change_count (callable): Returns the pasteboard change count, or None
+            clock (callable): Monotonic time source (injectable for tests)
+        """
+        self.ttl = ttl
+        self.change_count = change_count
+        self.clock = clock
+        self.lock = threading.Lock()
+        self._entries = deque(maxlen=max_entries)
+        self.stats = {"writes": 0, "failed": 0, "skipped_by_token": 0, "skipped_by_hash": 0}
+        self.announce = None
+
+    def _forget(self, entry):
+        # Caller holds the lock; entries are matched by identity
+        for index, candidate in enumerate(self._entries):
+            if candidate is entry:
+                del self._entries[index]
+                return
+
+    def write(self, content, write):
+        """
+        Write the clipboard and record the write as our own.
+
+        Args:
+            content (str): The content being written (what the watcher would read back)
+            write (callable): Performs the write when called with content
+
+        Returns:
+            The result of write(content)
+
+        Raises:
+            Exception: Whatever write() raises; the write is then forgotten
+        """
+        before = self.change_count()
+        entry = {"token": None, "hash": hash_text(content), "time": self.clock()}
+        with self.lock:
+            self._entries.append(entry)
+        try:
+            result = write(content)
+        except Exception:
+            with self.lock:
+                self._forget(entry)
+                self.stats["failed"] += 1
+            raise
+        after = self.change_count()
+        with self.lock:
+            if before is not None and after == before + 1:
+                entry["token"] = after
+            elif before is not None:
+                logger.debug(f"Pasteboard changed by another writer ({before} -> {after}); matching by content")
+            self.stats["writes"] += 1
+        if self.announce is not None:
+            self.announce(entry["token"], entry["hash"])
+        return result
+
+    def is_own_change(self, change_count):
+        """
+        Check whether a pasteboard change count was produced by one of our confirmed writes.
+
+        A match also forgets earlier writes, which the watcher can no longer see. A write
+        still in progress does not match yet, so the watcher reads the change and checks
+        again (and then the content) after the read.
+
+        Args:
+            change_count (int): The change count the watcher observed
+
+        Returns:
+            bool: True if the change is our own and need not be read
+        """
+        with self.lock:
+            if not any(entry["token"] == change_count for entry in self._entries):
+                return False
+            self._entries = deque((entry for entry in self._entries
+                                   if entry["token"] is None or entry["token"] > change_count),
+                                  maxlen=self._entries.maxlen)
+            self.stats["skipped_by_token"] += 1
+            return True
+
+    def is_own_content(self, content):
+        """
+        Check whether content read from the clipboard was recently written by us.
+
+        A match is forgotten, so the same text copied again by the user is processed.
+
+        Args:
+            content (str): Content read from the clipboard
+
+        Returns:
+            bool: True if the content matches a write made within the last `ttl` seconds
+        """
+        now = self.clock()
+        content_hash = hash_text(content)
+        with self.lock:
+            for entry in self._entries:
+                if entry["hash"] == content_hash and now - entry["time"] <= self.ttl:
+                    self._forget(entry)
+                    self.stats["skipped_by_hash"] += 1
+                    return True
+            return False
+
+    def adopt(self, writes):
+        """
+        Remember writes announced by another process on this machine.
+
+        Args:
+            writes (list): (change count or None, content hash) pairs, as passed to `announce`
+        """
+        now = self.clock()
+        with self.lock:
+            for token, content_hash in writes:
+                self._entries.append({"token": token, "hash": content_hash, "time": now})
+                self.stats["writes"] += 1
+
+    def get_stats(self):
+        """
+        Get registry statistics.
+
+        Returns:
+            dict: Writes, failed writes, changes skipped by change count and by content
+                hash, and the number of writes still remembered
+        """
+        with self.lock:
+            return dict(self.stats, pending=len(self._entries))
+
+
+_registry = SelfWriteRegistry()
+
+
+def get_self_write_registry():
+    """Get the process-wide self-write registry."""
+    return _registry
+
+
+def write_clipboard(content, write):
+    """
+    Write the clipboard through `write` and record it as our own change.
+
+    Modules use this for every clipboard write, inside process() so that its return
+    value can report whether the write happened: write_clipboard(text, pyperclip.copy).
+
+    Args:
+        content (str): The content to write
+        write (callable): Performs the write when called with content, e.g. pyperclip.copy
+
+    Returns:
+        The result of write(content)
+    """
+    return _registry.write(content, write)
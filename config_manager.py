@@ -10,11 +10,93 @@ from pathlib import Path
 # Use the same config path as utils.py for consistency
 CONFIG_PATH = str(Path.home() / "Library" / "Application Support" / "ClipboardMonitor" / "config.json")
 
-from constants import DEFAULT_CONFIG, DEFAULT_POLLING_INTERVAL, DEFAULT_ENHANCED_CHECK_INTERVAL, DEFAULT_MAX_CLIPBOARD_SIZE
+from constants import (
+    DEFAULT_CONFIG, DEFAULT_POLLING_INTERVAL, DEFAULT_ENHANCED_CHECK_INTERVAL, DEFAULT_MAX_CLIPBOARD_SIZE,
+    DEFAULT_SCHEDULING_MODE, DEFAULT_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL
+)
 
 logger = logging.getLogger("config_manager")
 
 
+class FrozenDict(dict):
+    """A read-only dict used for configuration snapshots (still a dict for isinstance checks)."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Configuration snapshots are read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        # Pickle as a plain dict's items so unpickling does not go through __setitem__
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _freeze(value):
+    """Recursively convert dicts to FrozenDicts and lists to tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ConfigSnapshot:
+    """
+    An immutable, versioned view of the configuration.
+
+    A new snapshot (with a higher version) is built only when the configuration
+    changes, so consumers can compare versions, or section identities, to decide
+    whether derived state needs recomputing.
+    """
+
+    __slots__ = ("version", "config")
+
+    def __init__(self, version, config):
+        """
+        Initialize the snapshot.
+
+        Args:
+            version (int): Configuration version
+            config (dict): Configuration to freeze
+        """
+        self.version = version
+        self.config = _freeze(config)
+
+    def get_section(self, section, default=None):
+        """
+        Get a read-only configuration section.
+
+        Args:
+            section (str): Section name
+            default: Default value if section not found
+
+        Returns:
+            FrozenDict: Configuration section or default
+        """
+        return self.config.get(section, _freeze(default or {}))
+
+    def get_config_value(self, section, key, default=None):
+        """
+        Get a specific configuration value from a section.
+
+        Args:
+            section (str): The configuration section (e.g., 'general').
+            key (str): The key within the section.
+            default: The default value to return if not found.
+
+        Returns:
+            The configuration value or the default.
+        """
+        return self.config.get(section, {}).get(key, default)
+
+
 class ConfigManager:
     """
     Manages application configuration with defaults and validation.
@@ -44,6 +126,9 @@ class ConfigManager:
         self.config_path = str(config_path)
         self._last_reload_time = 0  # Track last reload time to prevent excessive reloading
         self._instance_id = id(self)  # Track instance for debugging
+        self._config_mtime = None  # mtime of the config file when last loaded
+        self._version = 0  # Incremented whenever the configuration changes
+        self._snapshot = None
         self.config = self._load_config()
     
     def _load_config(self):
@@ -63,6 +148,7 @@ class ConfigManager:
             config_file.parent.mkdir(parents=True, exist_ok=True)
 
             if config_file.exists():
+                self._config_mtime = config_file.stat().st_mtime_ns
                 with config_file.open('r') as f:
                     user_config = json.load(f)
                 
@@ -79,6 +165,7 @@ class ConfigManager:
                 instance_id = getattr(self, '_instance_id', id(self))
                 logger.info(f"Loaded configuration from {self.config_path} (instance: {instance_id})")
             else:
+                self._config_mtime = None
                 logger.info("No config.json found, using defaults")
         except (OSError, json.JSONDecodeError) as e:
             logger.error(f"Error loading config: {e}")
@@ -135,6 +222,7 @@ class ConfigManager:
             value: Value to set
         """
         self.config[key] = value
+        self._version += 1
     
     def save(self):
         """
@@ -178,7 +266,43 @@ class ConfigManager:
             logger.debug(f"Config reload called from:\n{stack_trace}")
 
         self.config = self._load_config()
+        self._version += 1
         return self.config
+
+    def refresh_if_changed(self):
+        """
+        Reload the configuration if the config file changed since it was last loaded.
+
+        This costs one stat() call, so it is cheap enough to run for every clipboard event.
+
+        Returns:
+            bool: True if the configuration was reloaded
+        """
+        try:
+            mtime = Path(self.config_path).stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime == self._config_mtime:
+            return False
+        logger.info("Config file changed on disk, reloading")
+        self.config = self._load_config()
+        self._version += 1
+        return True
+
+    def snapshot(self):
+        """
+        Get an immutable snapshot of the current configuration.
+
+        The snapshot is rebuilt only after the configuration changes (reload(), set()
+        or refresh_if_changed()); otherwise the same object is returned.
+
+        Returns:
+            ConfigSnapshot: The current configuration snapshot
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self._version:
+            snapshot = self._snapshot = ConfigSnapshot(self._version, self.config)
+        return snapshot
     
     def is_debug_mode(self):
         """
@@ -207,6 +331,27 @@ class ConfigManager:
         """
         return self.get_config_value('general', 'enhanced_check_interval', DEFAULT_ENHANCED_CHECK_INTERVAL)
     
+    def get_scheduling_mode(self):
+        """
+        Get the clipboard check scheduling mode.
+        
+        Returns:
+            str: 'fixed' for the configured intervals, 'auto' for adaptive scheduling
+        """
+        return self.get_config_value('general', 'scheduling_mode', DEFAULT_SCHEDULING_MODE)
+    
+    def get_adaptive_interval_bounds(self):
+        """
+        Get the interval bounds for adaptive scheduling.
+        
+        Returns:
+            tuple: (min_interval, max_interval) in seconds
+        """
+        return (
+            self.get_config_value('general', 'adaptive_min_interval', DEFAULT_ADAPTIVE_MIN_INTERVAL),
+            self.get_config_value('general', 'adaptive_max_interval', DEFAULT_ADAPTIVE_MAX_INTERVAL)
+        )
+    
     def get_max_clipboard_size(self):
         """
         Get maximum clipboard size to process.
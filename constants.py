@@ -16,11 +16,72 @@ PAUSE_CHECK_INTERVAL = 1.0       # Time between pause flag checks
 ERROR_RETRY_DELAY = 1.0          # Brief pause before retrying after error
 PYPERCLIP_ERROR_DELAY = 5.0      # Longer wait for persistent pyperclip issues
 
+# Adaptive ("auto") scheduling
+DEFAULT_SCHEDULING_MODE = "fixed"        # "fixed" uses the configured intervals, "auto" adapts to activity
+DEFAULT_ADAPTIVE_MIN_INTERVAL = 0.1      # Interval right after a clipboard change
+DEFAULT_ADAPTIVE_MAX_INTERVAL = 2.0      # Longest interval while the clipboard is quiet
+ADAPTIVE_BACKOFF_FACTOR = 1.5            # Interval multiplier per quiet tick
+ADAPTIVE_EWMA_ALPHA = 0.2                # Smoothing for change-rate and tick-cost estimates
+ADAPTIVE_MAX_DUTY_CYCLE = 0.05           # Checks may use at most 5% of wall time
+ADAPTIVE_REPORT_INTERVAL = 3600          # Log wakeups/hour once an hour
+
 # Size Limits
 DEFAULT_MAX_CLIPBOARD_SIZE = 10485760    # 10MB in bytes
+DEFAULT_LARGE_CONTENT_WINDOW = 65536     # Prefix kept for content over the size limit (bytes)
 DEFAULT_MAX_CONTENT_LENGTH = 10000       # Maximum content length for history storage
 DEFAULT_MAX_HISTORY_ITEMS = 100          # Maximum number of items in history
 
+# Module Execution
+DEFAULT_MODULE_PRIORITY = 100            # Modules without a PRIORITY run after those with one
+DEFAULT_MODULE_WORKERS = 4               # Thread pool size for parallel module execution
+MODULE_COST_CLASSES = ("cheap", "moderate", "expensive")  # Values for a module's COST, cheapest first
+DEFAULT_MODULE_COST = "moderate"         # Cost class of modules that do not declare COST
+MODULE_COST_ESTIMATES_MS = {             # Assumed detection cost per cost class before a module is profiled
+    "cheap": 0.1, "moderate": 1.0, "expensive": 10.0
+}
+MODULE_PROFILE_PRIOR_WEIGHT = 5          # Observations the declared cost and a 50% match rate count as
+MODULE_PROFILE_SAVE_INTERVAL = 60        # Seconds between background saves of a changed module profile
+DEFAULT_MAX_MODULE_EXECUTION_TIME = 500  # Per-module budget in ms; stops isolated workers, counts in-process overruns as timeouts (0 disables)
+WATCHDOG_BACKOFF_AFTER = 3               # Consecutive failures (errors or timeouts) before a module's circuit opens
+WATCHDOG_BACKOFF_INITIAL = 60            # First open period in seconds (doubles on each failed retry)
+WATCHDOG_BACKOFF_MAX = 3600              # Longest open period in seconds
+WATCHDOG_NOTIFY_INTERVAL = 300           # Minimum seconds between timeout notifications per module
+WATCHDOG_WINDOW = 20                     # Recent runs per module considered for the failure rate
+WATCHDOG_MIN_CALLS = 10                  # Runs in the window before the failure rate can open a circuit
+WATCHDOG_FAILURE_RATE = 0.5              # Failure rate in the window that opens a circuit
+DEFAULT_PROCESS_POOL_WORKERS = 1         # Worker processes for modules with ISOLATION = "process"
+DEFAULT_PROCESS_WORKER_MAX_TASKS = 100   # Calls served by a worker process before it is replaced
+DEFAULT_PROCESS_WORKER_MAX_MEMORY = 200  # Peak worker RSS in MB after which it is replaced
+MODULE_RELOAD_CHECK_INTERVAL = 2.0       # Seconds between module file checks when hot reload is enabled
+MODULE_LATENCY_BUCKETS_MS = (            # Per-module latency histogram bucket bounds in milliseconds
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000
+)
+
+# Module Memory Tracking
+MODULE_MEMORY_SAMPLE_INTERVAL = 60       # Minimum seconds between changes processed with memory tracing on
+MODULE_MEMORY_TRACE_FRAMES = 10          # Traceback frames per allocation while sampling (deeper attribution, costs more)
+MODULE_MEMORY_HISTORY = 120              # Per-module memory samples kept for the dashboard
+
+# Lock Profiling
+LOCK_PROFILE_TOP_WAITERS = 5             # Call sites reported per lock, ranked by total time spent waiting
+
+# Result Cache
+RESULT_CACHE_MEMORY_BYTES = 8 * 1024 * 1024   # Size of the in-memory module result cache
+RESULT_CACHE_DISK_BYTES = 64 * 1024 * 1024    # Size of the on-disk module result cache
+
+# Side Effects
+SIDE_EFFECT_QUEUE_SIZE = 100             # Maximum queued notifications, browser opens and clipboard writes
+NOTIFICATION_DUPLICATE_WINDOW = 5        # Seconds during which an identical notification is suppressed
+NOTIFICATION_RATE_LIMIT = 4              # Maximum notifications shown per rate window
+NOTIFICATION_RATE_WINDOW = 10            # Notification rate window in seconds
+
+# Self-Write Registry
+SELF_WRITE_REGISTRY_SIZE = 32            # Recent module clipboard writes remembered for the watcher
+SELF_WRITE_TTL = 10.0                    # Seconds a written content hash still matches a change read back
+
+# Event Queue
+EVENT_QUEUE_SIZE = 50                    # Maximum clipboard changes waiting for the processing worker
+
 # Error Handling
 MAX_CONSECUTIVE_ERRORS = 10              # Maximum consecutive errors before exit
 CONTENT_TRACKER_MAX_HISTORY = 5          # Maximum content history for deduplication
@@ -29,6 +90,8 @@ CONTENT_TRACKER_MAX_HISTORY = 5          # Maximum content history for deduplica
 CODE_DETECTION_THRESHOLD = 0.15          # Minimum ratio of code lines to total lines
 MARKDOWN_DETECTION_THRESHOLD = 0.25      # Minimum ratio of markdown lines to total lines
 MIN_LINES_FOR_CODE_DETECTION = 3        # Minimum lines needed to detect code
+ROUTER_SAMPLE_LINES = 200                # Lines examined by the content router per change
+ROUTER_SAMPLED_THRESHOLD_FACTOR = 0.5    # Threshold margin when the router estimates from a sample
 
 # System Idle Thresholds (in seconds)
 SYSTEM_IDLE_THRESHOLD = 60               # Time before reducing check frequency
@@ -65,6 +128,9 @@ DEFAULT_GENERAL_CONFIG = {
     'module_validation_timeout': DEFAULT_MODULE_VALIDATION_TIMEOUT,
     'enhanced_check_interval': DEFAULT_ENHANCED_CHECK_INTERVAL,
     'idle_check_interval': DEFAULT_IDLE_CHECK_INTERVAL,
+    'scheduling_mode': DEFAULT_SCHEDULING_MODE,
+    'adaptive_min_interval': DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    'adaptive_max_interval': DEFAULT_ADAPTIVE_MAX_INTERVAL,
     'debug_mode': False,
     'notification_title': 'Clipboard Monitor'
 }
@@ -76,11 +142,32 @@ DEFAULT_SECURITY_CONFIG = {
 
 DEFAULT_PERFORMANCE_CONFIG = {
     'lazy_module_loading': True,
+    'module_warmup': True,
+    'module_hot_reload': False,
+    'event_queue': True,
+    'event_queue_size': EVENT_QUEUE_SIZE,
+    'result_cache': True,
+    'result_cache_memory_bytes': RESULT_CACHE_MEMORY_BYTES,
+    'result_cache_disk_bytes': RESULT_CACHE_DISK_BYTES,
     'adaptive_checking': True,
     'memory_optimization': True,
     'process_large_content': True,
+    'large_content_window': DEFAULT_LARGE_CONTENT_WINDOW,
+    'content_tracker_capacity': CONTENT_TRACKER_MAX_HISTORY,
+    'parallel_module_execution': False,
+    'content_routing': True,
+    'module_workers': DEFAULT_MODULE_WORKERS,
+    'module_priority': {},
+    'profile_guided_ordering': True,
+    'module_memory_tracking': False,
+    'module_memory_sample_interval': MODULE_MEMORY_SAMPLE_INTERVAL,
+    'lock_profiling': False,
+    'process_isolation': False,
+    'process_pool_workers': DEFAULT_PROCESS_POOL_WORKERS,
+    'process_worker_max_tasks': DEFAULT_PROCESS_WORKER_MAX_TASKS,
+    'process_worker_max_memory': DEFAULT_PROCESS_WORKER_MAX_MEMORY,
     'memory_logging': True,
-    'max_module_execution_time': 500
+    'max_module_execution_time': DEFAULT_MAX_MODULE_EXECUTION_TIME
 }
 
 DEFAULT_MEMORY_CONFIG = {
@@ -0,0 +1,68 @@
+"""
+Content hashing utilities - One fast, streaming hash for all clipboard content.
+Uses xxhash (XXH3-128) when installed, otherwise BLAKE2b with a 128-bit digest.
+Strings are encoded and hashed in fixed-size chunks, so hashing multi-MB content
+never allocates a full UTF-8 copy of it.
+"""
+
+import hashlib
+
+# Optional import for xxhash (faster, but not required)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+    xxhash = None
+
+HASH_ALGORITHM = "xxh3_128" if XXHASH_AVAILABLE else "blake2b"
+HASH_CHUNK_CHARS = 256 * 1024  # Characters encoded per chunk (at most 1MB of UTF-8)
+
+
+def new_hasher():
+    """
+    Create an incremental hasher for the configured algorithm.
+
+    Returns:
+        object: Hasher with update() and hexdigest() methods
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+def hash_bytes(data):
+    """
+    Hash a bytes-like object.
+
+    Args:
+        data (bytes): Data to hash
+
+    Returns:
+        str: Hex digest
+    """
+    hasher = new_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def hash_text(text):
+    """
+    Hash the UTF-8 encoding of a string, encoding it chunk by chunk.
+
+    Args:
+        text (str): Text to hash
+
+    Returns:
+        str: Hex digest, identical to hash_bytes(text.encode('utf-8'))
+    """
+    hasher = new_hasher()
+    if len(text) <= HASH_CHUNK_CHARS:
+        hasher.update(text.encode('utf-8'))
+    else:
+        # Chunks split on character boundaries, so their encodings concatenate
+        # to the full encoding
+        for start in range(0, len(text), HASH_CHUNK_CHARS):
+            hasher.update(text[start:start + HASH_CHUNK_CHARS].encode('utf-8'))
+    return hasher.hexdigest()
+
@@ -0,0 +1,214 @@
+"""
+ContentRouter class - Classifies clipboard content once per change so that only
+modules declaring a matching content type run their (more expensive) detectors.
+
+Modules declare the content types they handle in a CONTENT_TYPES tuple; "*" means
+every change (e.g. history). Modules without CONTENT_TYPES always run.
+"""
+
+import logging
+
+from constants import (
+    MARKDOWN_DETECTION_THRESHOLD, CODE_DETECTION_THRESHOLD, MIN_LINES_FOR_CODE_DETECTION,
+    ROUTER_SAMPLE_LINES, ROUTER_SAMPLED_THRESHOLD_FACTOR
+)
+from clipboard_event import ClipboardEvent, MERMAID_STARTERS
+
+logger = logging.getLogger("content_router")
+
+CONTENT_TYPE_ANY = "*"
+
+# Leading keywords counted by code_formatter_module.is_code (Python, JS/TS, Java/C#, Swift/Go)
+CODE_LINE_KEYWORDS = frozenset((
+    "def", "class", "import", "from", "if", "for", "while", "try", "except", "with",
+    "function", "const", "let", "var", "export", "interface", "catch",
+    "public", "private", "protected", "enum", "void", "int", "string", "boolean",
+    "func", "struct", "switch", "guard",
+))
+
+# First characters a markdown_module.is_markdown line pattern can start with
+# (headers, lists, blockquotes, fences, tables); bold/italic/links are found by substring
+MARKDOWN_LINE_STARTS = frozenset("#*->`|")
+
+
+class PrefixTrie:
+    """Character trie mapping string prefixes to values."""
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, prefix, value):
+        """
+        Add a prefix.
+
+        Args:
+            prefix (str): Prefix to match
+            value: Value returned when text starts with the prefix
+        """
+        node = self.root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(value)
+
+    def match(self, text):
+        """
+        Find the values of every inserted prefix that text starts with.
+
+        Args:
+            text (str): Text to match (only its first characters are examined)
+
+        Returns:
+            list: Matching values, shortest prefix first
+        """
+        matches = []
+        node = self.root
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            matches.extend(node.get(None, ()))
+        return matches
+
+
+def get_module_content_types(module):
+    """
+    Get the content types a module declares.
+
+    Args:
+        module: Processing module
+
+    Returns:
+        frozenset or None: Declared types, or None if the module declares none
+    """
+    declared = getattr(module, 'CONTENT_TYPES', None)
+    if declared is None:
+        return None
+    if isinstance(declared, str):
+        declared = (declared,)
+    return frozenset(declared)
+
+
+class ContentRouter:
+    """
+    Classifies content in a single pass and selects the modules that handle it.
+
+    Classification first walks a prefix trie over the (lower-cased) start of the
+    content: "<mxfile" and "{\\rtf" identify draw.io and RTF content outright, and
+    diagram keywords mark possible Mermaid. Otherwise a sample of lines is checked
+    with plain string tests that accept every line the markdown and code detectors
+    could count, so the router only narrows the candidates; each module's own
+    detector still makes the final decision.
+    """
+
+    # Types that are decided by their prefix alone
+    EXCLUSIVE_TYPES = frozenset(("drawio", "rtf"))
+
+    def __init__(self, sample_lines=ROUTER_SAMPLE_LINES):
+        """
+        Initialize the router.
+
+        Args:
+            sample_lines (int): Maximum number of lines examined per change
+        """
+        self.sample_lines = max(int(sample_lines), 1)
+        self.trie = PrefixTrie()
+        self.trie.insert("<mxfile", "drawio")
+        self.trie.insert("{\\rtf", "rtf")
+        for starter in MERMAID_STARTERS:
+            # is_mermaid_code matches case-insensitively
+            self.trie.insert(starter.lower().rstrip(), "mermaid")
+
+    def classify(self, content):
+        """
+        Classify content into the set of content types it may be.
+
+        Args:
+            content (str or ClipboardEvent): Clipboard content
+
+        Returns:
+            frozenset: Candidate content types (always includes "text")
+        """
+        event = ClipboardEvent.from_content(content)
+        if not event or not event.stripped:
+            return frozenset(("text",))
+
+        head = event.stripped[:64].lower()
+        prefix_types = set(self.trie.match(head))
+        # draw.io files may start with an XML declaration or comment before <mxfile>
+        if head.startswith(("<?xml", "<!--")) and "<mxfile" in event.stripped[:4096]:
+            prefix_types.add("drawio")
+
+        exclusive = prefix_types & self.EXCLUSIVE_TYPES
+        if exclusive:
+            return frozenset(exclusive | {"text"})
+
+        types = prefix_types | {"text"}
+        if self._may_be_markdown(event):
+            types.add("markdown")
+        if self._may_be_code(event):
+            types.add("code")
+        return frozenset(types)
+
+    def _sample(self, lines):
+        """
+        Pick evenly spaced lines when there are more than sample_lines.
+
+        Returns:
+            tuple: (sampled lines, whether sampling was applied)
+        """
+        if len(lines) <= self.sample_lines:
+            return lines, False
+        step = len(lines) / self.sample_lines
+        return [lines[int(i * step)] for i in range(self.sample_lines)], True
+
+    def _passes(self, matched, total, threshold, sampled):
+        """Check a line ratio against a detector threshold, with a margin for sampled estimates."""
+        if sampled:
+            threshold *= ROUTER_SAMPLED_THRESHOLD_FACTOR
+        return matched > 0 and matched / total >= threshold
+
+    def _may_be_markdown(self, event):
+        """Upper-bound check for markdown_module.is_markdown."""
+        lines, sampled = self._sample(event.non_empty_lines)
+        if not lines:
+            return False
+        matched = sum(1 for line in lines
+                      if line[0] in MARKDOWN_LINE_STARTS or "*" in line or "](" in line)
+        return self._passes(matched, len(lines), MARKDOWN_DETECTION_THRESHOLD, sampled)
+
+    def _may_be_code(self, event):
+        """Upper-bound check for code_formatter_module.is_code."""
+        if len(event.lines) < MIN_LINES_FOR_CODE_DETECTION:
+            return False
+        lines, sampled = self._sample(event.lines)
+        matched = 0
+        for line in lines:
+            stripped = line.lstrip()
+            parts = stripped.split(None, 1)
+            # A keyword followed by whitespace, as in the detector's '^\s*(keyword)\s+'
+            if parts and parts[0] in CODE_LINE_KEYWORDS and len(stripped) > len(parts[0]):
+                matched += 1
+        return self._passes(matched, len(lines), CODE_DETECTION_THRESHOLD, sampled)
+
+    def route(self, modules, content):
+        """
+        Select the modules that should see this content.
+
+        Args:
+            modules (list): Candidate modules, in execution order
+            content (str or ClipboardEvent): Clipboard content
+
+        Returns:
+            list: Modules whose declared content types match, in the same order
+        """
+        types = self.classify(content)
+        selected = []
+        for module in modules:
+            declared = get_module_content_types(module)
+            if declared is None or CONTENT_TYPE_ANY in declared or declared & types:
+                selected.append(module)
+        if len(selected) < len(modules):
+            selected_ids = {id(module) for module in selected}
+            skipped = [getattr(module, '__name__', 'unknown') for module in modules if id(module) not in selected_ids]
+            logger.debug(f"Content classified as {sorted(types)}; skipping {', '.join(skipped)}")
+        return selected
@@ -0,0 +1,187 @@
+"""
+ContentStore class - Process-wide record of recently processed clipboard content.
+Each module tracks its content in its own namespace of one shared store, so
+deduplication state lives in one place and can be inspected and cleared centrally.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+from constants import CONTENT_TRACKER_MAX_HISTORY
+
+logger = logging.getLogger("content_tracker")
+
+
+class ContentStore:
+    """
+    Namespaced LRU sets of content hashes.
+
+    Each namespace is an OrderedDict mapping content hash -> content size, so
+    adding, looking up and evicting an entry are all O(1). A namespace holds at
+    most its capacity; adding beyond that evicts the least recently added or
+    looked-up entry.
+    """
+
+    def __init__(self, capacity=CONTENT_TRACKER_MAX_HISTORY):
+        """
+        Initialize the store.
+
+        Args:
+            capacity (int): Default number of hashes kept per namespace
+        """
+        self.default_capacity = max(int(capacity), 1)
+        self.lock = threading.Lock()
+        self._entries = {}
+        self._capacities = {}
+        self._stats = {}
+
+    def _namespace(self, namespace):
+        # Caller holds the lock
+        entries = self._entries.get(namespace)
+        if entries is None:
+            entries = self._entries[namespace] = OrderedDict()
+            self._stats[namespace] = {"hits": 0, "misses": 0, "evictions": 0}
+        return entries
+
+    def set_capacity(self, namespace, capacity):
+        """
+        Set the capacity of one namespace, evicting entries if it shrinks.
+
+        Args:
+            namespace (str): Namespace name
+            capacity (int): Maximum number of hashes kept
+        """
+        with self.lock:
+            self._capacities[namespace] = max(int(capacity), 1)
+            self._evict(namespace, self._namespace(namespace))
+
+    def _evict(self, namespace, entries):
+        # Caller holds the lock
+        capacity = self._capacities.get(namespace, self.default_capacity)
+        while len(entries) > capacity:
+            entries.popitem(last=False)
+            self._stats[namespace]["evictions"] += 1
+
+    def add(self, namespace, content_hash, size=0):
+        """
+        Record a content hash as processed.
+
+        Args:
+            namespace (str): Namespace name
+            content_hash (str): Hash of the content
+            size (int): Content size, kept for diagnostics
+        """
+        with self.lock:
+            entries = self._namespace(namespace)
+            entries[content_hash] = size
+            entries.move_to_end(content_hash)
+            self._evict(namespace, entries)
+
+    def contains(self, namespace, content_hash):
+        """
+        Check whether a content hash was processed recently, refreshing it if so.
+
+        Args:
+            namespace (str): Namespace name
+            content_hash (str): Hash of the content
+
+        Returns:
+            bool: True if the hash is in the namespace
+        """
+        with self.lock:
+            entries = self._namespace(namespace)
+            stats = self._stats[namespace]
+            if content_hash in entries:
+                entries.move_to_end(content_hash)
+                stats["hits"] += 1
+                return True
+            stats["misses"] += 1
+            return False
+
+    def clear(self, namespace=None):
+        """
+        Forget tracked content.
+
+        Args:
+            namespace (str, optional): Namespace to clear. If None, clears all namespaces.
+        """
+        with self.lock:
+            targets = [namespace] if namespace is not None else list(self._entries)
+            for name in targets:
+                if name in self._entries:
+                    self._entries[name].clear()
+
+    def remove_namespace(self, namespace):
+        """
+        Drop a namespace and its statistics entirely.
+
+        Args:
+            namespace (str): Namespace name
+        """
+        with self.lock:
+            self._entries.pop(namespace, None)
+            self._capacities.pop(namespace, None)
+            self._stats.pop(namespace, None)
+
+    def size(self, namespace):
+        """
+        Get the number of hashes tracked in a namespace.
+
+        Args:
+            namespace (str): Namespace name
+
+        Returns:
+            int: Number of tracked hashes
+        """
+        with self.lock:
+            return len(self._entries.get(namespace, ()))
+
+    def get_stats(self):
+        """
+        Get per-namespace statistics.
+
+        Returns:
+            dict: Namespace -> entries, capacity, hits, misses, evictions and hit rate
+        """
+        with self.lock:
+            stats = {}
+            for name, entries in self._entries.items():
+                counters = self._stats[name]
+                lookups = counters["hits"] + counters["misses"]
+                stats[name] = dict(
+                    counters,
+                    entries=len(entries),
+                    capacity=self._capacities.get(name, self.default_capacity),
+                    hit_rate=counters["hits"] / lookups if lookups else 0.0,
+                )
+            return stats
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_content_store():
+    """
+    Get the process-wide content store, creating it on first use.
+
+    The default per-namespace capacity comes from performance.content_tracker_capacity.
+
+    Returns:
+        ContentStore: The shared store
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                capacity = CONTENT_TRACKER_MAX_HISTORY
+                try:
+                    from config_manager import ConfigManager
+                    capacity = ConfigManager().get_config_value(
+                        'performance', 'content_tracker_capacity', CONTENT_TRACKER_MAX_HISTORY
+                    )
+                except Exception as e:
+                    logger.debug(f"Using default content tracker capacity: {e}")
+                _store = ContentStore(capacity)
+    return _store
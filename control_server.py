@@ -0,0 +1,210 @@
+"""
+ControlServer class - Local Unix-domain-socket control API for the service.
+Lets the menu bar and CLI tools command and query the running service directly,
+instead of creating flag files or tailing the output log.
+
+Protocol: the client connects, sends one JSON object terminated by a newline,
+for example {"command": "status"} or {"command": "pause"}, and reads back one
+JSON line of the form {"ok": true, "result": {...}} or {"ok": false, "error": "..."}.
+"""
+
+import os
+import json
+import socket
+import logging
+import threading
+from pathlib import Path
+
+from utils import get_app_paths, ensure_directory_exists
+
+logger = logging.getLogger("control_server")
+
+# Largest request we accept from a client (commands are tiny JSON objects)
+MAX_REQUEST_SIZE = 65536
+DEFAULT_CLIENT_TIMEOUT = 0.5
+
+
+def get_control_socket_path():
+    """Return the path of the service control socket."""
+    return get_app_paths()["control_socket"]
+
+
+class ControlServer:
+    """
+    Serves control commands for the clipboard monitor service on a Unix-domain socket.
+    """
+
+    def __init__(self, socket_path=None):
+        """
+        Initialize the control server.
+
+        Args:
+            socket_path (str, optional): Socket path. If None, uses the app's control socket path.
+        """
+        self.socket_path = str(socket_path or get_control_socket_path())
+        self.handlers = {}
+        self._server_socket = None
+        self._thread = None
+        self._running = False
+
+    def register(self, command, handler):
+        """
+        Register a handler for a command.
+
+        Args:
+            command (str): Command name (e.g. 'pause')
+            handler (callable): Called with the request's 'args' dict; returns a JSON-serializable result
+        """
+        self.handlers[command] = handler
+
+    def start(self):
+        """
+        Bind the socket and start serving on a daemon thread.
+
+        Returns:
+            bool: True if the server is listening, False otherwise
+        """
+        if self._running:
+            return True
+        try:
+            ensure_directory_exists(str(Path(self.socket_path).parent))
+            self._remove_stale_socket()
+            server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server_socket.bind(self.socket_path)
+            os.chmod(self.socket_path, 0o600)
+            server_socket.listen(8)
+        except OSError as e:
+            logger.error(f"Could not start control server on {self.socket_path}: {e}")
+            return False
+
+        self._server_socket = server_socket
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="ControlServer", daemon=True)
+        self._thread.start()
+        logger.info(f"Control server listening on {self.socket_path}")
+        return True
+
+    def stop(self):
+        """Stop serving and remove the socket file."""
+        self._running = False
+        if self._server_socket:
+            try:
+                self._server_socket.close()
+            except OSError:
+                pass
+            self._server_socket = None
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+    def is_running(self):
+        """Return True if the server is currently serving requests."""
+        return self._running
+
+    def _remove_stale_socket(self):
+        """Remove a socket file left behind by a previous run, unless another service is listening on it."""
+        if not os.path.exists(self.socket_path):
+            return
+        if send_control_command("ping", socket_path=self.socket_path, timeout=0.2) is not None:
+            raise OSError("another service instance is already listening")
+        os.unlink(self.socket_path)
+
+    def _serve(self):
+        """Accept loop; each request is handled inline since commands are cheap."""
+        while self._running:
+            try:
+                conn, _ = self._server_socket.accept()
+            except OSError:
+                break
+            with conn:
+                try:
+                    conn.settimeout(1.0)
+                    request = self._read_request(conn)
+                    response = self.dispatch(request)
+                except (OSError, ValueError) as e:
+                    response = {"ok": False, "error": str(e)}
+                try:
+                    conn.sendall((json.dumps(response, default=str) + "\n").encode("utf-8"))
+                except OSError:
+                    pass
+
+    def _read_request(self, conn):
+        """Read a single newline-terminated JSON request from a connection."""
+        data = b""
+        while b"\n" not in data:
+            chunk = conn.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+            if len(data) > MAX_REQUEST_SIZE:
+                raise ValueError("request too large")
+        request = json.loads(data.decode("utf-8") or "{}")
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        return request
+
+    def dispatch(self, request):
+        """
+        Run the handler for a request.
+
+        Args:
+            request (dict): Parsed request with 'command' and optional 'args'
+
+        Returns:
+            dict: Response envelope
+        """
+        command = request.get("command")
+        handler = self.handlers.get(command)
+        if handler is None:
+            return {"ok": False, "error": f"unknown command: {command}"}
+        try:
+            return {"ok": True, "result": handler(request.get("args") or {})}
+        except Exception as e:
+            logger.error(f"Error handling control command '{command}': {e}")
+            return {"ok": False, "error": str(e)}
+
+
+def send_control_command(command, socket_path=None, timeout=DEFAULT_CLIENT_TIMEOUT, **args):
+    """
+    Send a command to the running service.
+
+    Args:
+        command (str): Command name (e.g. 'status', 'pause', 'resume')
+        socket_path (str, optional): Socket path. If None, uses the app's control socket path.
+        timeout (float): Connect/read timeout in seconds
+        **args: Command arguments
+
+    Returns:
+        dict or None: The response envelope, or None if the service is not reachable
+    """
+    path = str(socket_path or get_control_socket_path())
+    if not os.path.exists(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(path)
+            client.sendall((json.dumps({"command": command, "args": args}) + "\n").encode("utf-8"))
+            data = b""
+            while b"\n" not in data:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        return json.loads(data.decode("utf-8")) if data else None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Control command '{command}' failed: {e}")
+        return None
+
+
+if __name__ == '__main__':
+    # Minimal CLI: python control_server.py [command]
+    import sys
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    response = send_control_command(command)
+    if response is None:
+        print("Clipboard Monitor service is not reachable.")
+        sys.exit(1)
+    print(json.dumps(response, indent=2))
+    sys.exit(0 if response.get("ok") else 1)
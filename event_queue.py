@@ -0,0 +1,155 @@
+"""
+Clipboard event queue - Decouples clipboard change detection from module
+processing, so that the NSTimer callback only reads the clipboard and a fast
+sequence of copies is never lost while modules are still busy.
+
+Events that pile up while the worker is processing are coalesced: every event
+is still recorded (history), but only the latest one is run through the
+transforming modules.
+
+When the worker is not running (tools, tests), events are processed inline.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+
+from constants import EVENT_QUEUE_SIZE
+
+logger = logging.getLogger("event_queue")
+
+
+class ClipboardEventQueue:
+    """
+    A bounded queue of clipboard changes served by one background thread.
+
+    The worker takes every pending event at once. All but the latest are passed to
+    `record` (observer-only processing such as history), and the latest is passed to
+    `process` (the full module pipeline). If the queue is full, the oldest pending
+    event is dropped to make room.
+    """
+
+    def __init__(self, process, record=None, max_size=EVENT_QUEUE_SIZE, coalesce=True):
+        """
+        Initialize the queue.
+
+        Args:
+            process (callable): Runs the full module pipeline for one content
+            record (callable, optional): Runs observer-only modules for a superseded
+                content; None processes every event in full
+            max_size (int): Maximum number of pending events
+            coalesce (bool): Whether superseded events are only recorded
+        """
+        self.process = process
+        self.record = record
+        self.max_size = max(1, max_size)
+        self.coalesce = coalesce and record is not None
+        self.condition = threading.Condition()
+        self.thread = None
+        self._pending = deque()
+        self._stopping = False
+        self.stats = {"submitted": 0, "processed": 0, "coalesced": 0, "dropped": 0, "failed": 0, "max_depth": 0}
+        self._last_wait = 0.0
+
+    def is_running(self):
+        """Check whether the background worker is serving the queue."""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """Start the background worker."""
+        if self.is_running():
+            return
+        self._stopping = False
+        self.thread = threading.Thread(target=self._serve, name="clipboard-events", daemon=True)
+        self.thread.start()
+        logger.debug("Clipboard event queue started")
+
+    def stop(self, timeout=5.0):
+        """
+        Stop the worker after it has handled the events already queued.
+
+        Args:
+            timeout (float): Seconds to wait for the queue to drain
+        """
+        if not self.is_running():
+            return
+        with self.condition:
+            self._stopping = True
+            self.condition.notify()
+        self.thread.join(timeout=timeout)
+        if self.thread.is_alive():
+            logger.warning("Clipboard event queue did not drain before shutdown")
+        self.thread = None
+
+    def submit(self, content):
+        """
+        Queue a clipboard change, or process it inline if the worker is not running.
+
+        Args:
+            content (str): The new clipboard content
+
+        Returns:
+            bool: True (the event is never rejected; the oldest pending one may be dropped)
+        """
+        if not self.is_running():
+            self._run(self.process, content)
+            return True
+
+        with self.condition:
+            self.stats["submitted"] += 1
+            if len(self._pending) >= self.max_size:
+                self._pending.popleft()
+                self.stats["dropped"] += 1
+                logger.warning(f"Clipboard event queue full ({self.max_size}); dropped the oldest change")
+            self._pending.append((content, time.monotonic()))
+            self.stats["max_depth"] = max(self.stats["max_depth"], len(self._pending))
+            self.condition.notify()
+        return True
+
+    def _run(self, func, content):
+        """Run one event handler, logging instead of raising on failure."""
+        try:
+            func(content)
+            with self.condition:
+                self.stats["processed"] += 1
+        except Exception as e:
+            with self.condition:
+                self.stats["failed"] += 1
+            logger.error(f"Error processing clipboard event: {e}")
+
+    def _serve(self):
+        """Worker loop."""
+        while True:
+            with self.condition:
+                while not self._pending and not self._stopping:
+                    self.condition.wait()
+                if not self._pending:
+                    break
+                batch = list(self._pending)
+                self._pending.clear()
+                self._last_wait = time.monotonic() - batch[0][1]
+
+            superseded, latest = batch[:-1], batch[-1][0]
+            for content, _ in superseded:
+                if self.coalesce:
+                    with self.condition:
+                        self.stats["coalesced"] += 1
+                    self._run(self.record, content)
+                else:
+                    self._run(self.process, content)
+            if superseded and self.coalesce:
+                logger.info(f"Coalesced {len(superseded)} clipboard change(s); transforming only the latest")
+            self._run(self.process, latest)
+
+    def get_stats(self):
+        """
+        Get queue statistics.
+
+        Returns:
+            dict: Current and maximum depth, submitted/processed/coalesced/dropped/failed
+                counts, and how long the oldest event of the last batch waited
+        """
+        with self.condition:
+            return dict(self.stats, depth=len(self._pending), last_wait_ms=self._last_wait * 1000,
+                        running=self.is_running())
@@ -1,20 +1,344 @@
 """
 Centralized Lock Manager
 Provides thread-safe locks for clipboard processing operations.
+
+Locks are per resource, so unrelated work never waits on a shared lock:
+
+- module_execution_lock: serializes clipboard changes through the module pipeline
+  (and module loading/reloading). Modules never take it themselves.
+- resource locks (get_resource_lock(name)): one per module-private resource, such as
+  a module's content tracker. Modules running in parallel use different locks.
+- history lock (get_history_lock()): a reader/writer lock for the history file.
+  Any number of readers (viewers, the control socket) share it; writers
+  (add_to_history, clear_history) are exclusive.
+- config_access_lock: short critical sections around configuration access.
+
+Lock ordering: when more than one is needed, acquire them in the order listed
+above (module execution, then a resource lock, then the history lock, then the
+config lock), and never more than one resource lock at a time. Code that holds a
+later lock must not try to acquire an earlier one. None of these locks is reentrant.
+
+With profiling enabled (enable_profiling(), or 'lock_profiling' in the performance
+config), the getters return instrumented wrappers around the same locks. They record
+how long each acquisition waited, how long the lock was held, how many acquisitions
+found it taken, and which call sites waited longest (see get_lock_stats()).
 """
 
+import os
+import sys
+import time
 import threading
 import logging
+from contextlib import contextmanager
+
+from constants import LOCK_PROFILE_TOP_WAITERS
 
 logger = logging.getLogger("lock_manager")
 
 
+def _call_site():
+    """Describe the nearest caller outside this module and contextlib as "file:line (function)"."""
+    frame = sys._getframe(1)
+    skipped = (__file__, contextmanager.__code__.co_filename)
+    while frame is not None and frame.f_code.co_filename in skipped:
+        frame = frame.f_back
+    if frame is None:
+        return "unknown"
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{frame.f_lineno} ({code.co_name})"
+
+
+class LockStats:
+    """Wait time, hold time and contention counters for one lock."""
+
+    def __init__(self, name, top_waiters=LOCK_PROFILE_TOP_WAITERS):
+        """
+        Initialize the counters.
+
+        Args:
+            name (str): Lock name used in reports
+            top_waiters (int): Number of waiting call sites reported
+        """
+        self.name = name
+        self.top_waiters = top_waiters
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all counters."""
+        with self._lock:
+            self.acquisitions = 0
+            self.contended = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.holds = 0
+            self.hold_total = 0.0
+            self.hold_max = 0.0
+            self._waiters = {}
+
+    def record_acquire(self, wait, site=None):
+        """
+        Record an acquisition.
+
+        Args:
+            wait (float): Seconds spent waiting for the lock
+            site (str, optional): Waiting call site; given only when the lock was taken
+        """
+        with self._lock:
+            self.acquisitions += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            if site is not None:
+                self.contended += 1
+                entry = self._waiters.setdefault(site, [0, 0.0])
+                entry[0] += 1
+                entry[1] += wait
+
+    def record_hold(self, hold):
+        """
+        Record how long the lock was held.
+
+        Args:
+            hold (float): Seconds between acquisition and release
+        """
+        with self._lock:
+            self.holds += 1
+            self.hold_total += hold
+            self.hold_max = max(self.hold_max, hold)
+
+    def snapshot(self):
+        """
+        Get the counters.
+
+        Returns:
+            dict: Acquisition and contention counts, wait and hold times in
+                milliseconds, and the call sites that waited longest in total
+        """
+        with self._lock:
+            waiters = sorted(self._waiters.items(), key=lambda item: item[1][1], reverse=True)
+            return {
+                "acquisitions": self.acquisitions,
+                "contended": self.contended,
+                "contention_rate": self.contended / self.acquisitions if self.acquisitions else 0.0,
+                "wait_total_ms": self.wait_total * 1000,
+                "wait_max_ms": self.wait_max * 1000,
+                "hold_avg_ms": self.hold_total / self.holds * 1000 if self.holds else 0.0,
+                "hold_max_ms": self.hold_max * 1000,
+                "top_waiters": [
+                    {"site": site, "count": count, "wait_total_ms": wait * 1000}
+                    for site, (count, wait) in waiters[:self.top_waiters]
+                ],
+            }
+
+
+class InstrumentedLock:
+    """A threading.Lock wrapper that records its acquisitions in a LockStats."""
+
+    def __init__(self, lock, stats):
+        """
+        Initialize the wrapper.
+
+        Args:
+            lock (threading.Lock): The lock being wrapped (shared with unwrapped users)
+            stats (LockStats): Where acquisitions are recorded
+        """
+        self._lock = lock
+        self.stats = stats
+        self._acquired_at = None
+
+    def acquire(self, blocking=True, timeout=-1):
+        """Acquire the lock, with the same arguments and result as threading.Lock.acquire()."""
+        if self._lock.acquire(False):
+            self.stats.record_acquire(0.0)
+        elif not blocking:
+            return False
+        else:
+            start = time.perf_counter()
+            if not self._lock.acquire(True, timeout):
+                return False
+            self.stats.record_acquire(time.perf_counter() - start, _call_site())
+        self._acquired_at = time.perf_counter()
+        return True
+
+    def release(self):
+        """Release the lock."""
+        acquired_at, self._acquired_at = self._acquired_at, None
+        self._lock.release()
+        # Acquired through the plain lock (before profiling was enabled): no hold time
+        if acquired_at is not None:
+            self.stats.record_hold(time.perf_counter() - acquired_at)
+
+    def locked(self):
+        """Check whether the lock is held."""
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class ReadWriteLock:
+    """
+    A writer-preferring reader/writer lock.
+
+    Readers share the lock. A writer waits for current readers to finish and holds
+    the lock alone; while a writer is waiting, new readers wait too, so a steady
+    stream of readers cannot starve writers. Not reentrant.
+    """
+
+    def __init__(self):
+        """Initialize the lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self):
+        """
+        Acquire the lock for reading.
+
+        Returns:
+            bool: True if the caller had to wait
+        """
+        waited = False
+        with self._condition:
+            while self._writer or self._writers_waiting:
+                waited = True
+                self._condition.wait()
+            self._readers += 1
+        return waited
+
+    def release_read(self):
+        """Release a read acquisition."""
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        """
+        Acquire the lock for writing.
+
+        Returns:
+            bool: True if the caller had to wait
+        """
+        waited = False
+        with self._condition:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    waited = True
+                    self._condition.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        return waited
+
+    def release_write(self):
+        """Release a write acquisition."""
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_lock(self):
+        """Context manager holding the lock for reading."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self):
+        """Context manager holding the lock for writing."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class InstrumentedReadWriteLock:
+    """A ReadWriteLock wrapper that records read and write acquisitions separately."""
+
+    def __init__(self, lock, read_stats, write_stats):
+        """
+        Initialize the wrapper.
+
+        Args:
+            lock (ReadWriteLock): The lock being wrapped (shared with unwrapped users)
+            read_stats (LockStats): Where read acquisitions are recorded
+            write_stats (LockStats): Where write acquisitions are recorded
+        """
+        self._lock = lock
+        self.read_stats = read_stats
+        self.write_stats = write_stats
+        # Readers hold the lock concurrently, so read start times are kept per thread
+        self._local = threading.local()
+        self._write_acquired_at = None
+
+    def acquire_read(self):
+        """Acquire the lock for reading."""
+        start = time.perf_counter()
+        waited = self._lock.acquire_read()
+        now = time.perf_counter()
+        self.read_stats.record_acquire(now - start, _call_site() if waited else None)
+        self._local.__dict__.setdefault("read_starts", []).append(now)
+        return waited
+
+    def release_read(self):
+        """Release a read acquisition."""
+        starts = self._local.__dict__.get("read_starts")
+        acquired_at = starts.pop() if starts else None
+        self._lock.release_read()
+        if acquired_at is not None:
+            self.read_stats.record_hold(time.perf_counter() - acquired_at)
+
+    def acquire_write(self):
+        """Acquire the lock for writing."""
+        start = time.perf_counter()
+        waited = self._lock.acquire_write()
+        now = time.perf_counter()
+        self.write_stats.record_acquire(now - start, _call_site() if waited else None)
+        self._write_acquired_at = now
+        return waited
+
+    def release_write(self):
+        """Release a write acquisition."""
+        acquired_at, self._write_acquired_at = self._write_acquired_at, None
+        self._lock.release_write()
+        if acquired_at is not None:
+            self.write_stats.record_hold(time.perf_counter() - acquired_at)
+
+    @contextmanager
+    def read_lock(self):
+        """Context manager holding the lock for reading."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self):
+        """Context manager holding the lock for writing."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
 class LockManager:
     """Centralized manager for thread locks to prevent race conditions."""
-    
+
     _instance = None
     _lock = threading.Lock()
-    
+
     def __new__(cls):
         """Singleton pattern to ensure only one lock manager exists."""
         if cls._instance is None:
@@ -22,29 +346,120 @@ class LockManager:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
         return cls._instance
-    
+
     def __init__(self):
         """Initialize the lock manager with shared locks."""
         if not hasattr(self, 'initialized'):
             self.clipboard_processing_lock = threading.Lock()
             self.config_access_lock = threading.Lock()
             self.history_access_lock = threading.Lock()
+            self.history_lock = ReadWriteLock()
             self.module_execution_lock = threading.Lock()
+            self.resource_locks = {}
+            self.profiling = False
+            self.lock_stats = {}
+            self._instrumented = {}
             self.initialized = True
             logger.debug("LockManager initialized with shared locks")
-    
+
     def get_clipboard_processing_lock(self):
-        """Get the shared clipboard processing lock."""
-        return self.clipboard_processing_lock
-    
+        """
+        Get the legacy clipboard processing lock.
+
+        Bundled modules no longer share it (see get_resource_lock); it remains for
+        third-party modules that still serialize on it.
+        """
+        return self._instrument("clipboard_processing", self.clipboard_processing_lock)
+
     def get_config_access_lock(self):
         """Get the shared configuration access lock."""
-        return self.config_access_lock
-    
+        return self._instrument("config_access", self.config_access_lock)
+
     def get_history_access_lock(self):
-        """Get the shared history access lock."""
-        return self.history_access_lock
-    
+        """Get the legacy history access lock (history itself uses get_history_lock())."""
+        return self._instrument("history_access", self.history_access_lock)
+
+    def get_history_lock(self):
+        """Get the reader/writer lock guarding the history file."""
+        return self._instrument("history", self.history_lock)
+
     def get_module_execution_lock(self):
         """Get the shared module execution lock."""
-        return self.module_execution_lock
+        return self._instrument("module_execution", self.module_execution_lock)
+
+    def get_resource_lock(self, name):
+        """
+        Get the lock for a named resource, creating it on first use.
+
+        Args:
+            name (str): Resource name, normally the owning module's name
+
+        Returns:
+            threading.Lock: The same lock for every caller using this name
+        """
+        with self._lock:
+            lock = self.resource_locks.get(name)
+            if lock is None:
+                lock = self.resource_locks[name] = threading.Lock()
+        return self._instrument(f"resource:{name}", lock)
+
+    def _instrument(self, name, lock):
+        """
+        Wrap a lock for profiling when profiling is enabled.
+
+        Args:
+            name (str): Lock name used in reports
+            lock: threading.Lock or ReadWriteLock
+
+        Returns:
+            The lock itself, or its (cached) instrumented wrapper
+        """
+        if not self.profiling:
+            return lock
+        wrapper = self._instrumented.get(name)
+        if wrapper is None:
+            with self._lock:
+                wrapper = self._instrumented.get(name)
+                if wrapper is None:
+                    if isinstance(lock, ReadWriteLock):
+                        read_stats = self.lock_stats[f"{name}.read"] = LockStats(f"{name}.read")
+                        write_stats = self.lock_stats[f"{name}.write"] = LockStats(f"{name}.write")
+                        wrapper = InstrumentedReadWriteLock(lock, read_stats, write_stats)
+                    else:
+                        wrapper = InstrumentedLock(lock, self.lock_stats.setdefault(name, LockStats(name)))
+                    self._instrumented[name] = wrapper
+        return wrapper
+
+    def enable_profiling(self, enabled=True):
+        """
+        Turn lock profiling on or off.
+
+        Only locks fetched from the getters after this call are affected; callers that
+        keep a lock object should fetch it again on each use.
+
+        Args:
+            enabled (bool): Whether getters return instrumented wrappers
+        """
+        self.profiling = bool(enabled)
+        logger.info(f"Lock profiling {'enabled' if self.profiling else 'disabled'}")
+
+    def get_lock_stats(self):
+        """
+        Get the profiling counters of every lock acquired since profiling was enabled.
+
+        Returns:
+            dict: Whether profiling is on, and lock name -> counters (LockStats.snapshot()),
+                most waited-on first
+        """
+        with self._lock:
+            stats = list(self.lock_stats.values())
+        snapshots = sorted(((s.name, s.snapshot()) for s in stats),
+                           key=lambda item: item[1]["wait_total_ms"], reverse=True)
+        return {"profiling": self.profiling, "locks": dict(snapshots)}
+
+    def reset_lock_stats(self):
+        """Clear the profiling counters of every lock."""
+        with self._lock:
+            stats = list(self.lock_stats.values())
+        for lock_stats in stats:
+            lock_stats.reset()
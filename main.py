@@ -11,15 +11,25 @@ except ImportError:
     pyperclip = None
 import threading
 import logging
+import multiprocessing
 from pathlib import Path
 from utils import show_notification, safe_expanduser, get_clipboard_content, log_event, log_error
 from clipboard_reader import ClipboardReader
 from module_manager import ModuleManager
+from control_server import ControlServer
+from adaptive_scheduler import AdaptiveScheduler
+from content_tracker import get_content_store
+from side_effects import get_side_effect_executor
+from clipboard_writer import get_self_write_registry
+from event_queue import ClipboardEventQueue
+from lock_manager import LockManager
+from result_cache import get_result_cache
 from config_manager import ConfigManager
 from constants import (
     TIMER_INTERVAL_ACTIVE, TIMER_INTERVAL_IDLE, PAUSE_CHECK_INTERVAL,
     ERROR_RETRY_DELAY, PYPERCLIP_ERROR_DELAY, MAX_CONSECUTIVE_ERRORS,
-    SYSTEM_IDLE_THRESHOLD, DEFAULT_MODULE_VALIDATION_TIMEOUT
+    SYSTEM_IDLE_THRESHOLD, DEFAULT_MODULE_VALIDATION_TIMEOUT, DEFAULT_LARGE_CONTENT_WINDOW, EVENT_QUEUE_SIZE,
+    MODULE_MEMORY_SAMPLE_INTERVAL
 )
 import json
 import subprocess
@@ -121,6 +131,14 @@ except Exception:
 
 
 
+def read_clipboard():
+    """Read the clipboard with a bounded read so oversized content is never fully materialized."""
+    return get_clipboard_content(
+        max_bytes=config_manager.get_max_clipboard_size(),
+        window_bytes=config_manager.get_config_value('performance', 'large_content_window', DEFAULT_LARGE_CONTENT_WINDOW)
+    )
+
+
 class ClipboardMonitor:
     """
     Orchestrates clipboard monitoring using separate reader and module manager components.
@@ -129,14 +147,247 @@ class ClipboardMonitor:
         """Initialize the clipboard monitor with its components."""
         self.clipboard_reader = ClipboardReader()
         self.module_manager = ModuleManager()
+        self.control_server = None
+        self.paused = False
+        self.mode = "starting"
+        self.started_at = time.time()
+        self.events_processed = 0
+        self.last_change_time = None
+        self.scheduler = None
+        self.event_queue = None
+        self.last_module_output = None
 
     def load_modules(self, modules_dir):
         """Load modules using the module manager."""
         self.module_manager.load_modules(modules_dir)
 
+    def start_warmup(self):
+        """
+        Load and validate modules on a background thread, so the first clipboard
+        change after a restart does not pay for importing them.
+
+        Returns:
+            threading.Thread or None: The warm-up thread, or None if warm-up is disabled
+        """
+        if not config_manager.get_config_value('performance', 'module_warmup', True):
+            return None
+
+        def warm_up():
+            try:
+                elapsed = self.module_manager.warm_up()
+                logger.info(f"Service ready {(time.time() - self.started_at) * 1000:.0f}ms after start "
+                            f"(module warm-up {elapsed * 1000:.0f}ms)")
+            except Exception as e:
+                logger.error(f"Module warm-up failed; modules will load on first use: {e}")
+
+        thread = threading.Thread(target=warm_up, name="module-warmup", daemon=True)
+        thread.start()
+        return thread
+
     def process_clipboard(self, clipboard_content) -> bool:
         """Process clipboard content using the module manager."""
-        return self.module_manager.process_content(clipboard_content)
+        self.events_processed += 1
+        self.last_change_time = time.time()
+        return self.module_manager.process_content(clipboard_content, max_size=config_manager.get_max_clipboard_size())
+
+    def record_clipboard(self, clipboard_content):
+        """Run only observer modules (e.g. history) for content already superseded by a newer copy."""
+        self.events_processed += 1
+        return self.module_manager.process_content(clipboard_content, max_size=config_manager.get_max_clipboard_size(),
+                                                   observers_only=True)
+
+    def _process_queued(self, clipboard_content):
+        new_content = self.process_clipboard(clipboard_content)
+        if new_content:
+            # Remember what the modules wrote so the watcher does not process it as a new copy
+            self.last_module_output = new_content
+        return new_content
+
+    def start_event_queue(self):
+        """
+        Start the worker that processes clipboard changes queued by the watcher.
+
+        Returns:
+            ClipboardEventQueue or None: The queue, or None if it is disabled
+        """
+        if not config_manager.get_config_value('performance', 'event_queue', True):
+            return None
+        self.event_queue = ClipboardEventQueue(
+            self._process_queued, record=self.record_clipboard,
+            max_size=config_manager.get_config_value('performance', 'event_queue_size', EVENT_QUEUE_SIZE),
+        )
+        self.event_queue.start()
+        return self.event_queue
+
+    def stop_event_queue(self):
+        """Stop the event queue worker after it has handled pending changes."""
+        if self.event_queue:
+            self.event_queue.stop()
+            self.event_queue = None
+
+    def enqueue_clipboard(self, clipboard_content):
+        """
+        Hand a clipboard change to the processing worker without waiting for modules.
+        Content the modules themselves just wrote is skipped. Without a running event
+        queue the change is processed inline.
+
+        Args:
+            clipboard_content (str): The new clipboard content
+
+        Returns:
+            bool: True if the change was queued or processed, False if it was skipped
+        """
+        written, self.last_module_output = self.last_module_output, None
+        if (written is not None and clipboard_content == written) \
+                or get_self_write_registry().is_own_content(clipboard_content):
+            logger.debug("Clipboard content was written by a module. Skipping.")
+            return False
+        if self.event_queue:
+            return self.event_queue.submit(clipboard_content)
+        self._process_queued(clipboard_content)
+        return True
+
+    def configure_scheduler(self):
+        """Create an adaptive scheduler if the 'auto' scheduling mode is configured."""
+        if config_manager.get_scheduling_mode() == "auto":
+            min_interval, max_interval = config_manager.get_adaptive_interval_bounds()
+            self.scheduler = AdaptiveScheduler(min_interval, max_interval)
+            logger.info(f"Adaptive scheduling enabled (interval {min_interval}s - {max_interval}s)")
+        else:
+            self.scheduler = None
+
+    def get_next_interval(self, changed, tick_cost, fixed_interval):
+        """
+        Get the delay before the next clipboard check.
+
+        Args:
+            changed (bool): Whether the clipboard changed on this check
+            tick_cost (float): Seconds spent on the check
+            fixed_interval (float): Interval to use when adaptive scheduling is off
+
+        Returns:
+            float: Seconds until the next check
+        """
+        if self.scheduler:
+            return self.scheduler.record_tick(changed, tick_cost)
+        return fixed_interval
+
+    def is_paused(self):
+        """
+        Check whether monitoring is paused.
+        Paused over the control socket (in memory) or by the pause_flag file, which
+        the menu bar falls back to and which a socket pause also writes. A resume over
+        the socket clears both.
+        """
+        return self.paused or Path(paths["pause_flag"]).exists()
+
+    def start_control_server(self):
+        """Start the Unix-domain-socket control API used by the menu bar and CLI tools."""
+        self.control_server = ControlServer()
+        self.control_server.register("ping", lambda args: {"pong": True})
+        self.control_server.register("status", self._cmd_status)
+        self.control_server.register("stats", self._cmd_stats)
+        self.control_server.register("pause", self._cmd_pause)
+        self.control_server.register("resume", self._cmd_resume)
+        self.control_server.register("reload-config", self._cmd_reload_config)
+        self.control_server.register("flush-history", self._cmd_flush_history)
+        self.control_server.register("reload-modules", self._cmd_reload_modules)
+        self.control_server.register("modules", self._cmd_modules)
+        self.control_server.register("lock-stats", self._cmd_lock_stats)
+        if not self.control_server.start():
+            self.control_server = None
+
+    def stop_control_server(self):
+        """Stop the control API, if running."""
+        if self.control_server:
+            self.control_server.stop()
+            self.control_server = None
+
+    def _cmd_status(self, args):
+        return {
+            "running": True,
+            "mode": self.mode,
+            "paused": self.is_paused(),
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started_at,
+            "enabled_modules": self.module_manager.get_enabled_modules(),
+            "modules_ready": self.module_manager.is_ready(),
+            "open_circuits": self.module_manager.get_open_circuits(),
+        }
+
+    def _cmd_stats(self, args):
+        result_cache = get_result_cache()
+        return {
+            "events_processed": self.events_processed,
+            "last_change_time": self.last_change_time,
+            "loaded_modules": self.module_manager.get_loaded_modules_count(),
+            "uptime": time.time() - self.started_at,
+            "scheduler": self.scheduler.get_stats() if self.scheduler else {"mode": "fixed"},
+            "content_tracker": get_content_store().get_stats(),
+            "module_timeouts": self.module_manager.get_timeout_stats(),
+            "process_pool": self.module_manager.get_process_pool_stats(),
+            "side_effects": get_side_effect_executor().get_stats(),
+            "result_cache": result_cache.get_stats() if result_cache else None,
+            "event_queue": self.event_queue.get_stats() if self.event_queue else None,
+            "self_writes": get_self_write_registry().get_stats(),
+        }
+
+    def _cmd_pause(self, args):
+        self.paused = True
+        # Persist the pause like the legacy flag path, so a launchd restart stays paused
+        try:
+            with open(paths["pause_flag"], 'w') as f:
+                f.write("paused")
+        except OSError as e:
+            logger.warning(f"Could not write pause flag; pause will not survive a restart: {e}")
+        logger.info("Monitoring paused via control socket.")
+        return {"paused": True}
+
+    def _cmd_resume(self, args):
+        self.paused = False
+        # Clear any legacy flag so a later fallback to flag checks does not re-pause
+        try:
+            os.remove(paths["pause_flag"])
+        except OSError:
+            pass
+        logger.info("Monitoring resumed via control socket.")
+        return {"paused": False}
+
+    def _cmd_reload_config(self, args):
+        config_manager.reload()
+        return {"reloaded": True, "version": config_manager.snapshot().version}
+
+    def _cmd_modules(self, args):
+        return {
+            "loaded": [getattr(module, '__name__', 'unknown') for module in self.module_manager.modules],
+            "enabled": self.module_manager.get_enabled_modules(),
+            "ready": self.module_manager.is_ready(),
+            "metrics": self.module_manager.get_module_stats(),
+            "detection_order": self.module_manager.get_module_order_report(),
+            "circuits": self.module_manager.get_timeout_stats(),
+            "memory": self.module_manager.get_memory_stats(),
+        }
+
+    def _cmd_lock_stats(self, args):
+        # Optional args: "enable" (bool) turns profiling on or off, "reset" clears the counters
+        lock_manager = LockManager()
+        if "enable" in args:
+            lock_manager.enable_profiling(bool(args["enable"]))
+        stats = lock_manager.get_lock_stats()
+        if args.get("reset"):
+            lock_manager.reset_lock_stats()
+        return stats
+
+    def _cmd_reload_modules(self, args):
+        return {"reloaded": self.module_manager.check_module_changes()}
+
+    def _cmd_flush_history(self, args):
+        # Prefer the service's own loaded history module so its in-memory tracker is reset too
+        history_module = self.module_manager.get_module("history_module")
+        clear_history = getattr(history_module, "clear_history", None)
+        if clear_history is None:
+            from modules.history_module import clear_history
+        return {"cleared": bool(clear_history())}
 
 # Check if enhanced monitoring is enabled (pyobjc was successfully imported).
 if MACOS_ENHANCED:
@@ -159,7 +410,6 @@ if MACOS_ENHANCED:
             self.pasteboard = NSPasteboard.generalPasteboard()
             self.last_change_count = self.pasteboard.changeCount()
             self.last_processed_clipboard_content = initial_clipboard_content
-            self.processing_in_progress = False  # Flag to prevent recursive processing
             self.timer = None
             logger.debug(f"ClipboardMonitorHandler initialized. Initial changeCount: {self.last_change_count}")
             return self
@@ -170,34 +420,50 @@ if MACOS_ENHANCED:
             Timer callback method that checks for clipboard changes using changeCount.
             This is more efficient than polling the actual clipboard content.
             """
-            # Check for pause flag first
-            pause_flag_path = Path(safe_expanduser("~/Library/Application Support/ClipboardMonitor/pause_flag"))
-            if pause_flag_path.exists():
+            # Check for pause first
+            if self.monitor_instance and self.monitor_instance.is_paused():
                 # Log this only in debug mode to avoid spamming logs.
-                logger.debug("Service is paused via pause_flag. Skipping clipboard check.")
+                logger.debug("Service is paused. Skipping clipboard check.")
                 return
 
-            # Skip checks when system is idle
-            if self.processing_in_progress:
-                return
-            
-            # Adaptive checking interval based on system activity
-            idle_time = self._get_system_idle_time()
-            if idle_time > SYSTEM_IDLE_THRESHOLD:  # seconds
-                # Reduce check frequency during idle periods
-                self.timer.setFireDate_(NSDate.dateWithTimeIntervalSinceNow_(TIMER_INTERVAL_IDLE))
+            if self.monitor_instance and self.monitor_instance.scheduler:
+                # Adaptive scheduling: the interval follows observed clipboard activity
+                tick_start = time.perf_counter()
+                changed = self.pasteboard.changeCount() != self.last_change_count
+                next_interval = self.monitor_instance.get_next_interval(changed, time.perf_counter() - tick_start, None)
+                self.timer.setFireDate_(NSDate.dateWithTimeIntervalSinceNow_(next_interval))
             else:
-                # Normal frequency during active use
-                self.timer.setFireDate_(NSDate.dateWithTimeIntervalSinceNow_(config_manager.get_enhanced_check_interval()))
-            
-            # Prevent recursive processing if a module modifies the clipboard
-            if self.processing_in_progress:
-                return
+                # Adaptive checking interval based on system activity
+                idle_time = self._get_system_idle_time()
+                if idle_time > SYSTEM_IDLE_THRESHOLD:  # seconds
+                    # Reduce check frequency during idle periods
+                    self.timer.setFireDate_(NSDate.dateWithTimeIntervalSinceNow_(TIMER_INTERVAL_IDLE))
+                else:
+                    # Normal frequency during active use
+                    self.timer.setFireDate_(NSDate.dateWithTimeIntervalSinceNow_(config_manager.get_enhanced_check_interval()))
+
+            self._handle_change_if_any()
+
+        @objc.python_method
+        def _skip_own_change(self, change_count):
+            """Check whether a changeCount was produced by a module's own confirmed write."""
+            if not get_self_write_registry().is_own_change(change_count):
+                return False
+            logger.debug(f"Clipboard change {change_count} was written by a module. Skipping.")
+            # Content equal to what was processed before our write is a new copy again
+            self.last_processed_clipboard_content = None
+            return True
 
+        def _handle_change_if_any(self):
+            """Read and process the clipboard if its changeCount moved since the last check."""
             current_change_count = self.pasteboard.changeCount()
             if current_change_count != self.last_change_count:
                 self.last_change_count = current_change_count
 
+                # A module's confirmed write (recorded by clipboard_writer) needs no read at all
+                if self._skip_own_change(current_change_count):
+                    return
+
                 try:
                     # Try to get clipboard content, preferring text but also checking for RTF
                     current_clipboard_content = self._get_clipboard_content()
@@ -208,34 +474,28 @@ if MACOS_ENHANCED:
                     logger.error(f"Error reading clipboard in timer handler: {e}")
                     return
 
+                # A module's write may have been confirmed while the clipboard was read;
+                # otherwise enqueue_clipboard() still matches it by content
+                if self._skip_own_change(current_change_count):
+                    return
+
                 # Avoid processing if content hasn't actually changed
                 if current_clipboard_content == self.last_processed_clipboard_content:
                     logger.debug("Clipboard content identical to last processed content. Skipping.")
                     return
 
-                # Set processing flag to prevent recursion
-                self.processing_in_progress = True
+                self.last_processed_clipboard_content = current_clipboard_content
+                logger.info("Clipboard changed (enhanced monitoring)!")
 
-                try:
-                    # Update the last processed content to the current content.
-                    self.last_processed_clipboard_content = current_clipboard_content
-
-                    logger.info("Clipboard changed (enhanced monitoring)!")
-
-                    # If the monitor instance is available, process the new clipboard content.
-                    if self.monitor_instance:
-                        try:
-                            new_content = self.monitor_instance.process_clipboard(current_clipboard_content)
-                            if new_content:
-                                self.last_processed_clipboard_content = new_content
-                        except Exception as e:
-                            # Log any errors during the processing by the modules.
-                            logger.error(f"Error during monitor.process_clipboard from timer handler: {e}")
-                    else:
-                        logger.error("Monitor instance not available in ClipboardMonitorHandler")
-                finally:
-                    # Always reset the processing flag
-                    self.processing_in_progress = False
+                # Queue the change for the processing worker; the timer callback never
+                # waits for modules, so quick successive copies are all seen
+                if self.monitor_instance:
+                    try:
+                        self.monitor_instance.enqueue_clipboard(current_clipboard_content)
+                    except Exception as e:
+                        logger.error(f"Error queueing clipboard change from timer handler: {e}")
+                else:
+                    logger.error("Monitor instance not available in ClipboardMonitorHandler")
 
         def startMonitoring(self):
             """Start the timer-based monitoring."""
@@ -262,7 +522,7 @@ if MACOS_ENHANCED:
 
         def _get_clipboard_content(self):
             """Get clipboard content using centralized utility function."""
-            return get_clipboard_content()
+            return read_clipboard()
 
         def _get_system_idle_time(self):
             # Get system idle time in seconds
@@ -291,6 +551,8 @@ def _setup_monitor():
     monitor = ClipboardMonitor()
     modules_dir = Path(__file__).parent / 'modules'
     monitor.load_modules(str(modules_dir))
+    monitor.module_manager.load_profile(str(Path(paths["base_dir"]) / "module_profile.json"))
+    monitor.configure_scheduler()
 
     enabled_modules = monitor.module_manager.get_enabled_modules()
     if not enabled_modules:
@@ -304,10 +566,11 @@ def _setup_monitor():
 def _run_enhanced_monitoring(monitor):
     """Run enhanced clipboard monitoring using macOS pyobjc."""
     logger.info("Using enhanced clipboard monitoring (macOS).")
+    monitor.mode = "enhanced"
 
     initial_clipboard_content = None
     try:
-        initial_clipboard_content = get_clipboard_content()
+        initial_clipboard_content = read_clipboard()
         if initial_clipboard_content:
             logger.info("Processing initial clipboard content (enhanced mode)...")
             monitor.process_clipboard(initial_clipboard_content)
@@ -340,7 +603,7 @@ def _run_enhanced_monitoring(monitor):
 def _process_initial_clipboard_polling(monitor):
     """Process initial clipboard content for polling mode."""
     try:
-        initial_clipboard_content = get_clipboard_content()
+        initial_clipboard_content = read_clipboard()
         if initial_clipboard_content:
             logger.info("Processing initial clipboard content (polling)...")
             log_event("Processing initial clipboard content (polling)...", level="INFO")
@@ -355,21 +618,23 @@ def _process_initial_clipboard_polling(monitor):
 def _handle_polling_iteration(monitor, last_clipboard, consecutive_errors, max_consecutive_errors):
     """Handle a single iteration of the polling loop."""
     try:
-        # Check for pause flag
-        pause_flag_path = Path(safe_expanduser("~/Library/Application Support/ClipboardMonitor/pause_flag"))
-        if pause_flag_path.exists():
-            log_event("Service paused via pause_flag.", level="INFO")
+        # Check for pause
+        if monitor.is_paused():
+            log_event("Service paused.", level="INFO")
             time.sleep(PAUSE_CHECK_INTERVAL)
             return last_clipboard, consecutive_errors, True  # continue flag
         
-        clipboard_content = get_clipboard_content()
-        if clipboard_content and clipboard_content != last_clipboard:
+        tick_start = time.perf_counter()
+        clipboard_content = read_clipboard()
+        tick_cost = time.perf_counter() - tick_start
+        changed = bool(clipboard_content) and clipboard_content != last_clipboard
+        if changed:
             last_clipboard = clipboard_content
             log_event("Clipboard content changed (polling).", level="INFO")
-            monitor.process_clipboard(clipboard_content)
+            monitor.enqueue_clipboard(clipboard_content)
 
         consecutive_errors = 0
-        time.sleep(config_manager.get_polling_interval())
+        time.sleep(monitor.get_next_interval(changed, tick_cost, config_manager.get_polling_interval()))
         return last_clipboard, consecutive_errors, True
 
     except Exception as e:
@@ -413,6 +678,7 @@ def _handle_polling_iteration(monitor, last_clipboard, consecutive_errors, max_c
 def _run_polling_monitoring(monitor):
     """Run polling-based clipboard monitoring."""
     logger.info("Clipboard monitor started (polling).")
+    monitor.mode = "polling"
     log_event("Clipboard monitor started (polling).", level="INFO")
     
     last_clipboard = _process_initial_clipboard_polling(monitor)
@@ -440,15 +706,34 @@ def _run_polling_monitoring(monitor):
 
 def main():
     """Main entry point for the clipboard monitor."""
+    if config_manager.get_config_value('performance', 'lock_profiling', False):
+        LockManager().enable_profiling()
     monitor = _setup_monitor()
+    monitor.start_warmup()
+    if config_manager.get_config_value('performance', 'module_hot_reload', False):
+        monitor.module_manager.start_module_watcher()
+    if config_manager.get_config_value('performance', 'module_memory_tracking', False):
+        monitor.module_manager.start_memory_tracking(
+            config_manager.get_config_value('performance', 'module_memory_sample_interval', MODULE_MEMORY_SAMPLE_INTERVAL))
+    monitor.start_control_server()
+    get_side_effect_executor().start()
+    monitor.start_event_queue()
 
-    # Try enhanced monitoring first (macOS with pyobjc)
-    if MACOS_ENHANCED:
-        if _run_enhanced_monitoring(monitor):
-            return
+    try:
+        # Try enhanced monitoring first (macOS with pyobjc)
+        if MACOS_ENHANCED:
+            if _run_enhanced_monitoring(monitor):
+                return
 
-    # Fall back to polling monitoring
-    _run_polling_monitoring(monitor)
+        # Fall back to polling monitoring
+        _run_polling_monitoring(monitor)
+    finally:
+        monitor.stop_control_server()
+        monitor.stop_event_queue()
+        monitor.module_manager.shutdown()
+        get_side_effect_executor().stop()
 # Standard Python entry point.
 if __name__ == "__main__":
+    # Needed for isolated-module worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
@@ -13,6 +13,7 @@ import psutil
 from pathlib import Path
 from utils import safe_expanduser, ensure_directory_exists, set_config_value, load_clipboard_history, setup_logging, get_app_paths, show_notification
 from config_manager import ConfigManager
+from control_server import send_control_command
 from constants import POLLING_INTERVALS, ENHANCED_CHECK_INTERVALS
 # Optional import for pyperclip (may not be available in PyInstaller bundle)
 try:
@@ -122,6 +123,8 @@ class ClipboardMonitorMenuBar(rumps.App):
             self.config_manager.reload()
             # Clear cached config values to force refresh
             self._clear_config_cache()
+            # Have the service pick up the change now rather than on its next config check
+            send_control_command("reload-config")
         return success
 
     def _clear_config_cache(self):
@@ -683,12 +686,24 @@ class ClipboardMonitorMenuBar(rumps.App):
         self.lazy_loading = rumps.MenuItem("Lazy Module Loading", callback=self.toggle_performance_setting)
         self.lazy_loading.state = self.config_manager.get_config_value('performance', 'lazy_module_loading', True)
         perf_menu.add(self.lazy_loading)
+        self.module_warmup = rumps.MenuItem("Warm Up Modules at Startup", callback=self.toggle_performance_setting)
+        self.module_warmup.state = self.config_manager.get_config_value('performance', 'module_warmup', True)
+        perf_menu.add(self.module_warmup)
         self.adaptive_checking = rumps.MenuItem("Adaptive Checking", callback=self.toggle_performance_setting)
         self.adaptive_checking.state = self.config_manager.get_config_value('performance', 'adaptive_checking', True)
         perf_menu.add(self.adaptive_checking)
+        self.auto_scheduling = rumps.MenuItem("Auto Scheduling (Adaptive Intervals)", callback=self.toggle_scheduling_mode)
+        self.auto_scheduling.state = self.config_manager.get_scheduling_mode() == "auto"
+        perf_menu.add(self.auto_scheduling)
         self.process_large_content = rumps.MenuItem("Process Large Content", callback=self.toggle_performance_setting)
         self.process_large_content.state = self.config_manager.get_config_value('performance', 'process_large_content', True)
         perf_menu.add(self.process_large_content)
+        self.parallel_module_execution = rumps.MenuItem("Parallel Module Execution", callback=self.toggle_performance_setting)
+        self.parallel_module_execution.state = self.config_manager.get_config_value('performance', 'parallel_module_execution', False)
+        perf_menu.add(self.parallel_module_execution)
+        self.process_isolation = rumps.MenuItem("Process Isolation for Heavy Modules", callback=self.toggle_performance_setting)
+        self.process_isolation.state = self.config_manager.get_config_value('performance', 'process_isolation', False)
+        perf_menu.add(self.process_isolation)
         # Memory-related settings moved to dedicated Memory Settings menu
         perf_menu.add(rumps.MenuItem("Set Max Execution Time...", callback=self.set_max_execution_time))
         return perf_menu
@@ -1208,9 +1223,37 @@ class ClipboardMonitorMenuBar(rumps.App):
                     pass
                 self._status_cycle_count = 0
     
+    def _apply_service_status(self, status):
+        """Update the status menu items from a control-socket 'status' reply."""
+        if status.get("paused"):
+            status_text = "Status: Paused"
+            self.pause_toggle.title = "Resume Monitoring"
+        else:
+            mode = status.get("mode")
+            if mode == "enhanced":
+                status_text = "Status: Running (Enhanced)"
+            elif mode == "polling":
+                status_text = "Status: Running (Polling)"
+            else:
+                status_text = "Status: Running"
+            self.pause_toggle.title = "Pause Monitoring"
+            # Modules skipped by their circuit breaker after repeated errors or timeouts
+            open_circuits = status.get("open_circuits") or []
+            if open_circuits:
+                status_text += f" ⚠️ Paused: {', '.join(open_circuits)}"
+        if self.emergency_safe_mode:
+            status_text += " 🚨"
+        self.status_item.title = status_text
+
     def update_status(self):
         """Check if the service is running and update the status menu item - OPTIMIZED VERSION"""
         try:
+            # Ask the service directly over its control socket (no subprocesses or log tailing)
+            response = send_control_command("status")
+            if response and response.get("ok"):
+                self._apply_service_status(response.get("result") or {})
+                return
+
             # MEMORY LEAK FIX: Cache subprocess results and reduce calls
             if not hasattr(self, '_status_cache'):
                 self._status_cache = {'last_check': 0, 'result': None, 'is_paused': False}
@@ -1580,8 +1623,11 @@ class ClipboardMonitorMenuBar(rumps.App):
         # Map menu item titles to config keys
         setting_map = {
             "Lazy Module Loading": "lazy_module_loading",
+            "Warm Up Modules at Startup": "module_warmup",
             "Adaptive Checking": "adaptive_checking",
-            "Process Large Content": "process_large_content"
+            "Process Large Content": "process_large_content",
+            "Parallel Module Execution": "parallel_module_execution",
+            "Process Isolation for Heavy Modules": "process_isolation"
             # Memory-related settings moved to toggle_memory_setting
         }
 
@@ -1593,6 +1639,17 @@ class ClipboardMonitorMenuBar(rumps.App):
         else:
             rumps.notification("Error", "Failed to update performance setting", "Could not save configuration")
 
+    def toggle_scheduling_mode(self, sender):
+        """Switch between fixed check intervals and adaptive ('auto') scheduling."""
+        sender.state = not sender.state
+        mode = "auto" if sender.state else "fixed"
+        if set_config_value('general', 'scheduling_mode', mode):
+            rumps.notification("Clipboard Monitor", "Scheduling Mode",
+                              f"Check scheduling is now {'adaptive' if sender.state else 'fixed'}")
+            self.restart_service(None)
+        else:
+            rumps.notification("Error", "Failed to update scheduling mode", "Could not save configuration")
+
     def toggle_memory_setting(self, sender):
         """Toggle memory-specific settings."""
         sender.state = not sender.state
@@ -1617,7 +1674,7 @@ class ClipboardMonitorMenuBar(rumps.App):
         """Set maximum module execution time"""
         current_time = self.config_manager.get_config_value('performance', 'max_module_execution_time', 500)
         response = rumps.Window(
-            message="Enter maximum execution time (milliseconds):",
+            message="Enter maximum execution time per module (milliseconds, 0 to disable):",
             title="Set Max Execution Time",
             default_text=str(current_time),
             ok="Set",
@@ -1628,7 +1685,7 @@ class ClipboardMonitorMenuBar(rumps.App):
         if response.clicked and response.text.strip():
             try:
                 new_time = int(response.text.strip())
-                if new_time > 0:
+                if new_time >= 0:
                     if set_config_value('performance', 'max_module_execution_time', new_time):
                         rumps.notification("Clipboard Monitor", "Max Execution Time",
                                           f"Max execution time set to {new_time}ms")
@@ -1636,7 +1693,7 @@ class ClipboardMonitorMenuBar(rumps.App):
                     else:
                         rumps.notification("Error", "Failed to update execution time", "Could not save configuration")
                 else:
-                    rumps.notification("Error", "Invalid Value", "Execution time must be positive")
+                    rumps.notification("Error", "Invalid Value", "Execution time cannot be negative")
             except ValueError:
                 rumps.notification("Error", "Invalid Value", "Please enter a valid number")
     
@@ -2236,8 +2293,13 @@ read -n 1
 
             if response == 1:  # OK clicked
                 try:
-                    from modules.history_module import clear_history as module_clear_history
-                    result = module_clear_history()
+                    # Let the running service clear history so its in-memory state is reset too
+                    response = send_control_command("flush-history")
+                    if response and response.get("ok"):
+                        result = response.get("result", {}).get("cleared", False)
+                    else:
+                        from modules.history_module import clear_history as module_clear_history
+                        result = module_clear_history()
                     if result:
                         # Update the recent history menu to reflect the cleared state
                         self.update_recent_history_menu()
@@ -2262,9 +2324,11 @@ read -n 1
             pause_flag_path = safe_expanduser("~/Library/Application Support/ClipboardMonitor/pause_flag")
             
             if sender.title == "Pause Monitoring":
-                # Create pause flag file
-                with open(pause_flag_path, 'w') as f:
-                    f.write("paused")
+                # Pause via the control socket; fall back to the pause flag file for older services
+                response = send_control_command("pause")
+                if not (response and response.get("ok")):
+                    with open(pause_flag_path, 'w') as f:
+                        f.write("paused")
 
                 sender.title = "Resume Monitoring"
                 self.status_item.title = "Status: Paused"
@@ -2283,7 +2347,8 @@ read -n 1
                     "Clipboard monitoring has been temporarily paused."
                 )
             else:
-                # Remove pause flag file
+                # Resume via the control socket and remove any pause flag file
+                send_control_command("resume")
                 if os.path.exists(pause_flag_path):
                     os.remove(pause_flag_path)
 
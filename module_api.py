@@ -0,0 +1,124 @@
+"""
+Module API - The two processing-module contracts and the detection pass that
+runs before any module processes content.
+
+Version 1 modules (the default) export process(content, config), which both decides
+whether the content is theirs and acts on it. Version 2 modules declare
+API_VERSION = 2 and split this into a pure, fast detect(event, config) returning a
+match score, and a process(event, config) that is only called when detect() matched.
+Version 1 modules are adapted by treating them as always matching, so their
+process() keeps deciding for itself.
+"""
+
+import time
+import logging
+from collections import namedtuple
+
+from module_executor import get_module_name, is_exclusive, modifies_clipboard
+
+logger = logging.getLogger("module_api")
+
+MODULE_API_V1 = 1
+MODULE_API_V2 = 2
+
+# One module's detection: its match score (0.0 is no match), the seconds detect()
+# took, and the exception it raised, if any
+Detection = namedtuple("Detection", ["module", "name", "score", "elapsed", "error"])
+
+
+def get_api_version(module):
+    """
+    Get the module contract a module implements.
+
+    Args:
+        module: Processing module
+
+    Returns:
+        int: The module's API_VERSION (1 if not declared)
+    """
+    return getattr(module, 'API_VERSION', MODULE_API_V1)
+
+
+def has_detector(module):
+    """
+    Check whether a module separates detection from processing.
+
+    Args:
+        module: Processing module
+
+    Returns:
+        bool: True for version 2 modules with a callable detect()
+    """
+    return get_api_version(module) >= MODULE_API_V2 and callable(getattr(module, 'detect', None))
+
+
+def detect(module, event, config=None):
+    """
+    Score how well content matches a module.
+
+    Version 1 modules always score 1.0, since only their process() can tell.
+
+    Args:
+        module: Processing module
+        event (ClipboardEvent): Content to score
+        config (dict, optional): Module configuration
+
+    Returns:
+        Detection: The score (clamped to 0.0 - 1.0), time taken and any error
+    """
+    name = get_module_name(module)
+    if not has_detector(module):
+        return Detection(module, name, 1.0, 0.0, None)
+    start = time.perf_counter()
+    try:
+        score = min(max(float(module.detect(event, config) or 0.0), 0.0), 1.0)
+        return Detection(module, name, score, time.perf_counter() - start, None)
+    except Exception as e:
+        logger.error(f"Error in {name}.detect(): {e}")
+        return Detection(module, name, 0.0, time.perf_counter() - start, e)
+
+
+def run_detectors(modules, event, config=None, detection_order=None):
+    """
+    Run the detection pass.
+
+    Modules that do not match are dropped. Once a version 2 EXCLUSIVE module matches,
+    the clipboard-modifying modules after it in execution order are neither detected
+    nor run, so an exclusive match cancels the rest of the pass; read-only modules such
+    as history still run.
+
+    Detectors may be tried in a different order than modules execute (see
+    module_profile), e.g. to reach a likely exclusive match sooner. The outcome is the
+    same as detecting in execution order; only the number of detect() calls changes.
+
+    Args:
+        modules (list): Modules in execution order
+        event (ClipboardEvent): Content to detect
+        config (dict, optional): Module configuration
+        detection_order (list, optional): The same modules in the order to try
+            their detectors; defaults to execution order
+
+    Returns:
+        tuple: (modules to process, in execution order; list of Detection for every
+            module that was detected, in detection order)
+    """
+    positions = {id(module): index for index, module in enumerate(modules)}
+    scores = {}
+    detections = []
+    claim = None  # Execution position of the earliest exclusive match so far
+    for module in detection_order if detection_order is not None else modules:
+        position = positions[id(module)]
+        if claim is not None and position > claim and modifies_clipboard(module):
+            continue
+        detection = detect(module, event, config)
+        detections.append(detection)
+        scores[id(module)] = detection.score
+        if detection.score > 0.0 and has_detector(module) and is_exclusive(module):
+            claim = position if claim is None else min(claim, position)
+
+    selected = [module for index, module in enumerate(modules)
+                if scores.get(id(module), 0.0) > 0.0
+                and not (claim is not None and index > claim and modifies_clipboard(module))]
+    if claim is not None:
+        logger.debug(f"Content claimed by {get_module_name(modules[claim])} during detection")
+    return selected, detections
@@ -0,0 +1,224 @@
+"""
+ModuleExecutor class - Runs processing modules for one clipboard change, serially or
+concurrently on a thread pool, and reports each module's result and timing.
+"""
+
+import time
+import logging
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import DEFAULT_MODULE_PRIORITY, DEFAULT_MODULE_WORKERS, MODULE_COST_CLASSES, DEFAULT_MODULE_COST
+
+logger = logging.getLogger("module_executor")
+
+# Outcome of running one module: its return value, seconds taken and any exception raised
+ModuleResult = namedtuple("ModuleResult", ["module", "name", "result", "elapsed", "error"])
+
+
+class ModuleTimeoutError(TimeoutError):
+    """Raised in place of a module's result when its worker process was stopped for exceeding its budget."""
+
+
+def get_module_name(module):
+    """Get a module's name for logging."""
+    return getattr(module, '__name__', 'unknown')
+
+
+def get_module_priority(module, overrides=None):
+    """
+    Get a module's priority (lower runs, and merges, first).
+
+    Args:
+        module: Processing module
+        overrides (dict, optional): Module name -> priority from configuration
+
+    Returns:
+        int: The module's priority
+    """
+    if overrides and get_module_name(module) in overrides:
+        return overrides[get_module_name(module)]
+    return getattr(module, 'PRIORITY', DEFAULT_MODULE_PRIORITY)
+
+
+def get_module_cost(module):
+    """
+    Get a module's estimated cost class as a rank (0 is cheapest).
+
+    Args:
+        module: Processing module
+
+    Returns:
+        int: Index of the module's COST in MODULE_COST_CLASSES
+    """
+    cost = getattr(module, 'COST', DEFAULT_MODULE_COST)
+    if cost not in MODULE_COST_CLASSES:
+        cost = DEFAULT_MODULE_COST
+    return MODULE_COST_CLASSES.index(cost)
+
+
+def get_module_budget(module, default_ms):
+    """
+    Get a module's execution budget in milliseconds.
+
+    A module can declare a tighter MAX_EXECUTION_TIME (milliseconds), but never one
+    above the configured budget: budgets are not set by the modules they limit.
+
+    Args:
+        module: Processing module
+        default_ms (int): Configured budget (performance.max_module_execution_time)
+
+    Returns:
+        int: The budget, or 0 if budgets are disabled
+    """
+    if not default_ms:
+        return 0
+    declared = getattr(module, 'MAX_EXECUTION_TIME', 0) or 0
+    return min(declared, default_ms) if declared > 0 else default_ms
+
+
+def accepts_size(module, byte_length):
+    """
+    Check whether content of a given size is within a module's declared size range.
+
+    Args:
+        module: Processing module
+        byte_length (int): Content size in bytes
+
+    Returns:
+        bool: True unless the size is below MIN_CONTENT_SIZE or above MAX_CONTENT_SIZE
+    """
+    minimum = getattr(module, 'MIN_CONTENT_SIZE', None)
+    maximum = getattr(module, 'MAX_CONTENT_SIZE', None)
+    return (minimum is None or byte_length >= minimum) and (maximum is None or byte_length <= maximum)
+
+
+def is_exclusive(module):
+    """
+    Check whether a module claims content it handles, so no later module runs on it.
+
+    Args:
+        module: Processing module
+
+    Returns:
+        bool: True if the module declares EXCLUSIVE = True
+    """
+    return getattr(module, 'EXCLUSIVE', False)
+
+
+def modifies_clipboard(module):
+    """
+    Check whether a module may write to the clipboard.
+
+    Modules that do not declare MODIFIES_CLIPBOARD are assumed to.
+
+    Args:
+        module: Processing module
+
+    Returns:
+        bool: True if the module may modify the clipboard
+    """
+    return getattr(module, 'MODIFIES_CLIPBOARD', True)
+
+
+class ModuleExecutor:
+    """
+    Runs modules and collects their results in a fixed order.
+
+    In parallel mode, every module that does not modify the clipboard runs as its
+    own task on a reused thread pool, while modules that may modify it run one after
+    another, in order, on the calling thread. Clipboard writes therefore happen in
+    the same order as in serial execution, and the merged result does not depend on
+    thread scheduling.
+
+    Modules always run to completion. An in-process module's side effects (clipboard
+    writes, notifications) cannot be cancelled, so abandoning it would only hide its
+    result; execution budgets are enforced by ModuleProcessPool, which can stop a
+    worker process, and merely reported for in-process modules.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MODULE_WORKERS):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers (int): Maximum number of modules running at once
+        """
+        self.max_workers = max(int(max_workers), 1)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        """Get the thread pool, creating it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="module")
+            return self._pool
+
+    def _run_module(self, module, call):
+        """
+        Run one module, timing it and capturing any exception.
+
+        Args:
+            module: Processing module
+            call (callable): Function taking the module and returning its result
+
+        Returns:
+            ModuleResult: The module's outcome
+        """
+        start = time.perf_counter()
+        try:
+            result, error = call(module), None
+        except Exception as e:
+            result, error = None, e
+        return ModuleResult(module, get_module_name(module), result, time.perf_counter() - start, error)
+
+    def _run_chain(self, modules, call, stop=None):
+        """
+        Run modules one after another, returning their outcomes in order. Once
+        stop(outcome) is true, later clipboard-modifying modules are skipped.
+        """
+        outcomes = []
+        stopped = False
+        for module in modules:
+            if stopped and modifies_clipboard(module):
+                continue
+            outcomes.append(self._run_module(module, call))
+            stopped = stopped or (stop is not None and stop(outcomes[-1]))
+        return outcomes
+
+    def run(self, modules, call, parallel=False, stop=None):
+        """
+        Run modules and return their outcomes in the order the modules were given.
+
+        Args:
+            modules (list): Modules, already sorted by priority
+            call (callable): Function taking a module and returning its result
+            parallel (bool): Whether to run independent modules concurrently
+            stop (callable, optional): Predicate on a ModuleResult; once it is true, the
+                remaining clipboard-modifying modules are skipped
+
+        Returns:
+            list: ModuleResult for each module that ran, in input order
+        """
+        if not parallel or len(modules) < 2:
+            return self._run_chain(modules, call, stop)
+
+        pool = self._get_pool()
+        chained = [module for module in modules if modifies_clipboard(module)]
+        futures = [pool.submit(self._run_module, module, call)
+                   for module in modules if not modifies_clipboard(module)]
+        # The clipboard-modifying chain runs on the calling thread
+        outcomes = {id(outcome.module): outcome for outcome in self._run_chain(chained, call, stop)}
+        for future in futures:
+            outcome = future.result()
+            outcomes[id(outcome.module)] = outcome
+        return [outcomes[id(module)] for module in modules if id(module) in outcomes]
+
+    def shutdown(self):
+        """Stop the thread pool, waiting for running modules to finish."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
@@ -4,15 +4,35 @@ Extracted from main.py for better modularity and testability.
 """
 
 import os
+import time
 import importlib
 import importlib.util
 import logging
 import threading
-import hashlib
 from pathlib import Path
 from config_manager import ConfigManager
 from lock_manager import LockManager
-from constants import DEFAULT_MAX_CLIPBOARD_SIZE
+from constants import (
+    DEFAULT_MAX_CLIPBOARD_SIZE, DEFAULT_LARGE_CONTENT_WINDOW, DEFAULT_MODULE_WORKERS,
+    DEFAULT_MAX_MODULE_EXECUTION_TIME, DEFAULT_PROCESS_POOL_WORKERS, DEFAULT_PROCESS_WORKER_MAX_TASKS,
+    DEFAULT_PROCESS_WORKER_MAX_MEMORY, MODULE_RELOAD_CHECK_INTERVAL, MODULE_MEMORY_SAMPLE_INTERVAL
+)
+from module_executor import (
+    ModuleExecutor, ModuleTimeoutError, get_module_name, get_module_priority, get_module_cost, get_module_budget,
+    accepts_size, is_exclusive, modifies_clipboard
+)
+from module_watchdog import ModuleWatchdog
+from module_metrics import ModuleMetrics
+import result_cache
+from process_pool import ModuleProcessPool, is_isolated
+from content_router import ContentRouter
+from module_api import MODULE_API_V2, get_api_version, has_detector, run_detectors
+from module_profile import ModuleProfiler
+from module_memory import ModuleMemoryTracker
+from utils import TruncatedContent, show_notification
+from clipboard_event import ClipboardEvent
+from content_tracker import get_content_store
+from side_effects import submit_notification
 
 logger = logging.getLogger("module_manager")
 
@@ -28,6 +48,18 @@ class ModuleManager:
         self.module_specs = []
         self.lock_manager = LockManager()
         self.last_processed_hash = None
+        self.executor = None
+        self.router = ContentRouter()
+        self.watchdog = ModuleWatchdog()
+        self.process_pool = None
+        self._config_version = None
+        self.ready = threading.Event()  # Set once enabled modules are imported
+        self._module_mtimes = {}  # Module name -> mtime of the file version loaded (or rejected)
+        self._watcher = None
+        self._watcher_stop = threading.Event()
+        self.metrics = ModuleMetrics()
+        self.profiler = ModuleProfiler()
+        self.memory_tracker = None
     
     def load_modules(self, modules_dir):
         """
@@ -38,6 +70,7 @@ class ModuleManager:
         """
         self.modules = []
         self.module_specs = []
+        self.ready.clear()
         
         # Load module configuration
         module_config = self._load_module_config()
@@ -62,15 +95,64 @@ class ModuleManager:
                 else:
                     logger.info(f"Module disabled in config: {module_name} (value: {module_enabled})")
     
-    def _load_module_config(self):
-        """Load module configuration from config.json."""
+    def _get_config_snapshot(self):
+        """
+        Get the current configuration snapshot, reloading config.json first if it
+        changed on disk.
+
+        Returns:
+            ConfigSnapshot or None: The snapshot, or None if configuration failed to load
+        """
         try:
             config_manager = ConfigManager()
-            config = config_manager.get_section('modules', {})
-            return config
+            config_manager.refresh_if_changed()
+            return config_manager.snapshot()
         except Exception as e:
-            logger.error(f"Error loading module config: {e}")
-            return {}
+            logger.error(f"Error loading config snapshot: {e}")
+            return None
+
+    def _load_module_config(self, snapshot=None):
+        """
+        Load the (read-only) module configuration.
+
+        Args:
+            snapshot (ConfigSnapshot, optional): Snapshot to read; defaults to the current one
+        """
+        snapshot = snapshot or self._get_config_snapshot()
+        return snapshot.get_section('modules', {}) if snapshot is not None else {}
+    
+    def _load_performance_config(self, snapshot=None):
+        """
+        Load the (read-only) performance configuration.
+
+        Args:
+            snapshot (ConfigSnapshot, optional): Snapshot to read; defaults to the current one
+        """
+        snapshot = snapshot or self._get_config_snapshot()
+        return snapshot.get_section('performance', {}) if snapshot is not None else {}
+
+    def _notify_config_change(self, snapshot, module_config):
+        """
+        Pass changed configuration to modules that define on_config_change(config), so
+        they can recompute derived state only when the configuration actually changes.
+
+        Args:
+            snapshot (ConfigSnapshot or None): The snapshot this event runs with
+            module_config (dict): Module configuration from that snapshot
+        """
+        version = snapshot.version if snapshot is not None else None
+        if version == self._config_version:
+            return
+        self._config_version = version
+        # The result cache keeps its settings between configuration changes
+        result_cache.on_config_change(self._load_performance_config(snapshot))
+        for module in self.modules:
+            hook = getattr(module, 'on_config_change', None)
+            if callable(hook):
+                try:
+                    hook(module_config)
+                except Exception as e:
+                    logger.error(f"Error in {get_module_name(module)}.on_config_change: {e}")
     
     def _load_module_if_needed(self, module_name, spec):
         """
@@ -95,6 +177,147 @@ class ModuleManager:
         
         return module
     
+    def _ensure_modules_loaded(self):
+        """
+        Import the enabled modules if they are not loaded yet and mark the manager ready.
+        Caller holds the module execution lock.
+        """
+        if not self.modules and self.module_specs:
+            for module_name, spec in self.module_specs:
+                self._module_mtimes[module_name] = self._get_module_mtime(spec.origin)
+                try:
+                    loaded_module = self._load_module_if_needed(module_name, spec)
+                    self.modules.append(loaded_module)
+                except (ImportError, AttributeError) as e:
+                    logger.error(f"Error loading module {module_name}: {e}")
+            self._config_version = None
+        self.ready.set()
+
+    def warm_up(self):
+        """
+        Import and validate enabled modules ahead of the first clipboard change, and
+        start the isolated-module worker processes if process isolation is enabled.
+
+        Holds the module execution lock, so a clipboard change arriving during warm-up
+        waits for it instead of importing the modules a second time.
+
+        Returns:
+            float: Seconds spent warming up
+        """
+        start = time.perf_counter()
+        with self.lock_manager.get_module_execution_lock():
+            self._ensure_modules_loaded()
+            invalid = [get_module_name(module) for module in self.modules if not self._validate_module(module)]
+            if invalid:
+                logger.warning(f"Modules failed validation during warm-up: {', '.join(invalid)}")
+            snapshot = self._get_config_snapshot()
+            self._notify_config_change(snapshot, self._load_module_config(snapshot))
+            process_pool = self._get_process_pool(self._load_performance_config(snapshot))
+            if process_pool is not None and any(is_isolated(module) for module in self.modules):
+                process_pool.prestart()
+        elapsed = time.perf_counter() - start
+        logger.info(f"Module warm-up: {len(self.modules)} modules ready in {elapsed * 1000:.1f}ms")
+        return elapsed
+
+    def _get_module_mtime(self, path):
+        """Get a module file's modification time, or None if it cannot be read."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except (OSError, TypeError):
+            return None
+
+    def reload_module(self, module_name, path):
+        """
+        Hot-swap a loaded module with a fresh import of its file.
+
+        The new version is imported and validated before anything is replaced; if that
+        fails, the old version keeps running and the broken file is not retried until it
+        changes again. The swap itself happens under the module execution lock, so a
+        clipboard change runs entirely with either the old or the new version. The
+        module's namespace of the shared content store is cleared with the swap, so
+        the new version does not inherit the old one's processed content.
+
+        Args:
+            module_name (str): Name of the module
+            path (str): Path to the module file
+
+        Returns:
+            bool: True if the module was replaced
+        """
+        self._module_mtimes[module_name] = self._get_module_mtime(path)
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        try:
+            new_module = self._load_module_if_needed(module_name, spec)
+        except Exception as e:
+            logger.error(f"Hot reload of {module_name} failed, keeping the loaded version: {e}")
+            submit_notification(show_notification, "Module Reload Failed", f"{module_name}: {e}", "")
+            return False
+        if not self._validate_module(new_module):
+            logger.error(f"Hot reload of {module_name} failed validation, keeping the loaded version")
+            return False
+
+        with self.lock_manager.get_module_execution_lock():
+            for index, module in enumerate(self.modules):
+                if get_module_name(module) == module_name:
+                    self.modules[index] = new_module
+                    break
+            else:
+                return False
+            self.module_specs = [(name, spec if name == module_name else old_spec)
+                                 for name, old_spec in self.module_specs]
+            get_content_store().clear(module_name)
+            # Deliver the current config to the new version before its first process() call
+            self._config_version = None
+        logger.info(f"Hot-reloaded module {module_name}")
+        return True
+
+    def check_module_changes(self):
+        """
+        Hot-reload every loaded module whose file changed since it was loaded.
+
+        Returns:
+            list: Names of the modules that were reloaded
+        """
+        changed = []
+        for module in list(self.modules):
+            name = get_module_name(module)
+            path = getattr(module, '__file__', None)
+            mtime = self._get_module_mtime(path)
+            if mtime is not None and mtime != self._module_mtimes.get(name):
+                changed.append((name, path))
+        return [name for name, path in changed if self.reload_module(name, path)]
+
+    def start_module_watcher(self, interval=MODULE_RELOAD_CHECK_INTERVAL):
+        """
+        Watch loaded modules' files on a background thread and hot-reload them on change.
+
+        Args:
+            interval (float): Seconds between checks
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._watcher_stop.clear()
+
+        def watch():
+            while not self._watcher_stop.wait(interval):
+                try:
+                    self.check_module_changes()
+                except Exception as e:
+                    logger.error(f"Error checking modules for changes: {e}")
+
+        self._watcher = threading.Thread(target=watch, name="module-watcher", daemon=True)
+        self._watcher.start()
+        logger.info(f"Watching modules for changes every {interval}s")
+
+    def is_ready(self):
+        """
+        Check whether the enabled modules have been loaded.
+
+        Returns:
+            bool: True once modules are loaded (by warm-up or the first clipboard change)
+        """
+        return self.ready.is_set()
+
     def _validate_module(self, module):
         """
         Validate that a module has the required interface.
@@ -112,70 +335,414 @@ class ModuleManager:
         if not callable(getattr(module, 'process')):
             logger.error(f"Module {getattr(module, '__name__', 'unknown')} 'process' is not callable")
             return False
+
+        if get_api_version(module) >= MODULE_API_V2 and not callable(getattr(module, 'detect', None)):
+            logger.error(f"Module {getattr(module, '__name__', 'unknown')} declares API_VERSION 2 "
+                         f"but has no callable 'detect' function")
+            return False
         
         return True
     
-    def _get_content_hash(self, content):
-        """
-        Generate a hash of the content to detect processing loops.
-        
-        Args:
-            content: Content to hash
-            
-        Returns:
-            str: MD5 hash of the content
-        """
-        if content is None:
-            return "none"
-        return hashlib.md5(str(content).encode()).hexdigest()
-    
-    def process_content(self, clipboard_content, max_size=DEFAULT_MAX_CLIPBOARD_SIZE):
+    def process_content(self, clipboard_content, max_size=DEFAULT_MAX_CLIPBOARD_SIZE, observers_only=False):
         """
         Process clipboard content with all loaded modules.
         
+        The content is wrapped in a ClipboardEvent once, so derived values such as its
+        hash, stripped text and lines are computed at most once for all modules.
+        Content over max_size is only processed when 'process_large_content' is enabled,
+        and then only as a prefix window passed to modules that set WINDOWED_CONTENT.
+        With 'content_routing' enabled, modules whose CONTENT_TYPES do not match the
+        router's classification of the content are skipped. Version 2 modules (see
+        module_api) are first asked to detect() the content, and only matching ones run.
+        Detection runs without the module execution lock; if a newer change is admitted
+        meanwhile, this one only runs the modules that do not modify the clipboard.
+        
         Args:
-            clipboard_content (str): Content to process
-            max_size (int): Maximum content size to process
+            clipboard_content (str or ClipboardEvent): Content to process
+            max_size (int): Maximum content size to process in full
+            observers_only (bool): Only run modules that do not modify the clipboard
+                (e.g. history), for content already superseded by a newer copy
             
         Returns:
             str or None: The new clipboard content if modified, otherwise None.
         """
-        if clipboard_content and len(clipboard_content) > max_size:
-            logger.warning(f"Skipping oversized clipboard content ({len(clipboard_content)} bytes)")
+        # One immutable config snapshot serves every module for this change
+        snapshot = self._get_config_snapshot()
+        performance_config = self._load_performance_config(snapshot)
+        process_large_content = performance_config.get('process_large_content', True)
+        window_bytes = performance_config.get('large_content_window', DEFAULT_LARGE_CONTENT_WINDOW)
+
+        is_windowed = getattr(clipboard_content, 'truncated', False)
+        if not is_windowed and clipboard_content:
+            # max_size is in bytes, like the bounded read; the event caches its size for later use
+            clipboard_content = ClipboardEvent.from_content(clipboard_content)
+            if clipboard_content.byte_length > max_size:
+                if not process_large_content:
+                    logger.warning(f"Skipping oversized clipboard content ({clipboard_content.byte_length} bytes)")
+                    return None
+                clipboard_content = TruncatedContent.from_text(clipboard_content, window_bytes)
+                is_windowed = True
+        elif is_windowed and not process_large_content:
+            logger.warning(f"Skipping oversized clipboard content ({clipboard_content.total_bytes} bytes)")
             return None
 
+        event = ClipboardEvent.from_content(clipboard_content)
+        content_hash = event.content_hash if event is not None else "none"
+
+        # Detection can be slow (a detector may parse the content), so it runs outside
+        # the module execution lock; the lock is only held to admit the change and
+        # choose its candidates, and then to run and merge the modules
         with self.lock_manager.get_module_execution_lock():
-            content_hash = self._get_content_hash(clipboard_content)
             if content_hash == self.last_processed_hash:
                 logger.debug("Skipping processing - content hash matches last processed")
                 return None
             
             self.last_processed_hash = content_hash
             
-            if not self.modules and self.module_specs:
-                for module_name, spec in self.module_specs:
-                    try:
-                        loaded_module = self._load_module_if_needed(module_name, spec)
-                        self.modules.append(loaded_module)
-                    except (ImportError, AttributeError) as e:
-                        logger.error(f"Error loading module {module_name}: {e}")
+            self._ensure_modules_loaded()
+
+            module_config = self._load_module_config(snapshot)
+            self._notify_config_change(snapshot, module_config)
             
+            if is_windowed:
+                logger.info(f"Processing a {len(event)}-character window of oversized content "
+                            f"({event.total_bytes} bytes)")
+
+            loaded = list(self.modules)
+            allowed, detection_order = self._select_modules(event, performance_config, is_windowed, observers_only)
+
+        modules, detections = self._detect_modules(allowed, event, module_config, detection_order)
+
+        with self.lock_manager.get_module_execution_lock():
+            if self.modules != loaded:
+                # A hot reload swapped a module in the meantime; detect again with the new version
+                for module in allowed:
+                    self.watchdog.cancel_trial(get_module_name(module))
+                allowed, detection_order = self._select_modules(event, performance_config, is_windowed,
+                                                                observers_only)
+                modules, detections = self._detect_modules(allowed, event, module_config, detection_order)
+            if self.last_processed_hash != content_hash:
+                # A newer change was admitted while this one was being detected; only
+                # observers still run, so this content cannot overwrite the newer copy
+                modules = [module for module in modules if not modifies_clipboard(module)]
+            parallel = performance_config.get('parallel_module_execution', False)
+            executor = self._get_executor(performance_config.get('module_workers', DEFAULT_MODULE_WORKERS))
+            budget_ms = performance_config.get('max_module_execution_time', DEFAULT_MAX_MODULE_EXECUTION_TIME)
+            process_pool = self._get_process_pool(performance_config)
+
+            def call(module):
+                # Always process with the original clipboard content (as a str-compatible event)
+                if process_pool is not None and is_isolated(module):
+                    # Only a worker process can be stopped at its budget, side effects and all
+                    module_budget = get_module_budget(module, budget_ms)
+                    lean_event = ClipboardEvent(event.text, content_hash=event.content_hash)
+                    return process_pool.run(module, lean_event, module_config,
+                                            timeout=module_budget / 1000.0 if module_budget else None)
+                return module.process(event, module_config)
+
+            def claimed(outcome):
+                # An EXCLUSIVE module that handled the content stops later modules
+                return is_exclusive(outcome.module) and outcome.error is None and bool(outcome.result)
+
+            # With memory tracking on, an occasional change runs with allocation tracing on
+            memory_tracker = self.memory_tracker
+            sampling_memory = memory_tracker is not None and memory_tracker.begin()
+            try:
+                results = executor.run(modules, call, parallel, stop=claimed)
+            finally:
+                if sampling_memory:
+                    memory_tracker.end(self._get_module_files())
+            ran = {id(outcome.module) for outcome in results}
+            if len(results) < len(modules):
+                skipped = [get_module_name(module) for module in modules if id(module) not in ran]
+                logger.debug(f"Content claimed by an exclusive module; skipped {', '.join(skipped)}")
+            # A half-open retry that did not run (not detected or claimed away) waits for the next change
+            failed_detection = {detection.name for detection in detections if detection.error is not None}
+            for module in allowed:
+                if id(module) not in ran and get_module_name(module) not in failed_detection:
+                    self.watchdog.cancel_trial(get_module_name(module))
+
+            # Merge in priority order: as in serial execution, the last module to return
+            # new content wins. All modules (especially history_module) always get to run.
             final_content = None
-            for module in self.modules:
-                try:
-                    # Always process with the original clipboard content
-                    new_content = module.process(clipboard_content, self._load_module_config())
-                    # If a module returns new content, we store it but DON'T stop the loop.
-                    # This ensures all modules (especially history_module) get to run.
-                    if new_content:
-                        logger.info(f"Module '{getattr(module, '__name__', 'unknown')}' returned new content.")
-                        final_content = new_content
-                except Exception as e:
-                    logger.error(f"Error processing with module: {e}")
-            
+            for outcome in results:
+                module_budget = get_module_budget(outcome.module, budget_ms)
+                timed_out = isinstance(outcome.error, ModuleTimeoutError)
+                # An in-process module cannot be stopped, so finishing over budget counts as a timeout
+                overran = outcome.error is None and bool(module_budget) and outcome.elapsed * 1000 > module_budget
+                self.metrics.record(outcome.name, outcome.elapsed, event.byte_length, result=bool(outcome.result),
+                                    error=outcome.error is not None and not timed_out, timeout=timed_out or overran)
+                if timed_out:
+                    self._handle_module_timeout(outcome.name, module_budget)
+                    continue
+                if outcome.error is not None:
+                    logger.error(f"Error processing with module: {outcome.error}")
+                    self._handle_module_error(outcome.name, outcome.error)
+                    continue
+                if overran:
+                    # Its side effects have already happened, so its result is still used
+                    self._handle_module_timeout(outcome.name, module_budget, elapsed_ms=outcome.elapsed * 1000)
+                else:
+                    self.watchdog.record_success(outcome.name)
+                if outcome.result:
+                    logger.info(f"Module '{outcome.name}' returned new content.")
+                    final_content = outcome.result
+
+            if results:
+                timings = ", ".join(f"{outcome.name} {outcome.elapsed * 1000:.1f}ms" for outcome in results)
+                logger.info(f"Module timings ({'parallel' if parallel else 'serial'}): {timings}")
+
             # After all modules have run, return the final modified content, if any.
             return final_content
+
+    def _select_modules(self, event, performance_config, is_windowed, observers_only):
+        """
+        Choose the loaded modules that may see this change, before detection.
+
+        Caller holds the module execution lock. Modules whose circuit allows them are
+        given a half-open trial if one is due, which the caller gives back if they do
+        not run.
+
+        Args:
+            event (ClipboardEvent): Content to process
+            performance_config (dict): Performance configuration for this change
+            is_windowed (bool): Whether the event is a window of oversized content
+            observers_only (bool): Only choose modules that do not modify the clipboard
+
+        Returns:
+            tuple: (candidate modules in execution order; detection order, or None
+                for execution order)
+        """
+        # Only modules that declare support for windowed views see oversized content
+        # Modules that declare a size range (MIN/MAX_CONTENT_SIZE) only see content within it
+        modules = [module for module in self._get_ordered_modules(performance_config)
+                   if (not is_windowed or getattr(module, 'WINDOWED_CONTENT', False))
+                   and accepts_size(module, event.byte_length)
+                   and not (observers_only and modifies_clipboard(module))]
+        # Classify the content once and skip modules that cannot handle it
+        if performance_config.get('content_routing', True):
+            modules = self.router.route(modules, event)
+        # Skip modules whose circuit is open after repeated errors or timeouts; once the
+        # open period passes, a single change retries the module
+        modules = [module for module in modules if self.watchdog.allow(get_module_name(module))]
+        # Detectors are tried in the profiled order (cheap, selective exclusive ones first)
+        detection_order = (self.profiler.order(modules)
+                           if performance_config.get('profile_guided_ordering', True) else None)
+        return modules, detection_order
+
+    def _detect_modules(self, modules, event, module_config, detection_order):
+        """
+        Run the detection pass and record each detector's cost and outcome.
+
+        Version 2 modules that do not match are never processed, and an exclusive match
+        cancels the remaining clipboard-modifying modules up front. Does not need the
+        module execution lock.
+
+        Args:
+            modules (list): Candidate modules in execution order
+            event (ClipboardEvent): Content to detect
+            module_config (dict): Module configuration
+            detection_order (list or None): Order to try the detectors in
+
+        Returns:
+            tuple: (modules to process, in execution order; list of Detection)
+        """
+        modules, detections = run_detectors(modules, event, module_config, detection_order)
+        for detection in detections:
+            if not has_detector(detection.module):
+                continue
+            hit = detection.score > 0.0
+            self.metrics.record_detection(detection.name, detection.elapsed, hit,
+                                          error=detection.error is not None)
+            if detection.error is not None:
+                self._handle_module_error(detection.name, detection.error)
+            else:
+                self.profiler.record(detection.name, detection.elapsed, hit)
+        return modules, detections
+
+    def _handle_module_timeout(self, module_name, budget_ms, elapsed_ms=None):
+        """
+        Record a module that exceeded its time budget, and tell the user.
+
+        Args:
+            module_name (str): Name of the module
+            budget_ms (int): The budget it exceeded, in milliseconds
+            elapsed_ms (float, optional): How long an in-process module took; None if an
+                isolated module's worker was stopped at the budget
+        """
+        backoff, notify = self.watchdog.record_timeout(module_name)
+        if backoff:
+            message = f"{module_name} repeatedly exceeded {budget_ms}ms and is paused for {backoff:.0f}s"
+        elif elapsed_ms is not None:
+            message = f"{module_name} took {elapsed_ms:.0f}ms, over its {budget_ms}ms budget"
+        else:
+            message = f"{module_name} exceeded {budget_ms}ms; its worker was stopped and it was skipped for this change"
+        logger.warning(message)
+        if notify:
+            submit_notification(show_notification, "Module Timeout", message, "")
+
+    def _handle_module_error(self, module_name, error):
+        """
+        Record a module that raised an exception, and tell the user if its circuit opens.
+
+        Args:
+            module_name (str): Name of the module
+            error (Exception): The exception it raised
+        """
+        backoff, notify = self.watchdog.record_error(module_name)
+        if backoff:
+            message = f"{module_name} keeps failing ({error}) and is paused for {backoff:.0f}s"
+            logger.warning(message)
+            if notify:
+                submit_notification(show_notification, "Module Paused", message, "")
+
+    def _get_ordered_modules(self, performance_config):
+        """
+        Get the loaded modules sorted by priority (PRIORITY attribute, or the
+        'module_priority' performance setting), then by estimated cost (COST), cheapest
+        first. Remaining ties keep load order.
+
+        Args:
+            performance_config (dict): Performance configuration
+
+        Returns:
+            list: Modules in execution and merge order
+        """
+        overrides = performance_config.get('module_priority') or {}
+        return sorted(self.modules, key=lambda module: (get_module_priority(module, overrides),
+                                                        get_module_cost(module)))
+
+    def _get_executor(self, max_workers):
+        """Get the module executor, recreating it if the worker count changed."""
+        if self.executor is None or self.executor.max_workers != max(int(max_workers), 1):
+            if self.executor is not None:
+                self.executor.shutdown()
+            self.executor = ModuleExecutor(max_workers)
+        return self.executor
+
+    def _get_process_pool(self, performance_config):
+        """
+        Get the worker process pool for isolated modules, if process isolation is enabled.
+
+        Args:
+            performance_config (dict): Performance configuration
+
+        Returns:
+            ModuleProcessPool or None: The pool, or None when isolation is disabled
+        """
+        if not performance_config.get('process_isolation', False):
+            return None
+        if self.process_pool is None:
+            self.process_pool = ModuleProcessPool(
+                workers=performance_config.get('process_pool_workers', DEFAULT_PROCESS_POOL_WORKERS),
+                max_tasks=performance_config.get('process_worker_max_tasks', DEFAULT_PROCESS_WORKER_MAX_TASKS),
+                max_memory_mb=performance_config.get('process_worker_max_memory', DEFAULT_PROCESS_WORKER_MAX_MEMORY),
+            )
+        return self.process_pool
+
+    def get_process_pool_stats(self):
+        """
+        Get worker process pool statistics.
+
+        Returns:
+            dict or None: Pool statistics, or None if no isolated module has run
+        """
+        return self.process_pool.get_stats() if self.process_pool is not None else None
+
+    def load_profile(self, path):
+        """
+        Load the persisted module profile and keep saving it to the same file from a
+        background thread.
+
+        Args:
+            path (str): Profile file
+
+        Returns:
+            bool: True if a saved profile was loaded
+        """
+        loaded = self.profiler.load(path)
+        self.profiler.start_autosave()
+        return loaded
+
+    def get_module_order_report(self):
+        """
+        Get the detection order chosen from the module profile, and why.
+
+        Returns:
+            list: One dict per loaded module, in detection order
+        """
+        return self.profiler.get_report(self._get_ordered_modules(self._load_performance_config()))
+
+    def _get_module_files(self):
+        """Get loaded module names mapped to their source files."""
+        return {get_module_name(module): module.__file__ for module in list(self.modules)
+                if getattr(module, '__file__', None)}
+
+    def start_memory_tracking(self, interval=MODULE_MEMORY_SAMPLE_INTERVAL):
+        """
+        Start attributing retained memory to modules (see module_memory).
+
+        Args:
+            interval (float): Minimum seconds between changes processed with tracing on
+
+        Returns:
+            ModuleMemoryTracker: The tracker
+        """
+        if self.memory_tracker is None:
+            self.memory_tracker = ModuleMemoryTracker(interval=interval)
+        return self.memory_tracker
+
+    def get_memory_stats(self):
+        """
+        Get per-module retained memory samples.
+
+        Returns:
+            dict or None: Tracker statistics, or None if memory tracking is off
+        """
+        return self.memory_tracker.get_stats() if self.memory_tracker is not None else None
+
+    def shutdown(self):
+        """Stop the module watcher, the module executor's worker threads and any worker processes."""
+        self._watcher_stop.set()
+        self.profiler.stop()
+        if self.memory_tracker is not None:
+            self.memory_tracker.stop()
+            self.memory_tracker = None
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+            self.process_pool = None
     
+    def get_timeout_stats(self):
+        """
+        Get per-module circuit breaker statistics from the watchdog.
+
+        Returns:
+            dict: Module name -> circuit state, timeout and error counts and remaining open time
+        """
+        return self.watchdog.get_stats()
+
+    def get_open_circuits(self):
+        """
+        Get the modules currently skipped (or being retried) by their circuit breaker.
+
+        Returns:
+            list: Module names
+        """
+        return self.watchdog.get_open_circuits()
+
+    def get_module_stats(self):
+        """
+        Get per-module detection and processing counters and latency percentiles.
+
+        Returns:
+            dict: Module name -> detections, detect hits and detect latency; invocations,
+                results, errors, timeouts, bytes processed and process latency
+        """
+        return self.metrics.get_stats()
+
     def get_enabled_modules(self):
         """
         Get list of enabled module names.
@@ -185,6 +752,21 @@ class ModuleManager:
         """
         return [name for name, spec in self.module_specs]
     
+    def get_module(self, module_name):
+        """
+        Get a loaded module by name.
+
+        Args:
+            module_name (str): Name of the module
+
+        Returns:
+            module or None: The loaded module, or None if it is not loaded
+        """
+        for module in self.modules:
+            if getattr(module, '__name__', None) == module_name:
+                return module
+        return None
+
     def get_loaded_modules_count(self):
         """
         Get count of currently loaded modules.
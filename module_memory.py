@@ -0,0 +1,146 @@
+"""
+ModuleMemoryTracker class - Opt-in attribution of retained memory to processing
+modules, using tracemalloc.
+
+Tracing is only switched on for sampled windows: at most once per sample interval,
+one clipboard change is processed with tracing on, a snapshot is taken, and tracing
+is switched off again. The snapshot is filtered by each module's file name (matching
+any frame), so memory that a module, or library code it called, allocated during
+that change and still holds afterwards is charged to that module. Every other change
+runs without tracing and pays nothing.
+"""
+
+import time
+import logging
+import threading
+import tracemalloc
+from collections import deque
+
+from constants import MODULE_MEMORY_SAMPLE_INTERVAL, MODULE_MEMORY_TRACE_FRAMES, MODULE_MEMORY_HISTORY
+
+logger = logging.getLogger("module_memory")
+
+
+class ModuleMemoryTracker:
+    """
+    Samples the memory each module retains from a change and keeps a bounded history.
+
+    While a window is open, every allocation in the process records a traceback
+    (more frames cost more), which is why windows are rare and tracking is off
+    unless 'module_memory_tracking' is enabled. Modules that run in worker processes
+    (ISOLATION = "process") are not covered.
+    """
+
+    def __init__(self, interval=MODULE_MEMORY_SAMPLE_INTERVAL, frames=MODULE_MEMORY_TRACE_FRAMES,
+                 history=MODULE_MEMORY_HISTORY, clock=time.monotonic):
+        """
+        Initialize the tracker.
+
+        Args:
+            interval (float): Minimum seconds between sampled changes
+            frames (int): Traceback depth recorded per allocation while a window is open
+            history (int): Number of samples kept
+            clock (callable): Monotonic time source (injectable for tests)
+        """
+        self.interval = interval
+        self.frames = frames
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.samples = deque(maxlen=history)
+        self._window_open = False
+        self._started_tracing = False
+        self._last_window = None
+
+    def begin(self):
+        """
+        Open a sampling window if one is due, switching tracing on.
+
+        Returns:
+            bool: True if a window was opened; the caller must then call end()
+        """
+        with self.lock:
+            now = self.clock()
+            if self._window_open or (self._last_window is not None and now - self._last_window < self.interval):
+                return False
+            self._window_open = True
+            self._last_window = now
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        return True
+
+    def end(self, module_files):
+        """
+        Close the open window: take a sample, then switch tracing off if begin() switched it on.
+
+        Args:
+            module_files (dict): Module name -> path of the module's source file
+
+        Returns:
+            dict or None: The sample, or None if no window was open
+        """
+        with self.lock:
+            if not self._window_open:
+                return None
+        try:
+            return self.sample(module_files)
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Close any open window without sampling, and stop tracing if this tracker started it."""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+        with self.lock:
+            self._window_open = False
+
+    def sample(self, module_files):
+        """
+        Take a snapshot and attribute retained memory to modules.
+
+        Args:
+            module_files (dict): Module name -> path of the module's source file
+
+        Returns:
+            dict or None: The sample, or None if tracing is off
+        """
+        if not tracemalloc.is_tracing():
+            return None
+        start = time.perf_counter()
+        snapshot = tracemalloc.take_snapshot()
+        modules = {}
+        for name, path in module_files.items():
+            traces = snapshot.filter_traces([tracemalloc.Filter(True, path, all_frames=True)]).traces
+            modules[name] = {"bytes": sum(trace.size for trace in traces), "blocks": len(traces)}
+        traced, peak = tracemalloc.get_traced_memory()
+        sample = {
+            "time": time.time(),
+            "modules": modules,
+            "traced_bytes": traced,
+            "peak_bytes": peak,
+            "sample_ms": (time.perf_counter() - start) * 1000,
+        }
+        with self.lock:
+            self.samples.append(sample)
+        return sample
+
+    def get_stats(self):
+        """
+        Get the sample history.
+
+        Returns:
+            dict: Tracing state, the bytes each module retained from the latest sampled
+                change, the mean over the kept samples, and the samples themselves
+        """
+        with self.lock:
+            samples = list(self.samples)
+        latest = samples[-1]["modules"] if samples else {}
+        return {
+            "tracing": tracemalloc.is_tracing(),
+            "interval": self.interval,
+            "latest": {name: entry["bytes"] for name, entry in latest.items()},
+            "mean": {name: sum(sample["modules"].get(name, {}).get("bytes", 0) for sample in samples) / len(samples)
+                     for name in latest},
+            "samples": samples,
+        }
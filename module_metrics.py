@@ -0,0 +1,184 @@
+"""
+ModuleMetrics class - Per-module detection and processing counters and latency
+histograms, reported through the control socket and the dashboard's /api/modules endpoint.
+"""
+
+import bisect
+import logging
+import threading
+
+from constants import MODULE_LATENCY_BUCKETS_MS
+
+logger = logging.getLogger("module_metrics")
+
+
+class LatencyHistogram:
+    """
+    A fixed-bucket latency histogram.
+
+    Recording is a binary search and an increment, and memory does not grow with
+    the number of samples. Percentiles are estimated by linear interpolation within
+    the bucket that contains them.
+    """
+
+    def __init__(self, bounds=MODULE_LATENCY_BUCKETS_MS):
+        """
+        Initialize the histogram.
+
+        Args:
+            bounds (tuple): Ascending bucket upper bounds in milliseconds; an overflow
+                bucket collects anything slower than the last bound
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value_ms):
+        """
+        Record one latency sample.
+
+        Args:
+            value_ms (float): Latency in milliseconds
+        """
+        self.counts[bisect.bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def percentile(self, fraction):
+        """
+        Estimate a percentile.
+
+        Args:
+            fraction (float): Percentile as a fraction, e.g. 0.95
+
+        Returns:
+            float: Estimated latency in milliseconds (0.0 with no samples)
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                # Never report more than the slowest sample actually seen
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * max(rank - seen, 0) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def get_stats(self):
+        """
+        Get summary statistics.
+
+        Returns:
+            dict: Count, mean, p50/p95/p99 and max in milliseconds, and per-bucket counts
+        """
+        labels = [f"<={bound:g}" for bound in self.bounds] + [f">{self.bounds[-1]:g}"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class ModuleMetrics:
+    """
+    Per-module counters and latency histograms for the processing pipeline.
+
+    Detection (a version 2 module's detect()) and processing (process()) are
+    recorded separately: detect hits count content the module claimed it could
+    handle, results count process() calls that returned something.
+    """
+
+    def __init__(self, bounds=MODULE_LATENCY_BUCKETS_MS):
+        """
+        Initialize the metrics.
+
+        Args:
+            bounds (tuple): Latency histogram bucket bounds in milliseconds
+        """
+        self.bounds = bounds
+        self.lock = threading.Lock()
+        self._modules = {}
+
+    def _state(self, name):
+        # Caller holds the lock
+        state = self._modules.get(name)
+        if state is None:
+            state = self._modules[name] = {
+                "detections": 0, "detect_hits": 0,
+                "invocations": 0, "results": 0, "errors": 0, "timeouts": 0, "bytes_processed": 0,
+                "detect_latency": LatencyHistogram(self.bounds),
+                "latency": LatencyHistogram(self.bounds),
+            }
+        return state
+
+    def record_detection(self, name, elapsed, hit=False, error=False):
+        """
+        Record one detect() call.
+
+        Args:
+            name (str): Module name
+            elapsed (float): Seconds detect() took
+            hit (bool): Whether the module scored the content above zero
+            error (bool): Whether detect() raised an exception
+        """
+        with self.lock:
+            state = self._state(name)
+            state["detections"] += 1
+            state["detect_hits"] += bool(hit)
+            state["errors"] += bool(error)
+            state["detect_latency"].record(elapsed * 1000)
+
+    def record(self, name, elapsed, byte_length, result=False, error=False, timeout=False):
+        """
+        Record one process() invocation.
+
+        Args:
+            name (str): Module name
+            elapsed (float): Seconds the module took
+            byte_length (int): Size of the content it was given, in bytes
+            result (bool): Whether process() returned a result
+            error (bool): Whether the module raised an exception
+            timeout (bool): Whether the module exceeded its time budget
+        """
+        with self.lock:
+            state = self._state(name)
+            state["invocations"] += 1
+            state["bytes_processed"] += byte_length
+            state["results"] += bool(result)
+            state["errors"] += bool(error)
+            state["timeouts"] += bool(timeout)
+            state["latency"].record(elapsed * 1000)
+
+    def reset(self):
+        """Discard all recorded metrics."""
+        with self.lock:
+            self._modules.clear()
+
+    def get_stats(self):
+        """
+        Get per-module statistics.
+
+        Returns:
+            dict: Module name -> counters, and detect and process latency summaries
+        """
+        histograms = ("detect_latency", "latency")
+        with self.lock:
+            return {
+                name: dict(
+                    {key: value for key, value in state.items() if key not in histograms},
+                    **{key: state[key].get_stats() for key in histograms},
+                )
+                for name, state in self._modules.items()
+            }
@@ -0,0 +1,234 @@
+"""
+ModuleProfiler class - Learns each module's selectivity (how often its detector
+matches) and detection cost at runtime, and orders the detection pass so that cheap,
+selective exclusive detectors are tried first.
+
+Profiles can be persisted to a JSON file so the learned order survives restarts.
+Recording only marks the profile dirty; a background thread writes it at most once
+per save interval, and shutdown writes whatever is left, so the processing path
+never waits for the disk.
+"""
+
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+
+from constants import (
+    MODULE_COST_CLASSES, DEFAULT_MODULE_COST, MODULE_COST_ESTIMATES_MS, MODULE_PROFILE_PRIOR_WEIGHT,
+    MODULE_PROFILE_SAVE_INTERVAL
+)
+from module_executor import get_module_name, get_module_priority, is_exclusive
+from module_api import has_detector
+
+logger = logging.getLogger("module_profile")
+
+
+class ModuleProfiler:
+    """
+    Per-module detection statistics and the detection order derived from them.
+
+    Estimates are smoothed towards a prior (the module's declared COST class and a
+    50% match rate) weighted as MODULE_PROFILE_PRIOR_WEIGHT observations, so a new
+    module starts where its declaration puts it and moves as evidence accumulates.
+
+    An exclusive module that matches cancels the later clipboard-modifying modules,
+    so exclusive modules are ranked by expected detection cost per match
+    (cost / match rate); other modules are ranked by detection cost alone.
+    """
+
+    def __init__(self, path=None, save_interval=MODULE_PROFILE_SAVE_INTERVAL):
+        """
+        Initialize the profiler.
+
+        Args:
+            path (str, optional): JSON file the profile is persisted to; None keeps it in memory
+            save_interval (float): Seconds between background saves of a changed profile
+        """
+        self.path = Path(path) if path else None
+        self.save_interval = save_interval
+        self.lock = threading.Lock()
+        self._profiles = {}  # Module name -> {"detections", "matches", "total_ms"}
+        self._unsaved = 0
+        self._thread = None
+        self._stop = threading.Event()
+
+    def load(self, path=None):
+        """
+        Load a persisted profile, replacing the in-memory one.
+
+        Args:
+            path (str, optional): Profile file; also becomes the file saved to
+
+        Returns:
+            bool: True if a profile was loaded
+        """
+        if path:
+            self.path = Path(path)
+        if self.path is None or not self.path.exists():
+            return False
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            profiles = {
+                name: {"detections": int(entry["detections"]), "matches": int(entry["matches"]),
+                       "total_ms": float(entry["total_ms"])}
+                for name, entry in data.get("modules", {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable module profile {self.path}: {e}")
+            return False
+        with self.lock:
+            self._profiles = profiles
+            self._unsaved = 0
+        logger.info(f"Loaded module profile for {len(profiles)} module(s)")
+        return True
+
+    def save(self):
+        """
+        Write the profile to its file, if one is set.
+
+        Returns:
+            bool: True if the profile was written
+        """
+        if self.path is None:
+            return False
+        with self.lock:
+            data = {"modules": {name: dict(entry) for name, entry in self._profiles.items()}}
+            self._unsaved = 0
+        temp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.path)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not save module profile to {self.path}: {e}")
+            return False
+
+    def record(self, name, elapsed, matched):
+        """
+        Record one detection.
+
+        Args:
+            name (str): Module name
+            elapsed (float): Seconds detection took
+            matched (bool): Whether the module matched the content
+        """
+        with self.lock:
+            entry = self._profiles.setdefault(name, {"detections": 0, "matches": 0, "total_ms": 0.0})
+            entry["detections"] += 1
+            entry["matches"] += bool(matched)
+            entry["total_ms"] += elapsed * 1000
+            self._unsaved += 1
+
+    def flush(self):
+        """
+        Save the profile if it changed since it was last saved or loaded.
+
+        Returns:
+            bool: True if the profile was written
+        """
+        with self.lock:
+            dirty = self._unsaved > 0
+        return dirty and self.save()
+
+    def start_autosave(self):
+        """Save a changed profile on a background thread every `save_interval` seconds."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(self.save_interval):
+                self.flush()
+
+        self._thread = threading.Thread(target=run, name="module-profile", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background saver and save any remaining changes."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def reset(self):
+        """Discard all recorded observations."""
+        with self.lock:
+            self._profiles.clear()
+            self._unsaved = 0
+
+    def _estimate(self, module):
+        # Caller holds the lock
+        cost_class = getattr(module, 'COST', DEFAULT_MODULE_COST)
+        if cost_class not in MODULE_COST_CLASSES:
+            cost_class = DEFAULT_MODULE_COST
+        prior_ms = MODULE_COST_ESTIMATES_MS[cost_class]
+        entry = self._profiles.get(get_module_name(module), {"detections": 0, "matches": 0, "total_ms": 0.0})
+        weight = MODULE_PROFILE_PRIOR_WEIGHT
+        cost_ms = (entry["total_ms"] + prior_ms * weight) / (entry["detections"] + weight)
+        match_rate = (entry["matches"] + 0.5 * weight) / (entry["detections"] + weight)
+        rank = cost_ms / match_rate if is_exclusive(module) else cost_ms
+        return entry, cost_class, cost_ms, match_rate, rank
+
+    def order(self, modules):
+        """
+        Sort modules into detection order.
+
+        Exclusive version 2 detectors come first, lowest expected cost per match first, since a
+        match lets the detection pass skip later modules. The others follow, cheapest
+        first. This only changes the order detectors are tried in: which modules run,
+        and the order they run and merge in, still follow priority.
+
+        Args:
+            modules (list): Modules to sort
+
+        Returns:
+            list: Modules in detection order
+        """
+        with self.lock:
+            ranks = {id(module): self._estimate(module)[4] for module in modules}
+        return sorted(modules, key=lambda module: (not (has_detector(module) and is_exclusive(module)),
+                                                   ranks[id(module)]))
+
+    def get_report(self, modules):
+        """
+        Describe the chosen detection order and the evidence behind it.
+
+        Args:
+            modules (list): Loaded modules
+
+        Returns:
+            list: One dict per module, in detection order
+        """
+        report = []
+        for position, module in enumerate(self.order(modules), start=1):
+            with self.lock:
+                entry, cost_class, cost_ms, match_rate, rank = self._estimate(module)
+            exclusive = is_exclusive(module)
+            if not has_detector(module):
+                reason = "version 1 module: detects inside process(), so detection is free and always matches"
+            elif exclusive:
+                reason = (f"exclusive: ~{cost_ms:.3f}ms per detection / {match_rate:.0%} match rate "
+                          f"= {rank:.3f}ms per match")
+            else:
+                reason = f"not exclusive, so tried after exclusive detectors; ~{cost_ms:.3f}ms per detection"
+            if has_detector(module) and not entry["detections"]:
+                reason += f" (no observations yet; declared COST '{cost_class}')"
+            report.append({
+                "position": position,
+                "name": get_module_name(module),
+                "priority": get_module_priority(module),
+                "exclusive": exclusive,
+                "detections": entry["detections"],
+                "matches": entry["matches"],
+                "match_rate": match_rate,
+                "detect_cost_ms": cost_ms,
+                "rank": rank,
+                "reason": reason,
+            })
+        return report
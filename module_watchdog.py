@@ -0,0 +1,229 @@
+"""
+ModuleWatchdog class - A per-module circuit breaker for modules that keep failing
+(raising exceptions) or exceeding their execution budget
+(performance.max_module_execution_time).
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+
+from constants import (
+    WATCHDOG_BACKOFF_AFTER, WATCHDOG_BACKOFF_INITIAL, WATCHDOG_BACKOFF_MAX, WATCHDOG_NOTIFY_INTERVAL,
+    WATCHDOG_WINDOW, WATCHDOG_MIN_CALLS, WATCHDOG_FAILURE_RATE
+)
+
+logger = logging.getLogger("module_watchdog")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class ModuleWatchdog:
+    """
+    Circuit breaker state for each module.
+
+    A module's circuit is closed (the module runs) until it trips: after
+    WATCHDOG_BACKOFF_AFTER consecutive failures, or once failures make up at least
+    WATCHDOG_FAILURE_RATE of its last WATCHDOG_WINDOW runs (with at least
+    WATCHDOG_MIN_CALLS of them). A failure is an exception or a timeout. While open,
+    the module is skipped. Once the open period passes, the circuit is half-open:
+    the next change runs the module once as a trial. A successful trial closes the
+    circuit, and a failed one opens it again for twice as long (up to
+    WATCHDOG_BACKOFF_MAX).
+    """
+
+    def __init__(self, backoff_after=WATCHDOG_BACKOFF_AFTER, backoff_initial=WATCHDOG_BACKOFF_INITIAL,
+                 backoff_max=WATCHDOG_BACKOFF_MAX, clock=time.monotonic):
+        """
+        Initialize the watchdog.
+
+        Args:
+            backoff_after (int): Consecutive failures before a module's circuit opens
+            backoff_initial (float): First open period in seconds
+            backoff_max (float): Longest open period in seconds
+            clock (callable): Monotonic time source (injectable for tests)
+        """
+        self.backoff_after = max(int(backoff_after), 1)
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self.lock = threading.Lock()
+        self._modules = {}
+
+    def _state(self, name):
+        # Caller holds the lock
+        state = self._modules.get(name)
+        if state is None:
+            state = self._modules[name] = {
+                "state": CIRCUIT_CLOSED, "timeouts": 0, "errors": 0, "consecutive": 0, "opens": 0,
+                "skipped": 0, "backoff_until": 0.0, "trial": False, "last_notified": None,
+                "recent": deque(maxlen=WATCHDOG_WINDOW),
+            }
+        return state
+
+    def is_backed_off(self, name):
+        """
+        Check whether a module's circuit is open and its open period has not passed.
+
+        Args:
+            name (str): Module name
+
+        Returns:
+            bool: True if the module is being skipped
+        """
+        with self.lock:
+            state = self._modules.get(name)
+            return state is not None and state["state"] == CIRCUIT_OPEN and self.clock() < state["backoff_until"]
+
+    def allow(self, name):
+        """
+        Decide whether a module may run on this change.
+
+        Once the open period has passed, the first caller gets the half-open trial and
+        later callers are refused until the trial's outcome is recorded (or cancelled).
+
+        Args:
+            name (str): Module name
+
+        Returns:
+            bool: True if the module should run
+        """
+        with self.lock:
+            state = self._modules.get(name)
+            if state is None or state["state"] == CIRCUIT_CLOSED:
+                return True
+            if state["state"] == CIRCUIT_OPEN and self.clock() >= state["backoff_until"]:
+                state["state"] = CIRCUIT_HALF_OPEN
+                state["trial"] = False
+            if state["state"] == CIRCUIT_HALF_OPEN and not state["trial"]:
+                state["trial"] = True
+                logger.info(f"Retrying {name} (circuit half-open)")
+                return True
+            state["skipped"] += 1
+            return False
+
+    def cancel_trial(self, name):
+        """
+        Give back a half-open trial that was granted but not used (e.g. the module was
+        filtered out for this change), so the next change can take it.
+
+        Args:
+            name (str): Module name
+        """
+        with self.lock:
+            state = self._modules.get(name)
+            if state is not None and state["state"] == CIRCUIT_HALF_OPEN:
+                state["trial"] = False
+
+    def record_success(self, name):
+        """
+        Record a run that finished within budget without raising, closing the circuit.
+
+        Args:
+            name (str): Module name
+        """
+        with self.lock:
+            state = self._state(name)
+            state["recent"].append(False)
+            state["consecutive"] = 0
+            if state["state"] != CIRCUIT_CLOSED:
+                logger.info(f"{name} recovered (circuit closed)")
+            state["state"] = CIRCUIT_CLOSED
+            state["opens"] = 0
+            state["trial"] = False
+
+    def _record_failure(self, state, now):
+        # Caller holds the lock; returns the open period in seconds, or 0
+        state["consecutive"] += 1
+        state["recent"].append(True)
+        failures = sum(state["recent"])
+        rate_tripped = (len(state["recent"]) >= WATCHDOG_MIN_CALLS
+                        and failures / len(state["recent"]) >= WATCHDOG_FAILURE_RATE)
+        if state["consecutive"] < self.backoff_after and not rate_tripped and state["state"] == CIRCUIT_CLOSED:
+            return 0
+        backoff = min(self.backoff_initial * (2 ** state["opens"]), self.backoff_max)
+        state["opens"] += 1
+        state["state"] = CIRCUIT_OPEN
+        state["backoff_until"] = now + backoff
+        state["trial"] = False
+        return backoff
+
+    def record_timeout(self, name):
+        """
+        Record a run that exceeded its budget, opening the circuit if needed.
+
+        Args:
+            name (str): Module name
+
+        Returns:
+            tuple: (open period in seconds or 0, whether the user should be notified)
+        """
+        with self.lock:
+            now = self.clock()
+            state = self._state(name)
+            state["timeouts"] += 1
+            backoff = self._record_failure(state, now)
+
+            # Rate-limit notifications per module, but always report a newly opened circuit
+            notify = (backoff > 0 or state["last_notified"] is None
+                      or now - state["last_notified"] >= WATCHDOG_NOTIFY_INTERVAL)
+            if notify:
+                state["last_notified"] = now
+            return backoff, notify
+
+    def record_error(self, name):
+        """
+        Record a run that raised an exception, opening the circuit if needed.
+
+        Args:
+            name (str): Module name
+
+        Returns:
+            tuple: (open period in seconds or 0, whether the user should be notified;
+                only a newly opened circuit is reported)
+        """
+        with self.lock:
+            now = self.clock()
+            state = self._state(name)
+            state["errors"] += 1
+            backoff = self._record_failure(state, now)
+            if backoff:
+                state["last_notified"] = now
+            return backoff, backoff > 0
+
+    def get_open_circuits(self):
+        """
+        Get the modules currently being skipped or retried.
+
+        Returns:
+            list: Names of modules whose circuit is open or half-open
+        """
+        with self.lock:
+            return [name for name, state in self._modules.items() if state["state"] != CIRCUIT_CLOSED]
+
+    def get_stats(self):
+        """
+        Get per-module circuit statistics.
+
+        Returns:
+            dict: Module name -> circuit state, total timeouts and errors, consecutive
+                failures, recent failure rate, skipped runs and remaining open seconds
+        """
+        with self.lock:
+            now = self.clock()
+            return {
+                name: {
+                    "state": state["state"],
+                    "timeouts": state["timeouts"],
+                    "errors": state["errors"],
+                    "consecutive_failures": state["consecutive"],
+                    "failure_rate": sum(state["recent"]) / len(state["recent"]) if state["recent"] else 0.0,
+                    "skipped": state["skipped"],
+                    "backoff_remaining": (max(state["backoff_until"] - now, 0.0)
+                                          if state["state"] == CIRCUIT_OPEN else 0.0),
+                }
+                for name, state in self._modules.items()
+            }
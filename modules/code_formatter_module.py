@@ -14,19 +14,35 @@ try:
     from ..utils import show_notification, validate_string_input, ContentTracker, log_event, log_error
     from ..config_manager import ConfigManager
     from ..lock_manager import LockManager
-    from ..constants import CODE_DETECTION_THRESHOLD, MIN_LINES_FOR_CODE_DETECTION, CONTENT_TRACKER_MAX_HISTORY
+    from ..constants import CODE_DETECTION_THRESHOLD, MIN_LINES_FOR_CODE_DETECTION
+    from ..clipboard_event import ClipboardEvent
+    from ..side_effects import submit_notification
+    from ..clipboard_writer import write_clipboard
+    from ..result_cache import cached_result
 except ImportError:
     # Fallback to adding parent directory to path (for standalone testing)
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from utils import show_notification, validate_string_input, ContentTracker, log_event, log_error
     from config_manager import ConfigManager
     from lock_manager import LockManager
-    from constants import CODE_DETECTION_THRESHOLD, MIN_LINES_FOR_CODE_DETECTION, CONTENT_TRACKER_MAX_HISTORY
+    from constants import CODE_DETECTION_THRESHOLD, MIN_LINES_FOR_CODE_DETECTION
+    from clipboard_event import ClipboardEvent
+    from side_effects import submit_notification
+    from clipboard_writer import write_clipboard
+    from result_cache import cached_result
 
 logger = logging.getLogger("code_formatter_module")
 
+# Execution order among modules (see module_executor) and content types routed to it
+PRIORITY = 50
+CONTENT_TYPES = ("code",)
+COST = "expensive"
+
+# Run in a worker process when performance.process_isolation is enabled (black is heavy)
+ISOLATION = "process"
+
 # Global content tracker to prevent processing loops
-_content_tracker = ContentTracker(max_history=CONTENT_TRACKER_MAX_HISTORY)
+_content_tracker = ContentTracker(namespace="code_formatter_module")
 _lock_manager = LockManager()
 
 def is_code(text):
@@ -39,7 +55,8 @@ def is_code(text):
         r'^\s*(func|struct|import|var|let|if|for|while|switch|guard)\s+',  # Swift/Go
     ]
     
-    lines = text.split('\n')
+    # Reuse the event's memoized lines when called from the pipeline
+    lines = ClipboardEvent.from_content(text).lines
     code_lines = 0
     
     for line in lines:
@@ -67,6 +84,10 @@ def format_code(code_text):
             else:
                 log_event(f"Black formatting failed: {stderr.decode('utf-8')}", level="WARNING")
                 return code_text
+        except FileNotFoundError:
+            # Formatter not installed: raise, so the module's circuit breaker stops
+            # spawning it on every copy until it is retried
+            raise
         except Exception as e:
             log_error(f"Error formatting Python code: {e}")
             return code_text
@@ -77,8 +98,8 @@ def format_code(code_text):
 
 def process(clipboard_content, config=None):
     """Process clipboard content if it appears to be code"""
-    # Prevent concurrent processing and loops
-    with _lock_manager.get_clipboard_processing_lock():
+    # Serialize this module's own runs (its own lock, so other modules are not blocked)
+    with _lock_manager.get_resource_lock("code_formatter_module"):
         # Safety check for None or empty content
         if not validate_string_input(clipboard_content, "clipboard_content"):
             return False
@@ -104,24 +125,26 @@ def process(clipboard_content, config=None):
 
             if modify_clipboard:
                 # Only format and modify clipboard if explicitly enabled
-                show_notification("Code Detected", "Formatting code...", "")
-                formatted_code = format_code(clipboard_content)
+                submit_notification(show_notification, "Code Detected", "Formatting code...", "")
+                formatted_code = cached_result(__file__, "format", clipboard_content, format_code)
                 if formatted_code != clipboard_content: # Use centralized notification
+                    # Copied here, not on the side-effect worker, so True means it was written
                     try:
-                        # Copy formatted code back to clipboard
-                        pyperclip.copy(formatted_code)
-
-                        log_event("Code formatted and copied to clipboard!")
-                        show_notification("Code Formatted", "Formatted code copied to clipboard!", "")
-                        return True
+                        write_clipboard(formatted_code, pyperclip.copy)
                     except Exception as e:
-                        log_error(f"Error copying formatted code: {e}")
+                        logger.error(f"Error copying formatted code to clipboard: {e}")
+                        return False
+
+                    log_event("Code formatted and copied to clipboard!")
+                    submit_notification(show_notification, "Code Formatted", "Formatted code copied to clipboard!", "")
+                    return True
                 else:
                     log_event("Code already properly formatted")
             else:
                 # Modification is disabled. Show an alert/notification.
                 logger.info("[yellow]Code detected but module is not allowed to modify clipboard. Alerting user.[/yellow]")
-                show_notification(
+                submit_notification(
+                    show_notification,
                     "Clipboard Access Denied",
                     "Code Formatter Module attempted to process clipboard content.",
                     "Modification is disabled. You can enable it in Preferences > Security Settings > Clipboard Modification."
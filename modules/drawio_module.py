@@ -19,16 +19,37 @@ from pathlib import Path
 try:
     from ..utils import show_notification, log_event, log_error
     from ..config_manager import ConfigManager
+    from ..side_effects import submit, submit_notification
+    from ..clipboard_writer import write_clipboard
+    from ..result_cache import cached_result
+    from ..clipboard_event import ClipboardEvent
 except ImportError:
     # This is for standalone testing
     import sys
     sys.path.append(str(Path(__file__).resolve().parents[1]))
     from utils import show_notification, log_event, log_error
     from config_manager import ConfigManager
+    from side_effects import submit, submit_notification
+    from clipboard_writer import write_clipboard
+    from result_cache import cached_result
+    from clipboard_event import ClipboardEvent
 
 
 DRAWIO_URL_TEMPLATE = "https://app.diagrams.net/?lightbox=1&edit=_blank&layers=1&nav=1#R{encoded}"
 
+# Execution order among modules (see module_executor) and content types routed to it
+PRIORITY = 20
+CONTENT_TYPES = ("drawio",)
+COST = "moderate"
+
+# The smallest valid document is <mxfile><diagram/></mxfile>; once converted to a
+# URL, no other module should process the XML
+MIN_CONTENT_SIZE = 27
+EXCLUSIVE = True
+
+# Detection is split from processing (see module_api)
+API_VERSION = 2
+
 def is_drawio_xml(xml_str):
     """
     Check if a string is valid Draw.io XML.
@@ -53,6 +74,19 @@ def encode_drawio_url(xml_str):
     return url_encoded
 
 
+def detect(event, config=None):
+    """
+    Score clipboard content without parsing it: 1.0 if it looks like a draw.io
+    document and the module is enabled, otherwise 0.0. process() still validates the XML.
+    """
+    if config is not None and not config.get("drawio_module", True):
+        return 0.0
+    text = ClipboardEvent.from_content(event).stripped
+    if text.startswith("<?xml"):
+        text = text[text.find("?>") + 2:].lstrip()
+    return 1.0 if text.startswith("<mxfile") and "<diagram" in text else 0.0
+
+
 def process(clipboard_content, config=None):
     """
     Process clipboard content for draw.io XML.
@@ -76,7 +110,7 @@ def process(clipboard_content, config=None):
 
     try:
         log_event("Encoding Draw.io URL.", level="DEBUG")
-        url_fragment = encode_drawio_url(clipboard_content)
+        url_fragment = cached_result(__file__, "url", clipboard_content, encode_drawio_url)
         full_url = DRAWIO_URL_TEMPLATE.format(encoded=url_fragment)
 
         copy_url = config.get("drawio_copy_url", True)
@@ -88,7 +122,8 @@ def process(clipboard_content, config=None):
 
         if copy_url:
             if pyperclip:
-                pyperclip.copy(full_url)
+                # Written here, so a failed write is not reported as new content
+                write_clipboard(full_url, pyperclip.copy)
                 new_clipboard_content = full_url
                 notification_message.append("URL copied to clipboard")
                 log_event("URL copied to clipboard.", level="DEBUG")
@@ -96,19 +131,19 @@ def process(clipboard_content, config=None):
                 log_error("pyperclip is not available, cannot copy URL.")
 
         if open_browser:
-            webbrowser.open_new(full_url)
+            submit(webbrowser.open_new, full_url)
             notification_message.append("opened in browser")
             log_event("Opened URL in browser.", level="DEBUG")
 
         if notification_message:
-            show_notification("Draw.io Diagram", "Draw.io XML detected! " + " and ".join(notification_message) + ".", "")
+            submit_notification(show_notification, "Draw.io Diagram", "Draw.io XML detected! " + " and ".join(notification_message) + ".", "")
             log_event(f"Draw.io diagram processed: {' and '.join(notification_message)}.", level="INFO")
         
         return new_clipboard_content
 
     except (zlib.error, base64.binascii.Error, Exception) as e:
         log_error(f"Draw.io processing failed: {e}")
-        show_notification("Draw.io Error", f"Draw.io processing failed: {e}", "")
+        submit_notification(show_notification, "Draw.io Error", f"Draw.io processing failed: {e}", "")
         return None
 
 if __name__ == '__main__':
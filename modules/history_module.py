@@ -6,8 +6,6 @@ Tracks clipboard history with timestamps and content hashing for deduplication.
 import os
 import json
 import time
-import hashlib
-import threading
 from pathlib import Path
 import sys
 import logging
@@ -22,14 +20,26 @@ except ImportError:
 from utils import validate_string_input, ContentTracker, safe_expanduser, ensure_directory_exists, log_event, log_error
 from config_manager import ConfigManager
 from lock_manager import LockManager
-from constants import DEFAULT_HISTORY_CONFIG, CONTENT_TRACKER_MAX_HISTORY
+from constants import DEFAULT_HISTORY_CONFIG
+from clipboard_event import ClipboardEvent
 
 logger = logging.getLogger("history_module")
 
+# History records oversized clipboard content from its prefix window
+WINDOWED_CONTENT = True
+
+# Runs first and only reads the clipboard, so it can run alongside the transformers
+PRIORITY = 10
+MODIFIES_CLIPBOARD = False
+CONTENT_TYPES = ("*",)
+COST = "cheap"
+
 # Global content tracker to prevent processing loops
-_content_tracker = ContentTracker(max_history=CONTENT_TRACKER_MAX_HISTORY)
-_lock_manager = LockManager() # Used by process()
-_add_to_history_lock = threading.Lock() # For add_to_history internal thread safety
+_content_tracker = ContentTracker(namespace="history_module")
+# Readers in this process share the history lock (get_history_lock()); add_to_history()
+# and clear_history() hold it alone. Other processes (the history viewers, the menu bar
+# app) only see the file lock. Fetched on each use so lock profiling applies.
+_lock_manager = LockManager()
 
 def get_history_config():
     """Get history configuration from the main config.json."""
@@ -42,10 +52,11 @@ def get_history_path():
     path = config.get('save_location', DEFAULT_HISTORY_CONFIG['save_location'])
     return safe_expanduser(path)
 
-def _acquire_file_lock(f):
+def _acquire_file_lock(f, shared=False):
     if fcntl:
         try:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            # Readers take a shared lock, so readers in different processes do not wait on each other
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
         except Exception as e: # Log if lock acquisition fails
             logger.warning(f"Failed to acquire file lock on {f.name if hasattr(f, 'name') else 'fd:'+str(f.fileno())}: {e}")
             pass # Continue without lock
@@ -59,7 +70,35 @@ def _release_file_lock(f):
             pass
 
 def load_history():
-    """Load clipboard history from file, with file lock and corruption recovery."""
+    """
+    Load clipboard history from file.
+
+    Readers in this process (such as the control socket) share the history lock, so
+    they only wait for a writer in this process. Readers in other processes (the
+    history viewers, the menu bar app) take a shared file lock and do not wait for
+    each other.
+    """
+    history_lock = _lock_manager.get_history_lock()
+    with history_lock.read_lock():
+        history = _read_history_file(repair=False)
+    if history is not None:
+        return history
+    # A corrupt file is backed up and reset only under the write lock; it is read
+    # again there, since another writer may have replaced it in the meantime
+    with history_lock.write_lock():
+        return _read_history_file()
+
+def _read_history_file(repair=True):
+    """
+    Read the history file, with file lock and corruption recovery.
+
+    Args:
+        repair (bool): Back up and reset a corrupted file. The caller must hold the
+            history write lock; with the read lock only, pass False.
+
+    Returns:
+        list or None: The history, or None if the file is corrupted and repair is False
+    """
     history_path = Path(get_history_path())
     try:
         ensure_directory_exists(str(history_path.parent))
@@ -69,13 +108,15 @@ def load_history():
         # Try to read and parse
         try:
             with history_path.open('r') as f:
-                _acquire_file_lock(f)
+                _acquire_file_lock(f, shared=True)
                 try:
                     data = json.load(f)
                     return data # Lock released in finally
                 finally:
                     _release_file_lock(f)
         except json.JSONDecodeError:
+            if not repair:
+                return None
             logger.warning(f"History file {history_path} is corrupted. Attempting backup and reset.")
             backup_path = history_path.with_suffix('.corrupt.bak')
             try:
@@ -85,17 +126,9 @@ def load_history():
                 logger.error(f"Failed to create backup of corrupted history {history_path}: {type(backup_e).__name__} - {backup_e}")
                 # Removed re-raise. If shutil.copy fails, this log is the main indicator.
 
-            # Reset the history file by writing an empty list
-            try:
-                with history_path.open('w') as f_write: # Open in write mode to truncate/overwrite
-                    _acquire_file_lock(f_write) # Lock for writing
-                    try:
-                        json.dump([], f_write)
-                    finally:
-                        _release_file_lock(f_write)
-                logger.info(f"Reset corrupted history file {history_path} to empty list.")
-            except Exception as reset_e:
-                logger.error(f"Failed to reset corrupted history file {history_path}: {reset_e}")
+            # Reset the history file by atomically replacing it with an empty list
+            _write_history_file([])
+            logger.info(f"Reset corrupted history file {history_path} to empty list.")
             return [] # Return empty list after corruption detected
         except OSError as e: # Catch OS errors from initial file open/read attempts
             logger.error(f"OSError while reading history file {history_path}: {e}")
@@ -108,7 +141,12 @@ def load_history():
     return []
 
 def save_history(history):
-    """Save clipboard history to file atomically with file lock."""
+    """Save clipboard history to file atomically."""
+    with _lock_manager.get_history_lock().write_lock():
+        _write_history_file(history)
+
+def _write_history_file(history):
+    """Write the history file atomically with file lock (caller holds the history write lock)."""
     history_path = Path(get_history_path())
     try:
         ensure_directory_exists(str(history_path.parent))
@@ -128,11 +166,10 @@ def save_history(history):
 
 def add_to_history(content):
     """Add content to clipboard history"""
-    with _add_to_history_lock: # Protect the entire read-modify-write operation
-        if not content:
-            return
+    if not content:
+        return
 
-        config = get_history_config()
+    config = get_history_config()
     max_items = config.get('max_items', DEFAULT_HISTORY_CONFIG['max_items'])
     max_content_length = config.get('max_content_length', DEFAULT_HISTORY_CONFIG['max_content_length'])
     
@@ -140,70 +177,71 @@ def add_to_history(content):
     if len(content) > max_content_length:
         content = f"{content[:max_content_length]}... (truncated)"
     
-    # Create history item
-    content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+    # Create history item (an untruncated ClipboardEvent already carries its hash)
+    content_hash = ClipboardEvent.from_content(content).content_hash
     history_item = {
         'timestamp': time.time(),
         'content': content,
         'hash': content_hash
     }
     
-    # Load existing history
-    history = load_history()
-    
-    # Check for duplicates (by hash)
-    for item in history:
-        if item.get('hash') == content_hash:
-            # Move to top of history (most recent)
-            history.remove(item)
-            item['timestamp'] = time.time()  # Update timestamp
-            history.insert(0, item)
-            save_history(history)
-            return
-    
-    # Add new item to the beginning
-    history.insert(0, history_item)
-    
-    # Trim history if needed
-    if len(history) > max_items:
-        history = history[:max_items]
-    
-    # Save updated history
-    save_history(history) # This is now inside the `with _add_to_history_lock` block
+    # Protect the entire read-modify-write of the file
+    with _lock_manager.get_history_lock().write_lock():
+        # Load existing history
+        history = _read_history_file()
+        
+        # Check for duplicates (by hash)
+        for item in history:
+            if item.get('hash') == content_hash:
+                # Move to top of history (most recent)
+                history.remove(item)
+                item['timestamp'] = time.time()  # Update timestamp
+                history.insert(0, item)
+                _write_history_file(history)
+                return
+        
+        # Add new item to the beginning
+        history.insert(0, history_item)
+        
+        # Trim history if needed
+        if len(history) > max_items:
+            history = history[:max_items]
+        
+        # Save updated history
+        _write_history_file(history)
 
 def process(clipboard_content, config=None):
     """Process clipboard content by adding it to history"""
     
-    # Prevent concurrent processing and loops
-    with _lock_manager.get_clipboard_processing_lock():
-        # Safety check for None or empty content
-        if not validate_string_input(clipboard_content, "clipboard_content"):
-            return False
-
-        # Prevent processing the same content repeatedly
-        if _content_tracker.has_processed(clipboard_content):
-            logger.debug("Skipping history tracking - content already processed recently")
-            return False
+    # History never writes the clipboard, so it takes no clipboard or module lock;
+    # add_to_history() holds the history write lock only around the file update
+    # Safety check for None or empty content
+    if not validate_string_input(clipboard_content, "clipboard_content"):
+        return False
+
+    # Prevent processing the same content repeatedly
+    if _content_tracker.has_processed(clipboard_content):
+        logger.debug("Skipping history tracking - content already processed recently")
+        return False
+    
+    try:
+        # Track this content to prevent reprocessing
+        _content_tracker.add_content(clipboard_content)
         
-        try:
-            # Track this content to prevent reprocessing
-            _content_tracker.add_content(clipboard_content)
-            
-            # Add to history
-            add_to_history(clipboard_content)
-            
-            # This module doesn't modify the clipboard, so return False
-            # to allow other modules to process the content
-            return False
-        except (OSError, json.JSONDecodeError, json.JSONEncodeError) as e:
-            logger.error(f"Error adding to history: {e}")
-            log_error(f"Error adding to history: {e}")  # Log using improved logger
-            return False
+        # Add to history
+        add_to_history(clipboard_content)
+        
+        # This module doesn't modify the clipboard, so return False
+        # to allow other modules to process the content
+        return False
+    except (OSError, json.JSONDecodeError, json.JSONEncodeError) as e:
+        logger.error(f"Error adding to history: {e}")
+        log_error(f"Error adding to history: {e}")  # Log using improved logger
+        return False
 
 def reset_content_tracker():
     """Reset the in-memory content tracker (for test isolation)."""
-    global _content_tracker
-    _content_tracker = ContentTracker(max_history=CONTENT_TRACKER_MAX_HISTORY)
+    _content_tracker.clear()
 
 # --- History Clearing Function ---
 def clear_history():
@@ -212,14 +250,15 @@ def clear_history():
     try:
         ensure_directory_exists(str(history_path.parent))
         # Overwrite the file with an empty list atomically
-        with tempfile.NamedTemporaryFile('w', dir=str(history_path.parent), delete=False) as tf:
-            _acquire_file_lock(tf)
-            json.dump([], tf, indent=2)
-            tf.flush()
-            os.fsync(tf.fileno())
-            _release_file_lock(tf)
-            temp_path = Path(tf.name)
-        temp_path.replace(history_path)
+        with _lock_manager.get_history_lock().write_lock():
+            with tempfile.NamedTemporaryFile('w', dir=str(history_path.parent), delete=False) as tf:
+                _acquire_file_lock(tf)
+                json.dump([], tf, indent=2)
+                tf.flush()
+                os.fsync(tf.fileno())
+                _release_file_lock(tf)
+                temp_path = Path(tf.name)
+            temp_path.replace(history_path)
         # Reset in-memory content tracker
         global _content_tracker
         _content_tracker.clear() # Call clear method instead of re-assigning
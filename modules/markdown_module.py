@@ -14,26 +14,69 @@ try:
     from ..utils import show_notification, validate_string_input, ContentTracker, log_event, log_error
     from ..config_manager import ConfigManager
     from ..lock_manager import LockManager
-    from ..constants import MARKDOWN_DETECTION_THRESHOLD, CONTENT_TRACKER_MAX_HISTORY
+    from ..constants import MARKDOWN_DETECTION_THRESHOLD
+    from ..clipboard_event import ClipboardEvent
+    from ..side_effects import submit_notification
+    from ..clipboard_writer import write_clipboard
+    from ..result_cache import cached_result
 except ImportError:
     # Fallback to adding parent directory to path (for standalone testing)
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from utils import show_notification, validate_string_input, ContentTracker, log_event, log_error
     from config_manager import ConfigManager
     from lock_manager import LockManager
-    from constants import MARKDOWN_DETECTION_THRESHOLD, CONTENT_TRACKER_MAX_HISTORY
+    from constants import MARKDOWN_DETECTION_THRESHOLD
+    from clipboard_event import ClipboardEvent
+    from side_effects import submit_notification
+    from clipboard_writer import write_clipboard
+    from result_cache import cached_result
 
 logger = logging.getLogger("markdown_module")
 
+# Execution order among modules (see module_executor) and content types routed to it
+PRIORITY = 40
+CONTENT_TYPES = ("markdown",)
+COST = "expensive"
+
+# Run in a worker process when performance.process_isolation is enabled (pandoc is heavy)
+ISOLATION = "process"
+
+# Strict markdown patterns, compiled once
+MARKDOWN_PATTERNS = [re.compile(pattern, re.MULTILINE) for pattern in [
+    # Headers: Must start with # followed by space and text
+    r'^\#{1,6}\s+[A-Za-z0-9].*$',
+
+    # Lists: Must start with * or - followed by space and text
+    r'^\s*[\*\-]\s+[A-Za-z0-9].*$',
+
+    # Blockquotes: Must start with > followed by space and text
+    r'^\s*>\s+[A-Za-z0-9].*$',
+
+    # Code blocks: Must be properly fenced with optional language
+    r'^```[a-zA-Z0-9]*\s*$',
+
+    # Bold: Must have content between ** with word boundaries
+    r'.*\*\*\b[A-Za-z0-9]+[^*]*\b\*\*.*',
+
+    # Italic: Must have content between single * with word boundaries
+    r'.*\b\*[A-Za-z0-9]+[^*]*\b\*.*',
+
+    # Links: Must be properly formatted [text](url)
+    r'.*\[[^\]]+\]\([^\)]+\).*',
+
+    # Tables: Must have | with content between them
+    r'^\|[^\|]+\|[^\|]*\|.*$'
+]]
+
 # Global content tracker to prevent processing loops
-_content_tracker = ContentTracker(max_history=CONTENT_TRACKER_MAX_HISTORY)
+_content_tracker = ContentTracker(namespace="markdown_module")
 _lock_manager = LockManager()
 
 def process(clipboard_content, config=None) -> bool:
     """Process clipboard content as markdown and convert to RTF if it appears to be markdown"""
 
-    # Prevent concurrent processing and loops
-    with _lock_manager.get_clipboard_processing_lock():
+    # Serialize this module's own runs (its own lock, so other modules are not blocked)
+    with _lock_manager.get_resource_lock("markdown_module"):
         # Safety check for None or empty content
         if not validate_string_input(clipboard_content, "clipboard_content"):
             return False
@@ -56,51 +99,21 @@ def process(clipboard_content, config=None) -> bool:
 
             if modify_clipboard:
                 logger.info("[cyan]Converting markdown to RTF...[/cyan]")
-                show_notification("Markdown Detected", "Converting markdown to rich text...", "")
+                submit_notification(show_notification, "Markdown Detected", "Converting markdown to rich text...", "")
 
-                rtf_text = convert_markdown_to_rtf(clipboard_content)
+                rtf_text = cached_result(__file__, "rtf", clipboard_content, convert_markdown_to_rtf)
                 if rtf_text:
-                    try:
-                        # Track this content to prevent reprocessing
-                        _content_tracker.add_content(clipboard_content)
-
-                        # Use pbcopy to set RTF content directly (macOS specific)
-                        # pbcopy automatically detects RTF if content starts with RTF header
-                        logger.info("[bold blue]ATTEMPTING TO USE PBCOPY METHOD FOR RTF CLIPBOARD HANDLING[/bold blue]")
-                        try:
-                            subprocess.run(
-                                ['pbcopy'],
-                                input=rtf_text.encode('utf-8'),
-                                check=True,
-                                timeout=5
-                            )
-                            logger.info("[green]SUCCESS: Used pbcopy for RTF clipboard handling[/green]")
-                            logger.info("[green]Converted to RTF and copied to clipboard![/green]")
-                            show_notification("Markdown Converted", "Rich text copied to clipboard!", "")
-                            
-                            # Indicate that clipboard was modified. Main app will handle history.
-                            return True 
-
-                        except subprocess.SubprocessError as e:
-                            logger.error(f"[bold red]Error using pbcopy for RTF:[/bold red] {e}")
-                            # Fall back to pyperclip if pbcopy fails
-                            logger.info("[yellow]FALLING BACK TO PYPERCLIP METHOD FOR RTF CLIPBOARD HANDLING[/yellow]")
-                            pyperclip.copy(rtf_text)
-                            logger.info("[yellow]Used pyperclip fallback for RTF copy[/yellow]")
-
-                            # Indicate that clipboard was modified. Main app will handle history.
-                            return True
-
-                    except pyperclip.PyperclipException as e:
-                        logger.error(f"[bold red]Error copying RTF to clipboard:[/bold red] {e}")
-                        return False
-                    except Exception as e:
-                        logger.error(f"[bold red]Unexpected error during RTF copy:[/bold red] {e}")
-                        return False
+                    # Track this content to prevent reprocessing
+                    _content_tracker.add_content(clipboard_content)
+
+                    # Written here, not on the side-effect worker, so the result reports whether it worked.
+                    # Main app will handle history.
+                    return _copy_rtf_to_clipboard(rtf_text)
             else:
                 # Modification is disabled. Show an alert/notification.
                 logger.info("[yellow]Markdown detected but module is not allowed to modify clipboard. Alerting user.[/yellow]")
-                show_notification(
+                submit_notification(
+                    show_notification,
                     "Clipboard Access Denied",
                     "Markdown Module attempted to process clipboard content.",
                     "Modification is disabled. You can enable it in Preferences > Security Settings > Clipboard Modification."
@@ -109,15 +122,54 @@ def process(clipboard_content, config=None) -> bool:
 
         return False    # Indicate that content was not processed
 
+def _pbcopy(text):
+    """Write text to the clipboard with pbcopy."""
+    subprocess.run(
+        ['pbcopy'],
+        input=text.encode('utf-8'),
+        check=True,
+        timeout=5
+    )
+
+def _copy_rtf_to_clipboard(rtf_text):
+    """Copy RTF to the clipboard with pbcopy, falling back to pyperclip. Returns True if it was copied."""
+    try:
+        # Use pbcopy to set RTF content directly (macOS specific)
+        # pbcopy automatically detects RTF if content starts with RTF header
+        logger.info("[bold blue]ATTEMPTING TO USE PBCOPY METHOD FOR RTF CLIPBOARD HANDLING[/bold blue]")
+        try:
+            # Recorded as our own write, so the watcher skips the change it causes
+            write_clipboard(rtf_text, _pbcopy)
+            logger.info("[green]SUCCESS: Used pbcopy for RTF clipboard handling[/green]")
+            logger.info("[green]Converted to RTF and copied to clipboard![/green]")
+            submit_notification(show_notification, "Markdown Converted", "Rich text copied to clipboard!", "")
+
+        except subprocess.SubprocessError as e:
+            logger.error(f"[bold red]Error using pbcopy for RTF:[/bold red] {e}")
+            # Fall back to pyperclip if pbcopy fails
+            logger.info("[yellow]FALLING BACK TO PYPERCLIP METHOD FOR RTF CLIPBOARD HANDLING[/yellow]")
+            write_clipboard(rtf_text, pyperclip.copy)
+            logger.info("[yellow]Used pyperclip fallback for RTF copy[/yellow]")
+        return True
+
+    except pyperclip.PyperclipException as e:
+        logger.error(f"[bold red]Error copying RTF to clipboard:[/bold red] {e}")
+    except Exception as e:
+        logger.error(f"[bold red]Unexpected error during RTF copy:[/bold red] {e}")
+    return False
+
 def is_markdown(text) -> bool:
     """Check if the text appears to be markdown with strict rules"""
     # Safety check for None or invalid content
     if not text or not isinstance(text, str):
         return False
 
+    # Reuse the event's memoized stripped text and lines when called from the pipeline
+    event = ClipboardEvent.from_content(text)
+
     try:
         # Skip empty or whitespace-only text
-        if not text.strip():
+        if not event.stripped:
             return False
 
         # Skip if it's a mermaid diagram
@@ -127,51 +179,20 @@ def is_markdown(text) -> bool:
             "journey", "gantt", "pie", "mindmap",
             "timeline", "gitGraph", "C4Context"
         ]
-        if any(text.strip().startswith(starter) for starter in mermaid_starters):
+        if any(event.stripped.startswith(starter) for starter in mermaid_starters):
             return False
 
-        # Strict markdown patterns
-        markdown_patterns = [
-            # Headers: Must start with # followed by space and text
-            r'^\#{1,6}\s+[A-Za-z0-9].*$',
-
-            # Lists: Must start with * or - followed by space and text
-            r'^\s*[\*\-]\s+[A-Za-z0-9].*$',
-
-            # Blockquotes: Must start with > followed by space and text
-            r'^\s*>\s+[A-Za-z0-9].*$',
-
-            # Code blocks: Must be properly fenced with optional language
-            r'^```[a-zA-Z0-9]*\s*$',
-
-            # Bold: Must have content between ** with word boundaries
-            r'.*\*\*\b[A-Za-z0-9]+[^*]*\b\*\*.*',
-
-            # Italic: Must have content between single * with word boundaries
-            r'.*\b\*[A-Za-z0-9]+[^*]*\b\*.*',
-
-            # Links: Must be properly formatted [text](url)
-            r'.*\[[^\]]+\]\([^\)]+\).*',
-
-            # Tables: Must have | with content between them
-            r'^\|[^\|]+\|[^\|]*\|.*$'
-        ]
-
-        # Compile patterns for better performance
-        patterns = [re.compile(pattern, re.MULTILINE) for pattern in markdown_patterns]
-
-        # Check each line against patterns
-        lines = text.split('\n')
+        # Check each non-empty line against patterns
+        lines = event.non_empty_lines
         markdown_lines = 0
-        total_lines = len([line for line in lines if line.strip()])
+        total_lines = len(lines)
 
         if total_lines == 0:
             return False
 
         for line in lines:
-            if line.strip():
-                if any(pattern.match(line.strip()) for pattern in patterns):
-                    markdown_lines += 1
+            if any(pattern.match(line) for pattern in MARKDOWN_PATTERNS):
+                markdown_lines += 1
 
         # Use constant for markdown detection threshold
         return markdown_lines > 0 and (markdown_lines / total_lines) >= MARKDOWN_DETECTION_THRESHOLD
@@ -10,9 +10,24 @@ import sys
 import os
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils import show_notification, log_event, log_error
+from side_effects import submit, submit_notification
+from clipboard_writer import write_clipboard
+from result_cache import cached_result
+from clipboard_event import ClipboardEvent
 
 MERMAID_PLAYGROUND_BASE = "https://mermaid.live/edit#"
 
+# Execution order among modules (see module_executor) and content types routed to it
+PRIORITY = 30
+CONTENT_TYPES = ("mermaid",)
+COST = "cheap"
+
+# Diagram source opened in the editor is not also treated as markdown or code
+EXCLUSIVE = True
+
+# Detection is split from processing (see module_api)
+API_VERSION = 2
+
 def is_mermaid_code(text):
     """Check if text contains Mermaid diagram code using regex patterns"""
     if not text or not isinstance(text, str):
@@ -41,7 +56,8 @@ def is_mermaid_code(text):
             r"^\s*C4Dynamic\b",
         ]
         
-        text = text.strip()
+        # Reuse the event's memoized stripped text when called from the pipeline
+        text = ClipboardEvent.from_content(text).stripped
         for pattern in mermaid_patterns:
             if re.match(pattern, text, re.IGNORECASE):
                 log_event(f"Matched Mermaid pattern: {pattern}", level="DEBUG")
@@ -68,41 +84,68 @@ def create_mermaid_url(mermaid_code, theme="default"):
         log_error(f"Error creating Mermaid URL: {str(e)}")
         return None
 
+def _read_settings(config):
+    """Read this module's settings from the module configuration"""
+    config = config or {}
+    return {
+        "theme": config.get('mermaid_editor_theme', "default"),
+        "open_browser": config.get('mermaid_open_in_browser', True),
+        "copy_code": config.get('mermaid_copy_code', True),
+        "copy_url": config.get('mermaid_copy_url', False),
+    }
+
+# Settings derived by on_config_change(), with the config snapshot they came from
+_settings_cache = (None, None)
+
+def on_config_change(config):
+    """Precompute settings when the configuration changes (called by the module manager)"""
+    global _settings_cache
+    _settings_cache = (config, _read_settings(config))
+
+def _get_settings(config):
+    """Get settings for a config, reusing the precomputed ones for the current snapshot"""
+    cached_config, settings = _settings_cache
+    if settings is not None and cached_config is config:
+        return settings
+    return _read_settings(config)
+
 def launch_mermaid_chart(mermaid_code, config=None):
     """Launch Mermaid diagram in browser and handle clipboard content"""
     try:
-        mermaid_theme = config.get('mermaid_editor_theme', "default") if config else "default"
-        url = create_mermaid_url(mermaid_code, theme=mermaid_theme)
+        settings = _get_settings(config)
+        url = cached_result(__file__, "url", mermaid_code,
+                            lambda code: create_mermaid_url(code, theme=settings["theme"]),
+                            config={"theme": settings["theme"]})
         if not url:
             return None
 
-        open_browser = config.get('mermaid_open_in_browser', True) if config else True
-        copy_code = config.get('mermaid_copy_code', True) if config else True
-        copy_url = config.get('mermaid_copy_url', False) if config else False
+        open_browser = settings["open_browser"]
+        copy_code = settings["copy_code"]
+        copy_url = settings["copy_url"]
 
         # Handle clipboard copying in the requested order: code first, then URL
         clipboard_content = None
         if copy_code and copy_url:
-            # First copy the code
-            pyperclip.copy(mermaid_code)
+            # First copy the code (written here, so a failed write is not reported as new content)
+            write_clipboard(mermaid_code, pyperclip.copy)
             log_event("Copied Mermaid code to clipboard", level="INFO")
-            show_notification("Mermaid Code", "Diagram code copied to clipboard", "")
+            submit_notification(show_notification, "Mermaid Code", "Diagram code copied to clipboard", "")
 
             # Then copy the URL
-            pyperclip.copy(url)
+            write_clipboard(url, pyperclip.copy)
             log_event("Copied Mermaid URL to clipboard", level="INFO")
-            show_notification("Mermaid URL", "URL copied to clipboard", "")
+            submit_notification(show_notification, "Mermaid URL", "URL copied to clipboard", "")
             clipboard_content = url  # Return URL as final clipboard content
         elif copy_code:
             clipboard_content = mermaid_code
-            show_notification("Mermaid Code", "Diagram code copied to clipboard", "")
+            submit_notification(show_notification, "Mermaid Code", "Diagram code copied to clipboard", "")
         elif copy_url:
             clipboard_content = url
-            show_notification("Mermaid URL", "URL copied to clipboard", "")
+            submit_notification(show_notification, "Mermaid URL", "URL copied to clipboard", "")
 
         # Open browser after clipboard operations
         if open_browser:
-            webbrowser.open_new(url)
+            submit(webbrowser.open_new, url)
             log_event("Opened Mermaid diagram in browser", level="INFO")
 
         return clipboard_content
@@ -111,6 +154,16 @@ def launch_mermaid_chart(mermaid_code, config=None):
         log_error(f"Error launching chart: {str(e)}")
         return None
 
+def _detected_mermaid(content):
+    """is_mermaid_code, computed once per clipboard change and shared by detect() and process()"""
+    if not isinstance(content, str):
+        return is_mermaid_code(content)
+    return ClipboardEvent.from_content(content).derive("mermaid_module.is_mermaid", is_mermaid_code)
+
+def detect(event, config=None):
+    """Score clipboard content: 1.0 for Mermaid diagram source, otherwise 0.0"""
+    return 1.0 if _detected_mermaid(event) else 0.0
+
 def process(clipboard_content, config=None):
     """Process clipboard content and handle Mermaid diagrams"""
     log_event("Processing clipboard content...", level="DEBUG")
@@ -119,8 +172,8 @@ def process(clipboard_content, config=None):
         return None
         
     try:
-        if is_mermaid_code(clipboard_content):
-            show_notification("Mermaid Detected", "", "Processing Mermaid diagram...")
+        if _detected_mermaid(clipboard_content):
+            submit_notification(show_notification, "Mermaid Detected", "", "Processing Mermaid diagram...")
             sanitized_content = sanitize_mermaid_content(clipboard_content)
             return launch_mermaid_chart(sanitized_content, config)
     except Exception as e:
@@ -0,0 +1,282 @@
+"""
+ModuleProcessPool class - Runs modules that declare ISOLATION = "process" in warm,
+reusable worker processes instead of the long-lived service process.
+
+Large transient allocations (e.g. converting a big markdown document) then live
+and die in a worker, a crashing module only takes its worker down, and workers are
+recycled after a number of tasks or once their peak memory passes a ceiling.
+"""
+
+import os
+import sys
+import time
+import logging
+import resource
+import threading
+import importlib.util
+import multiprocessing
+
+from constants import (
+    DEFAULT_PROCESS_POOL_WORKERS, DEFAULT_PROCESS_WORKER_MAX_TASKS, DEFAULT_PROCESS_WORKER_MAX_MEMORY
+)
+from module_executor import ModuleTimeoutError
+from clipboard_writer import get_self_write_registry
+
+logger = logging.getLogger("process_pool")
+
+
+class ModuleCrashError(RuntimeError):
+    """Raised when a worker process dies while running a module."""
+
+
+class IsolatedModuleError(RuntimeError):
+    """Raised when a module running in a worker process raises an exception."""
+
+
+def is_isolated(module):
+    """
+    Check whether a module asks to run in a worker process.
+
+    Args:
+        module: Processing module
+
+    Returns:
+        bool: True if the module declares ISOLATION = "process"
+    """
+    return getattr(module, 'ISOLATION', None) == "process"
+
+
+def _peak_rss_mb():
+    """Peak resident set size of the current process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _worker_main(conn):
+    """
+    Worker process loop: receive (name, path, content, config) tasks, run the
+    module's process() and send back ("result", status, value, peak RSS in MB).
+
+    Each clipboard write the module makes is sent as ("write", change count or None,
+    content hash) as soon as it returns, so the service process can skip the change
+    without waiting for the module to finish.
+    """
+    modules = {}
+    registry = get_self_write_registry()
+    registry.announce = lambda token, content_hash: conn.send(("write", token, content_hash))
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None:
+            break
+
+        module_name, module_path, content, config = task
+        try:
+            # Re-import the module if its file changed (e.g. after a hot reload)
+            mtime = os.stat(module_path).st_mtime_ns
+            module, loaded_mtime = modules.get(module_path, (None, None))
+            if module is None or loaded_mtime != mtime:
+                spec = importlib.util.spec_from_file_location(module_name, module_path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                modules[module_path] = (module, mtime)
+            status, value = "ok", module.process(content, config)
+        except Exception as e:
+            status, value = "error", f"{type(e).__name__}: {e}"
+
+        try:
+            conn.send(("result", status, value, _peak_rss_mb()))
+        except Exception as e:
+            # e.g. an unpicklable return value
+            conn.send(("result", "error", f"Could not return result: {e}", _peak_rss_mb()))
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,),
+                                       name="clipboard-module-worker", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        self.peak_rss_mb = 0.0
+
+    def stop(self, kill=False):
+        """Stop the worker, asking it to exit unless kill is set."""
+        try:
+            if not kill and self.process.is_alive():
+                self.conn.send(None)
+                self.process.join(timeout=1)
+        except (OSError, ValueError):
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=1)
+        self.conn.close()
+
+
+class ModuleProcessPool:
+    """
+    A small pool of worker processes that run isolated modules' process() calls.
+
+    Workers are started on first use and kept warm between calls. A worker is
+    replaced after max_tasks calls, when its peak RSS exceeds max_memory_mb, when it
+    crashes, or when a call exceeds its timeout (the worker is then killed).
+    """
+
+    def __init__(self, workers=DEFAULT_PROCESS_POOL_WORKERS, max_tasks=DEFAULT_PROCESS_WORKER_MAX_TASKS,
+                 max_memory_mb=DEFAULT_PROCESS_WORKER_MAX_MEMORY, start_method="spawn"):
+        """
+        Initialize the pool.
+
+        Args:
+            workers (int): Maximum number of worker processes
+            max_tasks (int): Calls served by a worker before it is recycled
+            max_memory_mb (float): Peak RSS in MB after which a worker is recycled
+            start_method (str): multiprocessing start method ("spawn" is safe with AppKit)
+        """
+        self.workers = max(int(workers), 1)
+        self.max_tasks = max(int(max_tasks), 1)
+        self.max_memory_mb = max_memory_mb
+        self.context = multiprocessing.get_context(start_method)
+        self.condition = threading.Condition()
+        self._idle = []
+        self._started = 0
+        self._closed = False
+        self.stats = {"tasks": 0, "recycled": 0, "crashes": 0, "timeouts": 0}
+
+    def _acquire(self):
+        """Take an idle worker, starting one if the pool is not full."""
+        with self.condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Module process pool is shut down")
+                if self._idle:
+                    return self._idle.pop()
+                if self._started < self.workers:
+                    self._started += 1
+                    break
+                self.condition.wait()
+        try:
+            return _Worker(self.context)
+        except Exception:
+            with self.condition:
+                self._started -= 1
+                self.condition.notify()
+            raise
+
+    def _release(self, worker, discard=False, kill=False):
+        """Return a worker to the pool, or replace it if it should be recycled."""
+        recycle = (discard or worker.tasks >= self.max_tasks
+                   or (self.max_memory_mb and worker.peak_rss_mb >= self.max_memory_mb))
+        if recycle and not discard:
+            self.stats["recycled"] += 1
+            logger.debug(f"Recycling module worker after {worker.tasks} tasks "
+                         f"(peak RSS {worker.peak_rss_mb:.1f}MB)")
+        with self.condition:
+            keep = not recycle and not self._closed
+            if keep:
+                self._idle.append(worker)
+            else:
+                self._started -= 1
+            self.condition.notify()
+        if not keep:
+            worker.stop(kill=kill)
+
+    def prestart(self):
+        """Start idle workers up to the pool size, so the first call does not wait for a process to start."""
+        while True:
+            with self.condition:
+                if self._closed or self._started >= self.workers:
+                    return
+                self._started += 1
+            try:
+                worker = _Worker(self.context)
+            except Exception:
+                with self.condition:
+                    self._started -= 1
+                    self.condition.notify()
+                raise
+            self._release(worker)
+
+    def run(self, module, content, config=None, timeout=None):
+        """
+        Run a module's process() in a worker process.
+
+        Args:
+            module: Processing module (must have been loaded from a file)
+            content (str): Clipboard content
+            config (dict, optional): Module configuration
+            timeout (float, optional): Seconds before the worker is killed
+
+        Returns:
+            The module's return value
+
+        Raises:
+            ModuleTimeoutError: If the call exceeded its timeout
+            ModuleCrashError: If the worker died during the call
+            IsolatedModuleError: If the module raised an exception
+        """
+        name = getattr(module, '__name__', 'unknown')
+        task = (name, module.__file__, content, config)
+        registry = get_self_write_registry()
+        deadline = time.monotonic() + timeout if timeout else None
+        worker = self._acquire()
+        try:
+            worker.conn.send(task)
+            while True:
+                finished = worker.conn.poll(max(deadline - time.monotonic(), 0)) if deadline else True
+                if not finished:
+                    break
+                message = worker.conn.recv()
+                if message[0] == "write":
+                    # A clipboard write the module just made, for the watcher to skip
+                    registry.adopt([message[1:]])
+                    continue
+                _, status, value, worker.peak_rss_mb = message
+                break
+        except (EOFError, OSError) as e:
+            self.stats["crashes"] += 1
+            self._release(worker, discard=True, kill=True)
+            raise ModuleCrashError(f"Worker process running '{name}' died: {e}") from e
+        except Exception:
+            # e.g. the task could not be pickled; the worker itself is fine
+            self._release(worker)
+            raise
+
+        if not finished:
+            self.stats["timeouts"] += 1
+            self._release(worker, discard=True, kill=True)
+            raise ModuleTimeoutError(f"Module '{name}' exceeded its {timeout * 1000:.0f}ms budget; worker killed")
+
+        worker.tasks += 1
+        self.stats["tasks"] += 1
+        self._release(worker)
+        if status != "ok":
+            raise IsolatedModuleError(value)
+        return value
+
+    def get_stats(self):
+        """
+        Get pool statistics.
+
+        Returns:
+            dict: Worker counts and task, recycle, crash and timeout totals
+        """
+        with self.condition:
+            return dict(self.stats, workers=self._started, idle=len(self._idle))
+
+    def shutdown(self):
+        """Stop all idle workers; busy workers are stopped when their call returns."""
+        with self.condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._started -= len(idle)
+            self.condition.notify_all()
+        for worker in idle:
+            worker.stop()
@@ -0,0 +1,336 @@
+"""
+ResultCache class - Caches the output of expensive, deterministic module steps
+(markdown to RTF conversion, code formatting, diagram URL encoding), so that
+copying the same content again skips the work.
+
+Entries are keyed by (module file version, operation, relevant config, content
+hash) and kept in an in-memory LRU in front of an on-disk store, both bounded by size.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+from constants import RESULT_CACHE_MEMORY_BYTES, RESULT_CACHE_DISK_BYTES
+from content_hashing import hash_text
+from clipboard_event import ClipboardEvent
+from utils import get_app_paths
+
+logger = logging.getLogger("result_cache")
+
+
+def get_source_version(path):
+    """
+    Get a version string for a module file that changes whenever the file does.
+
+    Args:
+        path (str): Path to the module file
+
+    Returns:
+        str: The file's mtime and size, or "unknown" if it cannot be read
+    """
+    try:
+        stat = os.stat(path)
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+    except (OSError, TypeError):
+        return "unknown"
+
+
+def make_cache_key(module, version, operation, config, content):
+    """
+    Build a cache key.
+
+    Args:
+        module (str): Module name
+        version (str): Module version (see get_source_version)
+        operation (str): Name of the cached step within the module
+        config: JSON-serializable settings that affect the result
+        content (str or ClipboardEvent): Input content
+
+    Returns:
+        str: Hex digest identifying the result
+    """
+    content_hash = ClipboardEvent.from_content(content).content_hash
+    parts = json.dumps([module, version, operation, config, content_hash], sort_keys=True, default=str)
+    return hash_text(parts)
+
+
+class ResultCache:
+    """
+    A two-level result cache for string results.
+
+    The memory level is an LRU bounded by the results' UTF-8 size. The disk level
+    stores one file per entry, with its modification time as its last use, and
+    evicts the least recently used files once it passes its size limit. Disk hits are
+    promoted to memory. The disk level keeps no index: its size is measured from the
+    directory on every store, so the processes sharing it (the service and its worker
+    processes) keep it within the limit together.
+    """
+
+    def __init__(self, directory=None, memory_bytes=RESULT_CACHE_MEMORY_BYTES, disk_bytes=RESULT_CACHE_DISK_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            directory (str, optional): Directory for the disk store; None for memory only
+            memory_bytes (int): Maximum size of the memory level
+            disk_bytes (int): Maximum size of the disk level
+        """
+        self.directory = Path(directory) if directory else None
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> (value, size in bytes), least recently used first
+        self._memory_size = 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def _remember(self, key, value, size):
+        # Caller holds the lock
+        if key in self._memory:
+            self._memory_size -= self._memory.pop(key)[1]
+        if size > self.memory_bytes:
+            return
+        self._memory[key] = (value, size)
+        self._memory_size += size
+        self._trim_memory()
+
+    def _trim_memory(self):
+        # Caller holds the lock
+        while self._memory_size > self.memory_bytes:
+            _, (_, size) = self._memory.popitem(last=False)
+            self._memory_size -= size
+            self.stats["evictions"] += 1
+
+    def _disk_path(self, key):
+        return self.directory / f"{key}.cache"
+
+    def _scan_disk(self):
+        """List (last use in ns, size, path) for every entry on disk, oldest first."""
+        entries = []
+        try:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".cache"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue  # Evicted by another process
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            return []
+        return sorted(entries)
+
+    def _read_disk(self, key):
+        # Caller holds the lock
+        if self.directory is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            data = path.read_bytes()
+            # The modification time records the last use, for eviction
+            now = time.time_ns()
+            os.utime(path, ns=(now, now))
+        except OSError:
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def _write_disk(self, key, data):
+        # Caller holds the lock
+        if self.directory is None or len(data) > self.disk_bytes:
+            return
+        path = self._disk_path(key)
+        # Per-process temp name: workers may store the same result at the same time
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(data)
+            now = time.time_ns()
+            os.utime(temp_path, ns=(now, now))
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write result cache entry: {e}")
+            return
+        entries = self._scan_disk()
+        total = sum(size for _, size, _ in entries)
+        for _, size, evicted in entries:
+            if total <= self.disk_bytes:
+                break
+            total -= size
+            self.stats["evictions"] += 1
+            try:
+                os.remove(evicted)
+            except OSError:
+                pass
+
+    def resize(self, memory_bytes, disk_bytes):
+        """
+        Change the size limits. The memory level is trimmed at once, the disk level on
+        the next store.
+
+        Args:
+            memory_bytes (int): Maximum size of the memory level
+            disk_bytes (int): Maximum size of the disk level
+        """
+        with self.lock:
+            self.memory_bytes = memory_bytes
+            self.disk_bytes = disk_bytes
+            self._trim_memory()
+
+    def get(self, key):
+        """
+        Look up a result.
+
+        Args:
+            key (str): Cache key from make_cache_key()
+
+        Returns:
+            str or None: The cached result, or None on a miss
+        """
+        with self.lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry[0]
+            value = self._read_disk(key)
+            if value is not None:
+                self._remember(key, value, len(value.encode("utf-8")))
+                self.stats["disk_hits"] += 1
+                return value
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key, value):
+        """
+        Store a result. Only non-empty strings are cached.
+
+        Args:
+            key (str): Cache key from make_cache_key()
+            value (str): Result to store
+        """
+        if not isinstance(value, str) or not value:
+            return
+        data = value.encode("utf-8")
+        with self.lock:
+            self._remember(key, value, len(data))
+            self._write_disk(key, data)
+            self.stats["stores"] += 1
+
+    def clear(self):
+        """Remove every entry from memory and disk."""
+        with self.lock:
+            self._memory.clear()
+            self._memory_size = 0
+            if self.directory is None:
+                return
+            for _, _, path in self._scan_disk():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def get_stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Hit, miss, store and eviction counts, hit rate, and entry counts and sizes
+        """
+        with self.lock:
+            lookups = self.stats["memory_hits"] + self.stats["disk_hits"] + self.stats["misses"]
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            disk = self._scan_disk() if self.directory is not None else None
+            return dict(
+                self.stats,
+                hit_rate=hits / lookups if lookups else 0.0,
+                memory_entries=len(self._memory),
+                memory_bytes=self._memory_size,
+                disk_entries=len(disk) if disk is not None else None,
+                disk_bytes=sum(size for _, size, _ in disk) if disk is not None else None,
+            )
+
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+_performance_config = None  # The 'performance' section the cache is configured from
+
+
+def on_config_change(performance_config):
+    """
+    Apply a changed 'performance' configuration (called by the module manager).
+
+    Args:
+        performance_config (dict): The 'performance' section
+    """
+    global _performance_config
+    with _result_cache_lock:
+        _performance_config = performance_config
+        if _result_cache is not None:
+            _result_cache.resize(
+                performance_config.get('result_cache_memory_bytes', RESULT_CACHE_MEMORY_BYTES),
+                performance_config.get('result_cache_disk_bytes', RESULT_CACHE_DISK_BYTES),
+            )
+
+
+def get_result_cache():
+    """
+    Get the process-wide result cache, sized from the 'performance' configuration.
+
+    The configuration is read once and then only updated by on_config_change(), so a
+    lookup never touches the config manager.
+
+    Returns:
+        ResultCache or None: The cache, or None if 'result_cache' is disabled
+    """
+    global _result_cache, _performance_config
+    with _result_cache_lock:
+        if _performance_config is None:
+            # First use before the module manager passed a configuration (e.g. in a worker process)
+            from config_manager import ConfigManager
+            _performance_config = ConfigManager().get_section('performance', {})
+        performance = _performance_config
+        if not performance.get('result_cache', True):
+            return None
+        if _result_cache is None:
+            _result_cache = ResultCache(
+                directory=str(Path(get_app_paths()["base_dir"]) / "result_cache"),
+                memory_bytes=performance.get('result_cache_memory_bytes', RESULT_CACHE_MEMORY_BYTES),
+                disk_bytes=performance.get('result_cache_disk_bytes', RESULT_CACHE_DISK_BYTES),
+            )
+        return _result_cache
+
+
+def cached_result(module_file, operation, content, compute, config=None):
+    """
+    Return compute(content), reusing an earlier result for the same content, module
+    version and config.
+
+    Args:
+        module_file (str): The calling module's __file__ (its version is part of the key)
+        operation (str): Name of the cached step
+        content (str or ClipboardEvent): Input content
+        compute (callable): Deterministic function of content returning a string (or None);
+            None, empty and unchanged results are not cached
+        config: JSON-serializable settings that affect the result
+
+    Returns:
+        The (possibly cached) result of compute(content)
+    """
+    cache = get_result_cache()
+    if cache is None:
+        return compute(content)
+    module = Path(module_file).stem
+    key = make_cache_key(module, get_source_version(module_file), operation, config, content)
+    value = cache.get(key)
+    if value is not None:
+        logger.debug(f"Result cache hit for {module}.{operation}")
+        return value
+    value = compute(content)
+    # Results equal to the input are not cached: steps such as code formatting return
+    # their input on failure (e.g. a missing formatter), which must not stick
+    if value != content:
+        cache.put(key, value)
+    return value
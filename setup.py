@@ -6,6 +6,23 @@ DATA_FILES = [
     'main.py',
     'clipboard_reader.py',
     'module_manager.py',
+    'control_server.py',
+    'adaptive_scheduler.py',
+    'clipboard_event.py',
+    'content_tracker.py',
+    'content_hashing.py',
+    'module_executor.py',
+    'content_router.py',
+    'module_watchdog.py',
+    'module_metrics.py',
+    'process_pool.py',
+    'side_effects.py',
+    'clipboard_writer.py',
+    'result_cache.py',
+    'module_api.py',
+    'module_profile.py',
+    'module_memory.py',
+    'event_queue.py',
     'config_manager.py',
     'constants.py',
     'utils.py',
@@ -0,0 +1,208 @@
+"""
+Side-effect executor - Runs notifications and browser opens submitted by modules
+on a background worker, so that module processing never waits on osascript or the
+browser. Clipboard writes whose success a module reports stay in process().
+
+When the worker is not running (tools, tests, isolated worker processes), actions
+run inline, exactly as if they had been called directly.
+"""
+
+import time
+import queue
+import logging
+import threading
+from collections import deque
+
+from constants import (
+    SIDE_EFFECT_QUEUE_SIZE, NOTIFICATION_DUPLICATE_WINDOW, NOTIFICATION_RATE_LIMIT, NOTIFICATION_RATE_WINDOW
+)
+
+logger = logging.getLogger("side_effects")
+
+
+class SideEffectExecutor:
+    """
+    A FIFO queue of side-effect actions served by one background thread.
+
+    Actions run in submission order, so e.g. two notifications from the same
+    module keep their order. Actions with a coalesce key are dropped while an
+    identical action is still queued. Rate-limited actions (notifications) are also
+    dropped if an identical one ran within NOTIFICATION_DUPLICATE_WINDOW seconds, or
+    if NOTIFICATION_RATE_LIMIT of them already ran within NOTIFICATION_RATE_WINDOW.
+    """
+
+    def __init__(self, max_queue=SIDE_EFFECT_QUEUE_SIZE, clock=time.monotonic):
+        """
+        Initialize the executor.
+
+        Args:
+            max_queue (int): Maximum number of queued actions
+            clock (callable): Monotonic time source (injectable for tests)
+        """
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.thread = None
+        self._pending_keys = {}
+        self._last_run = {}
+        self._recent = deque()
+        self.stats = {"submitted": 0, "executed": 0, "coalesced": 0, "rate_limited": 0, "failed": 0, "dropped": 0}
+
+    def is_running(self):
+        """Check whether the background worker is serving the queue."""
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """Start the background worker."""
+        if self.is_running():
+            return
+        self.thread = threading.Thread(target=self._serve, name="side-effects", daemon=True)
+        self.thread.start()
+        logger.debug("Side-effect executor started")
+
+    def stop(self, timeout=2.0):
+        """
+        Stop the worker after it has run the actions already queued.
+
+        Args:
+            timeout (float): Seconds to wait for the queue to drain
+        """
+        if not self.is_running():
+            return
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Side-effect queue did not drain before shutdown")
+            return
+        self.thread.join(timeout=timeout)
+        self.thread = None
+
+    def submit(self, func, *args, coalesce_key=None, rate_limited=False, **kwargs):
+        """
+        Run an action in the background, or inline if the worker is not running.
+
+        Args:
+            func (callable): The action
+            *args: Positional arguments for func
+            coalesce_key (hashable, optional): Actions with equal keys are de-duplicated
+            rate_limited (bool): Whether the action counts against the notification rate limit
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            bool: True if the action was run or queued, False if it was dropped
+        """
+        if not self.is_running():
+            self._execute(func, args, kwargs)
+            return True
+
+        with self.lock:
+            self.stats["submitted"] += 1
+            if coalesce_key is not None:
+                if self._pending_keys.get(coalesce_key):
+                    self.stats["coalesced"] += 1
+                    return False
+                self._pending_keys[coalesce_key] = self._pending_keys.get(coalesce_key, 0) + 1
+        try:
+            self.queue.put_nowait((func, args, kwargs, coalesce_key, rate_limited))
+            return True
+        except queue.Full:
+            with self.lock:
+                self.stats["dropped"] += 1
+                self._release_key(coalesce_key)
+            logger.warning(f"Side-effect queue full; dropping {getattr(func, '__name__', 'action')}")
+            return False
+
+    def _release_key(self, key):
+        # Caller holds the lock
+        if key is not None and key in self._pending_keys:
+            self._pending_keys[key] -= 1
+            if self._pending_keys[key] <= 0:
+                del self._pending_keys[key]
+
+    def _allow(self, key):
+        """Apply the duplicate window and rate limit to a rate-limited action."""
+        now = self.clock()
+        with self.lock:
+            while self._recent and now - self._recent[0] > NOTIFICATION_RATE_WINDOW:
+                self._recent.popleft()
+            last = self._last_run.get(key)
+            if (last is not None and now - last < NOTIFICATION_DUPLICATE_WINDOW) \
+                    or len(self._recent) >= NOTIFICATION_RATE_LIMIT:
+                self.stats["rate_limited"] += 1
+                return False
+            self._recent.append(now)
+            if key is not None:
+                self._last_run[key] = now
+            return True
+
+    def _execute(self, func, args, kwargs):
+        """Run one action, logging instead of raising on failure."""
+        try:
+            func(*args, **kwargs)
+            with self.lock:
+                self.stats["executed"] += 1
+        except Exception as e:
+            with self.lock:
+                self.stats["failed"] += 1
+            logger.error(f"Side effect {getattr(func, '__name__', 'action')} failed: {e}")
+
+    def _serve(self):
+        """Worker loop."""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            func, args, kwargs, key, rate_limited = item
+            with self.lock:
+                self._release_key(key)
+            if rate_limited and not self._allow(key):
+                logger.debug(f"Rate-limited side effect {getattr(func, '__name__', 'action')}{args}")
+                continue
+            self._execute(func, args, kwargs)
+
+    def get_stats(self):
+        """
+        Get executor statistics.
+
+        Returns:
+            dict: Queue depth and submitted/executed/coalesced/rate-limited/failed/dropped counts
+        """
+        with self.lock:
+            return dict(self.stats, queued=self.queue.qsize(), running=self.is_running())
+
+
+_executor = SideEffectExecutor()
+
+
+def get_side_effect_executor():
+    """Get the process-wide side-effect executor."""
+    return _executor
+
+
+def submit(func, *args, **kwargs):
+    """
+    Submit an action to the process-wide side-effect executor.
+
+    See SideEffectExecutor.submit for the arguments.
+
+    Returns:
+        bool: True if the action was run or queued, False if it was dropped
+    """
+    return _executor.submit(func, *args, **kwargs)
+
+
+def submit_notification(show, title, subtitle=None, message=None):
+    """
+    Submit a notification, coalescing and rate-limiting duplicates.
+
+    Args:
+        show (callable): Notification function, normally utils.show_notification
+        title (str): Notification title
+        subtitle (str, optional): Notification subtitle
+        message (str, optional): Notification message
+
+    Returns:
+        bool: True if the notification was shown or queued, False if it was dropped
+    """
+    return _executor.submit(show, title, subtitle, message,
+                            coalesce_key=("notification", title, subtitle, message), rate_limited=True)
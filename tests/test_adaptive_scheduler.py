@@ -0,0 +1,67 @@
+"""
+Test cases for the adaptive ("auto") clipboard check scheduler.
+"""
+import os
+import sys
+import unittest
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from adaptive_scheduler import AdaptiveScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = AdaptiveScheduler(min_interval=0.1, max_interval=2.0, backoff_factor=2.0, clock=self.clock)
+
+    def tick(self, changed, cost=0.0):
+        interval = self.scheduler.record_tick(changed, cost)
+        self.clock.now += interval
+        return interval
+
+    def test_backs_off_exponentially_when_quiet(self):
+        intervals = [self.tick(False) for _ in range(4)]
+        self.assertEqual(intervals, [0.2, 0.4, 0.8, 1.6])
+
+    def test_never_exceeds_max_interval(self):
+        for _ in range(20):
+            interval = self.tick(False)
+        self.assertEqual(interval, 2.0)
+
+    def test_activity_resets_to_min_interval(self):
+        for _ in range(10):
+            self.tick(False)
+        self.assertEqual(self.tick(True), 0.1)
+
+    def test_recent_activity_limits_backoff(self):
+        for _ in range(3):
+            self.tick(True)
+        # Shortly after a burst, the interval stays well below the maximum
+        self.assertLess(self.tick(False), 1.0)
+
+    def test_expensive_ticks_raise_interval(self):
+        # 50ms checks at a 5% duty cycle need at least 1s between them
+        self.assertGreaterEqual(self.tick(True, cost=0.25), 1.0)
+
+    def test_wakeups_per_hour_reported(self):
+        for _ in range(30):
+            self.tick(False)
+        stats = self.scheduler.get_stats()
+        self.assertEqual(stats["wakeups"], 30)
+        # Settled at one wakeup every 2s -> well under the 36000/hour of fixed 0.1s polling
+        self.assertLess(stats["wakeups_per_hour"], 3600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Test cases for bounded clipboard reads and windowed processing of oversized content.
+"""
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import read_clipboard_bounded, TruncatedContent
+from clipboard_event import ClipboardEvent
+from content_hashing import hash_bytes
+from module_manager import ModuleManager
+
+
+def _writer_cmd(payload_expr):
+    """Command that writes the given Python expression's bytes to stdout, like pbpaste."""
+    return [sys.executable, "-c", f"import sys; sys.stdout.buffer.write({payload_expr})"]
+
+
+class TestBoundedRead(unittest.TestCase):
+
+    def test_small_content_is_returned_in_full(self):
+        content = read_clipboard_bounded(_writer_cmd("b'hello\\r\\nworld'"), max_bytes=1024, window_bytes=16)
+        self.assertEqual(content, "hello\nworld")
+        self.assertNotIsInstance(content, TruncatedContent)
+
+    def test_oversized_content_keeps_only_prefix_and_hash(self):
+        size = 300000
+        content = read_clipboard_bounded(_writer_cmd(f"b'a' * {size}"), max_bytes=100000, window_bytes=1000)
+        self.assertIsInstance(content, TruncatedContent)
+        self.assertEqual(len(content), 1000)
+        self.assertEqual(content.total_bytes, size)
+        self.assertEqual(content.content_hash, hash_bytes(b"a" * size))
+
+    def test_failed_command_returns_none(self):
+        self.assertIsNone(read_clipboard_bounded([sys.executable, "-c", "import sys; sys.exit(1)"], 10, 5))
+
+    def test_stalled_command_is_killed_at_deadline(self):
+        start = time.monotonic()
+        self.assertIsNone(read_clipboard_bounded([sys.executable, "-c", "import time; time.sleep(30)"],
+                                                 10, 5, timeout=0.3))
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_truncated_read_hashes_the_canonical_form(self):
+        # CRLF pairs straddle the 64 KiB chunk boundary, and non-ASCII text is split across it
+        payload = "b'x' * 65535 + b'\\r\\n' + 'é'.encode() * 50000 + b'\\r' * 3 + b'\\xff'"
+        content = read_clipboard_bounded(_writer_cmd(payload), max_bytes=100000, window_bytes=1000)
+        canonical = "x" * 65535 + "\n" + "é" * 50000 + "\n" * 3 + "\ufffd"
+        self.assertIsInstance(content, TruncatedContent)
+        self.assertEqual(content.total_bytes, ClipboardEvent(canonical).byte_length)
+        self.assertEqual(content.content_hash, ClipboardEvent(canonical).content_hash)
+        self.assertEqual(content, TruncatedContent.from_text(canonical, 1000))
+
+    def test_truncated_content_compares_by_full_hash(self):
+        first = TruncatedContent.from_text("x" * 100 + "a", 10)
+        second = TruncatedContent.from_text("x" * 100 + "b", 10)
+        self.assertEqual(str(first), str(second))
+        self.assertNotEqual(first, second)
+        self.assertEqual(first, TruncatedContent.from_text("x" * 100 + "a", 10))
+
+
+class TestWindowedProcessing(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ModuleManager()
+        self.history = SimpleNamespace(__name__="history_module", WINDOWED_CONTENT=True,
+                                       process=MagicMock(return_value=False))
+        self.transformer = SimpleNamespace(__name__="markdown_module", process=MagicMock(return_value=False))
+        self.manager.modules = [self.history, self.transformer]
+
+    def _process(self, content, process_large_content=True):
+        config = {"process_large_content": process_large_content, "large_content_window": 50}
+        with patch.object(self.manager, "_load_performance_config", return_value=config), \
+                patch.object(self.manager, "_load_module_config", return_value={}):
+            return self.manager.process_content(content, max_size=100)
+
+    def test_oversized_content_reaches_only_windowed_modules(self):
+        self._process("y" * 500)
+        self.history.process.assert_called_once()
+        window = self.history.process.call_args[0][0]
+        self.assertEqual(len(window), 50)
+        self.transformer.process.assert_not_called()
+
+    def test_oversized_content_skipped_when_disabled(self):
+        self._process("y" * 500, process_large_content=False)
+        self.history.process.assert_not_called()
+
+    def test_size_limit_counts_bytes(self):
+        # 60 characters, but 120 bytes in UTF-8
+        self._process("é" * 60)
+        self.history.process.assert_called_once()
+        self.transformer.process.assert_not_called()
+
+    def test_normal_content_reaches_all_modules(self):
+        self._process("short text")
+        self.history.process.assert_called_once()
+        self.transformer.process.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
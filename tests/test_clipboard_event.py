@@ -0,0 +1,86 @@
+"""
+Test cases for the ClipboardEvent passed through the module pipeline.
+"""
+import os
+import sys
+import pickle
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from clipboard_event import ClipboardEvent
+from content_hashing import hash_text
+from module_manager import ModuleManager
+
+
+class TestClipboardEvent(unittest.TestCase):
+
+    def test_behaves_like_the_original_string(self):
+        event = ClipboardEvent("# Title\n\nbody")
+        self.assertEqual(event, "# Title\n\nbody")
+        self.assertTrue(event.startswith("# Title"))
+        self.assertIsInstance(event, str)
+
+    def test_derivations(self):
+        event = ClipboardEvent("  a\n\n  b  \n")
+        self.assertEqual(event.stripped, "a\n\n  b")
+        self.assertEqual(event.lines, ("  a", "", "  b  ", ""))
+        self.assertEqual(event.non_empty_lines, ("a", "b"))
+        self.assertEqual(event.byte_length, len("  a\n\n  b  \n".encode("utf-8")))
+        self.assertEqual(event.content_hash, hash_text("  a\n\n  b  \n"))
+
+    def test_hash_is_computed_once(self):
+        event = ClipboardEvent("some content")
+        with patch("clipboard_event.hash_text", wraps=hash_text) as hasher:
+            first = event.content_hash
+            second = event.content_hash
+        self.assertEqual(first, second)
+        self.assertEqual(hasher.call_count, 1)
+
+    def test_from_content_reuses_events(self):
+        event = ClipboardEvent("text")
+        self.assertIs(ClipboardEvent.from_content(event), event)
+        self.assertIsNone(ClipboardEvent.from_content(None))
+
+    def test_content_type(self):
+        self.assertEqual(ClipboardEvent("{\\rtf1 hello}").content_type, "rtf")
+        self.assertEqual(ClipboardEvent("<mxfile><diagram/></mxfile>").content_type, "drawio")
+        self.assertEqual(ClipboardEvent("graph TD\n A-->B").content_type, "mermaid")
+        self.assertEqual(ClipboardEvent("plain words").content_type, "text")
+
+    def test_pickle_keeps_memoized_values(self):
+        event = ClipboardEvent("content", content_hash="abc", truncated=True)
+        restored = pickle.loads(pickle.dumps(event))
+        self.assertEqual(restored.content_hash, "abc")
+        self.assertTrue(restored.truncated)
+
+
+class TestEventPipeline(unittest.TestCase):
+
+    def test_modules_share_one_event_per_change(self):
+        manager = ManagerWithModules(2)
+        manager.process("**bold** text")
+        first = manager.modules[0].process.call_args[0][0]
+        second = manager.modules[1].process.call_args[0][0]
+        self.assertIsInstance(first, ClipboardEvent)
+        self.assertIs(first, second)
+
+
+class ManagerWithModules(ModuleManager):
+
+    def __init__(self, count):
+        super().__init__()
+        self.modules = [SimpleNamespace(__name__=f"module_{i}", process=MagicMock(return_value=False))
+                        for i in range(count)]
+
+    def process(self, content):
+        with patch.object(self, "_load_performance_config", return_value={}), \
+                patch.object(self, "_load_module_config", return_value={}):
+            return self.process_content(content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Test cases for the self-write registry used to skip the service's own clipboard writes.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from clipboard_writer import SelfWriteRegistry
+from content_hashing import hash_text
+
+
+class FakePasteboard:
+    """A clipboard with a change count, like NSPasteboard."""
+
+    def __init__(self):
+        self.count = 100
+        self.content = ""
+
+    def change_count(self):
+        return self.count
+
+    def copy(self, text):
+        self.count += 1
+        self.content = text
+
+
+class TestSelfWriteRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.pasteboard = FakePasteboard()
+        self.registry = SelfWriteRegistry(change_count=self.pasteboard.change_count, clock=lambda: self.now)
+
+    def test_own_change_is_recognised_by_change_count(self):
+        self.registry.write("converted", self.pasteboard.copy)
+        self.assertTrue(self.registry.is_own_change(101))
+        # Consumed: the same count is not matched twice
+        self.assertFalse(self.registry.is_own_change(101))
+        self.assertEqual(self.registry.get_stats()["skipped_by_token"], 1)
+
+    def test_unconfirmed_change_is_read_and_matched_by_content(self):
+        seen = []
+
+        def write(text):
+            self.pasteboard.copy(text)
+            # The watcher polls while the write is still in progress: not skipped unread
+            seen.append(self.registry.is_own_change(self.pasteboard.count))
+            seen.append(self.registry.is_own_content(text))
+
+        self.registry.write("converted", write)
+        self.assertEqual(seen, [False, True])
+
+    def test_user_copy_during_write_is_never_skipped_unread(self):
+        def write(text):
+            self.pasteboard.copy("user text")
+            # The watcher sees the user's change before the write lands
+            self.assertFalse(self.registry.is_own_change(self.pasteboard.count))
+            self.pasteboard.copy(text)
+
+        self.registry.write("converted", write)
+        # The count moved by two, so neither change is matched by count
+        self.assertFalse(self.registry.is_own_change(102))
+        self.assertTrue(self.registry.is_own_content("converted"))
+
+    def test_later_change_forgets_earlier_writes(self):
+        self.registry.write("code", self.pasteboard.copy)
+        self.registry.write("url", self.pasteboard.copy)
+        # The watcher only saw the second write
+        self.assertTrue(self.registry.is_own_change(102))
+        self.assertEqual(self.registry.get_stats()["pending"], 0)
+
+    def test_user_change_is_not_skipped(self):
+        self.registry.write("converted", self.pasteboard.copy)
+        self.pasteboard.copy("user text")
+        self.assertFalse(self.registry.is_own_change(102))
+
+    def test_concurrent_writer_falls_back_to_content_match(self):
+        def write(text):
+            self.pasteboard.copy("another app")
+            self.pasteboard.copy(text)
+
+        self.registry.write("converted", write)
+        self.assertFalse(self.registry.is_own_change(101))
+        self.assertFalse(self.registry.is_own_change(102))
+        self.assertTrue(self.registry.is_own_content("converted"))
+
+    def test_content_match_expires(self):
+        registry = SelfWriteRegistry(change_count=lambda: None, ttl=5, clock=lambda: self.now)
+        registry.write("converted", self.pasteboard.copy)
+        self.now = 6.0
+        self.assertFalse(registry.is_own_content("converted"))
+
+    def test_failed_write_is_forgotten(self):
+        def write(text):
+            raise OSError("pbcopy failed")
+
+        with self.assertRaises(OSError):
+            self.registry.write("converted", write)
+        self.assertFalse(self.registry.is_own_content("converted"))
+        self.assertEqual(self.registry.get_stats()["failed"], 1)
+
+    def test_worker_write_is_announced_once_confirmed(self):
+        worker = SelfWriteRegistry(change_count=self.pasteboard.change_count)
+        announced = []
+        worker.announce = lambda token, content_hash: announced.append((token, content_hash))
+
+        def write(text):
+            # Nothing is announced while the write is in progress
+            self.assertEqual(announced, [])
+            self.pasteboard.copy(text)
+
+        worker.write("converted", write)
+        self.assertEqual(announced, [(101, hash_text("converted"))])
+        self.registry.adopt(announced)
+        self.assertTrue(self.registry.is_own_change(101))
+
+
+class TestWatcherSkipsOwnWrites(unittest.TestCase):
+
+    def test_enqueue_skips_content_written_by_a_module(self):
+        import main
+        registry = SelfWriteRegistry(change_count=lambda: None)
+        registry.write("converted", lambda text: None)
+        monitor = main.ClipboardMonitor.__new__(main.ClipboardMonitor)
+        monitor.last_module_output = None
+        monitor.event_queue = MagicMock()
+        with patch.object(main, "get_self_write_registry", return_value=registry):
+            self.assertFalse(monitor.enqueue_clipboard("converted"))
+            self.assertTrue(monitor.enqueue_clipboard("converted"))
+        monitor.event_queue.submit.assert_called_once_with("converted")
+
+
+if __name__ == '__main__':
+    unittest.main()
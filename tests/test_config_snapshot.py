@@ -0,0 +1,127 @@
+"""
+Test cases for versioned configuration snapshots.
+"""
+import os
+import sys
+import json
+import pickle
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config_manager import ConfigManager, FrozenDict
+from module_manager import ModuleManager
+
+
+class TestConfigSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "config.json")
+        self.write_config({"modules": {"mermaid_editor_theme": "dark"}})
+        # Bypass the singleton so each test gets its own manager
+        with patch.object(ConfigManager, "_instance", None):
+            self.manager = ConfigManager(self.config_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_config(self, config):
+        with open(self.config_path, "w") as f:
+            json.dump(config, f)
+
+    def touch_later(self):
+        # Make sure the next mtime differs even on coarse-grained filesystems
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_snapshot_is_reused_until_config_changes(self):
+        first = self.manager.snapshot()
+        self.assertIs(self.manager.snapshot(), first)
+
+        self.manager.set("general", {"debug_mode": True})
+        second = self.manager.snapshot()
+        self.assertIsNot(second, first)
+        self.assertGreater(second.version, first.version)
+
+    def test_snapshot_is_read_only(self):
+        section = self.manager.snapshot().get_section("modules")
+        self.assertIsInstance(section, dict)
+        self.assertEqual(section["mermaid_editor_theme"], "dark")
+        with self.assertRaises(TypeError):
+            section["mermaid_editor_theme"] = "forest"
+        with self.assertRaises(TypeError):
+            section.update({})
+
+    def test_snapshot_is_detached_from_live_config(self):
+        snapshot = self.manager.snapshot()
+        self.manager.config["modules"]["mermaid_editor_theme"] = "forest"
+        self.assertEqual(snapshot.get_config_value("modules", "mermaid_editor_theme"), "dark")
+
+    def test_frozen_dict_pickles(self):
+        section = self.manager.snapshot().get_section("modules")
+        restored = pickle.loads(pickle.dumps(section))
+        self.assertIsInstance(restored, FrozenDict)
+        self.assertEqual(restored, section)
+
+    def test_refresh_if_changed_only_reloads_on_file_change(self):
+        version = self.manager.snapshot().version
+        self.assertFalse(self.manager.refresh_if_changed())
+
+        self.write_config({"modules": {"mermaid_editor_theme": "forest"}})
+        self.touch_later()
+        self.assertTrue(self.manager.refresh_if_changed())
+        snapshot = self.manager.snapshot()
+        self.assertGreater(snapshot.version, version)
+        self.assertEqual(snapshot.get_config_value("modules", "mermaid_editor_theme"), "forest")
+
+
+class TestModuleConfigSubscription(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "config.json")
+        with open(self.config_path, "w") as f:
+            json.dump({}, f)
+        with patch.object(ConfigManager, "_instance", None):
+            self.config_manager = ConfigManager(self.config_path)
+        self.patcher = patch("module_manager.ConfigManager", return_value=self.config_manager)
+        self.patcher.start()
+
+        self.changes = []
+        self.seen = []
+        self.module = SimpleNamespace(
+            __name__="test_module",
+            MODIFIES_CLIPBOARD=False,
+            on_config_change=self.changes.append,
+            process=lambda content, config=None: self.seen.append(config),
+        )
+        self.manager = ModuleManager()
+        self.manager.modules = [self.module]
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.manager.shutdown()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_hook_runs_only_when_config_changes(self):
+        self.manager.process_content("first")
+        self.manager.process_content("second")
+        self.assertEqual(len(self.changes), 1)
+        # Modules receive the same frozen section the hook saw
+        self.assertIs(self.seen[0], self.changes[0])
+        self.assertIs(self.seen[1], self.changes[0])
+
+        self.config_manager.set("modules", {"test_module": True, "option": 1})
+        self.manager.process_content("third")
+        self.assertEqual(len(self.changes), 2)
+        self.assertEqual(self.changes[1]["option"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+Test cases for the streaming content hashing utility.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import content_hashing
+from content_hashing import hash_text, hash_bytes
+
+
+class TestContentHashing(unittest.TestCase):
+
+    def test_streamed_hash_matches_hash_of_full_encoding(self):
+        text = "naïve – ✓ 😀\n" * 1000
+        with patch.object(content_hashing, "HASH_CHUNK_CHARS", 7):
+            streamed = hash_text(text)
+        self.assertEqual(streamed, hash_bytes(text.encode("utf-8")))
+
+    def test_different_content_different_hash(self):
+        self.assertNotEqual(hash_text("a" * 10000 + "x"), hash_text("a" * 10000 + "y"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Test cases for the content-type router.
+"""
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from content_router import ContentRouter, PrefixTrie
+from modules.markdown_module import is_markdown
+from modules.code_formatter_module import is_code
+from modules.mermaid_module import is_mermaid_code
+from modules.drawio_module import is_drawio_xml
+
+DRAWIO_XML = '<mxfile><diagram><mxGraphModel><root><mxCell id="0"/></root></mxGraphModel></diagram></mxfile>'
+
+SAMPLES = [
+    DRAWIO_XML,
+    '<?xml version="1.0"?>\n' + DRAWIO_XML,
+    "{\\rtf1\\ansi Hello}",
+    "graph TD\n  A-->B\n  B-->C",
+    "Sequencediagram\n  Alice->>Bob: Hi",
+    "# Title\n\nSome text with **bold** words.\n\n- item one\n- item two",
+    "Plain prose with a [link](http://example.com) in it.",
+    "def main():\n    import os\n    return os.getcwd()\n",
+    "const x = 1;\nlet y = 2;\nfunction f() {}\n",
+    "Just a sentence.",
+    "if you go\nfor a walk\nwhile it rains\n",
+    "pie chart of the week",
+]
+
+
+class TestPrefixTrie(unittest.TestCase):
+
+    def test_matches_all_prefixes(self):
+        trie = PrefixTrie()
+        trie.insert("ab", 1)
+        trie.insert("abc", 2)
+        trie.insert("x", 3)
+        self.assertEqual(trie.match("abcd"), [1, 2])
+        self.assertEqual(trie.match("b"), [])
+
+
+class TestContentRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.router = ContentRouter(sample_lines=50)
+
+    def test_prefix_types_are_exclusive(self):
+        self.assertEqual(self.router.classify(DRAWIO_XML), {"drawio", "text"})
+        self.assertEqual(self.router.classify("{\\rtf1 Hello}"), {"rtf", "text"})
+
+    def test_plain_text(self):
+        self.assertEqual(self.router.classify("Just a sentence."), {"text"})
+
+    def test_never_skips_a_module_whose_detector_matches(self):
+        detectors = {"markdown": is_markdown, "code": is_code, "mermaid": is_mermaid_code, "drawio": is_drawio_xml}
+        for sample in SAMPLES:
+            types = self.router.classify(sample)
+            for content_type, detector in detectors.items():
+                if detector(sample):
+                    self.assertIn(content_type, types, f"{content_type} missed for {sample!r}")
+
+    def test_large_content_is_sampled(self):
+        content = "\n".join(["# Heading", "plain line", "- item"] * 1000)
+        self.assertIn("markdown", self.router.classify(content))
+        self.assertNotIn("code", self.router.classify(content))
+
+    def test_route_selects_matching_modules(self):
+        history = SimpleNamespace(__name__="history", CONTENT_TYPES=("*",))
+        drawio = SimpleNamespace(__name__="drawio", CONTENT_TYPES=("drawio",))
+        markdown = SimpleNamespace(__name__="markdown", CONTENT_TYPES=("markdown",))
+        legacy = SimpleNamespace(__name__="legacy")
+        modules = [history, drawio, markdown, legacy]
+        self.assertEqual(self.router.route(modules, DRAWIO_XML), [history, drawio, legacy])
+        self.assertEqual(self.router.route(modules, "# Title\n- item"), [history, markdown, legacy])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Test cases for the shared, namespaced LRU content store.
+"""
+import os
+import sys
+import unittest
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from content_tracker import ContentStore
+from utils import ContentTracker
+
+
+class TestContentStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ContentStore(capacity=3)
+
+    def test_add_and_contains(self):
+        self.store.add("markdown", "h1")
+        self.assertTrue(self.store.contains("markdown", "h1"))
+        self.assertFalse(self.store.contains("markdown", "h2"))
+
+    def test_namespaces_are_independent(self):
+        self.store.add("markdown", "h1")
+        self.assertFalse(self.store.contains("history", "h1"))
+
+    def test_evicts_least_recently_used(self):
+        for content_hash in ("h1", "h2", "h3"):
+            self.store.add("ns", content_hash)
+        # Looking up h1 makes h2 the oldest entry
+        self.assertTrue(self.store.contains("ns", "h1"))
+        self.store.add("ns", "h4")
+        self.assertFalse(self.store.contains("ns", "h2"))
+        self.assertTrue(self.store.contains("ns", "h1"))
+        self.assertEqual(self.store.size("ns"), 3)
+
+    def test_capacity_per_namespace(self):
+        self.store.set_capacity("small", 1)
+        self.store.add("small", "h1")
+        self.store.add("small", "h2")
+        self.assertEqual(self.store.size("small"), 1)
+
+    def test_stats(self):
+        self.store.add("ns", "h1")
+        self.store.contains("ns", "h1")
+        self.store.contains("ns", "missing")
+        for content_hash in ("h2", "h3", "h4"):
+            self.store.add("ns", content_hash)
+        stats = self.store.get_stats()["ns"]
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_clear_single_namespace(self):
+        self.store.add("a", "h1")
+        self.store.add("b", "h1")
+        self.store.clear("a")
+        self.assertFalse(self.store.contains("a", "h1"))
+        self.assertTrue(self.store.contains("b", "h1"))
+
+
+class TestContentTracker(unittest.TestCase):
+
+    def test_large_content_hashes_whole_content(self):
+        tracker = ContentTracker()
+        base = "a" * 6000 + "{}" + "b" * 6000
+        tracker.add_content(base.format("x"))
+        # Differs only in the middle, which the old first/last 5000 chars hash ignored
+        self.assertFalse(tracker.has_processed(base.format("y")))
+        self.assertTrue(tracker.has_processed(base.format("x")))
+
+    def test_named_trackers_share_a_namespace(self):
+        first = ContentTracker(namespace="test_shared_namespace")
+        second = ContentTracker(namespace="test_shared_namespace")
+        first.clear()
+        first.add_content("shared content")
+        self.assertTrue(second.has_processed("shared content"))
+        first.clear()
+
+    def test_unnamed_trackers_are_private(self):
+        first = ContentTracker()
+        first.add_content("private content")
+        self.assertFalse(ContentTracker().has_processed("private content"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Test cases for the service control socket.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from control_server import ControlServer, send_control_command
+
+
+class TestControlServer(unittest.TestCase):
+
+    def setUp(self):
+        # Keep the path short: Unix socket paths are limited to ~104 bytes on macOS
+        self.test_dir = tempfile.mkdtemp(prefix="cm")
+        self.socket_path = os.path.join(self.test_dir, "control.sock")
+        self.server = ControlServer(self.socket_path)
+        self.paused = False
+
+        def pause(args):
+            self.paused = True
+            return {"paused": True}
+
+        self.server.register("ping", lambda args: {"pong": True})
+        self.server.register("pause", pause)
+        self.server.register("echo", lambda args: args)
+        self.assertTrue(self.server.start())
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.test_dir)
+
+    def test_ping(self):
+        response = send_control_command("ping", socket_path=self.socket_path)
+        self.assertEqual(response, {"ok": True, "result": {"pong": True}})
+
+    def test_command_changes_service_state(self):
+        response = send_control_command("pause", socket_path=self.socket_path)
+        self.assertTrue(response["ok"])
+        self.assertTrue(self.paused)
+
+    def test_arguments_are_passed_to_handler(self):
+        response = send_control_command("echo", socket_path=self.socket_path, value=42)
+        self.assertEqual(response["result"], {"value": 42})
+
+    def test_unknown_command(self):
+        response = send_control_command("bogus", socket_path=self.socket_path)
+        self.assertFalse(response["ok"])
+        self.assertIn("unknown command", response["error"])
+
+    def test_handler_error_is_reported(self):
+        self.server.register("boom", lambda args: 1 / 0)
+        response = send_control_command("boom", socket_path=self.socket_path)
+        self.assertFalse(response["ok"])
+
+    def test_unreachable_service_returns_none(self):
+        self.server.stop()
+        self.assertIsNone(send_control_command("ping", socket_path=self.socket_path))
+
+    def test_stale_socket_is_replaced(self):
+        self.server.stop()
+        # Leave a dead socket file behind, as after a crash
+        with open(self.socket_path, "w"):
+            pass
+        self.server = ControlServer(self.socket_path)
+        self.server.register("ping", lambda args: {"pong": True})
+        self.assertTrue(self.server.start())
+        self.assertTrue(send_control_command("ping", socket_path=self.socket_path)["ok"])
+
+    def test_second_server_refuses_live_socket(self):
+        other = ControlServer(self.socket_path)
+        self.assertFalse(other.start())
+
+
+class TestPauseCommands(unittest.TestCase):
+
+    def setUp(self):
+        import main
+        self.main = main
+        self.test_dir = tempfile.mkdtemp(prefix="cm")
+        self.flag = os.path.join(self.test_dir, "pause_flag")
+        self.paths_patcher = patch.dict(main.paths, {"pause_flag": self.flag})
+        self.paths_patcher.start()
+        self.monitor = main.ClipboardMonitor.__new__(main.ClipboardMonitor)
+
+    def tearDown(self):
+        self.paths_patcher.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_pause_persists_across_restart(self):
+        self.monitor._cmd_pause({})
+        self.assertTrue(self.monitor.paused)
+        self.assertTrue(os.path.exists(self.flag))
+
+        self.monitor._cmd_resume({})
+        self.assertFalse(self.monitor.paused)
+        self.assertFalse(os.path.exists(self.flag))
+
+    def test_flag_file_pauses_while_the_control_server_runs(self):
+        self.monitor.paused = False
+        self.monitor.control_server = MagicMock(is_running=MagicMock(return_value=True))
+        self.assertFalse(self.monitor.is_paused())
+        with open(self.flag, "w") as f:
+            f.write("paused")
+        self.assertTrue(self.monitor.is_paused())
+        os.remove(self.flag)
+        self.assertFalse(self.monitor.is_paused())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Test cases for the coalescing clipboard event queue.
+"""
+import os
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from event_queue import ClipboardEventQueue
+from module_manager import ModuleManager
+
+
+class TestClipboardEventQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.processed = []
+        self.recorded = []
+        self.queue = ClipboardEventQueue(self.processed.append, record=self.recorded.append)
+
+    def tearDown(self):
+        self.queue.stop()
+
+    def block_worker(self):
+        """Occupy the worker with a first event until the returned event is set."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow(content):
+            if content == "first":
+                started.set()
+                release.wait(5)
+            self.processed.append(content)
+
+        self.queue.process = slow
+        self.queue.start()
+        self.queue.submit("first")
+        started.wait(2)
+        return release
+
+    def test_processes_inline_when_not_started(self):
+        self.queue.submit("a")
+        self.assertEqual(self.processed, ["a"])
+
+    def test_submit_does_not_wait_for_processing(self):
+        release = self.block_worker()
+        self.queue.submit("second")
+        self.assertEqual(self.queue.get_stats()["depth"], 1)
+        release.set()
+        self.queue.stop()
+        self.assertEqual(self.processed, ["first", "second"])
+
+    def test_backlog_is_recorded_but_only_latest_transformed(self):
+        release = self.block_worker()
+        for content in ("a", "b", "c"):
+            self.queue.submit(content)
+        release.set()
+        self.queue.stop()
+
+        self.assertEqual(self.recorded, ["a", "b"])
+        self.assertEqual(self.processed, ["first", "c"])
+        stats = self.queue.get_stats()
+        self.assertEqual(stats["coalesced"], 2)
+        self.assertEqual(stats["max_depth"], 3)
+        self.assertEqual(stats["depth"], 0)
+
+    def test_without_coalescing_every_event_is_processed(self):
+        self.queue.coalesce = False
+        release = self.block_worker()
+        for content in ("a", "b"):
+            self.queue.submit(content)
+        release.set()
+        self.queue.stop()
+        self.assertEqual(self.processed, ["first", "a", "b"])
+        self.assertEqual(self.recorded, [])
+
+    def test_full_queue_drops_oldest(self):
+        self.queue.max_size = 2
+        release = self.block_worker()
+        for content in ("a", "b", "c"):
+            self.queue.submit(content)
+        release.set()
+        self.queue.stop()
+
+        self.assertEqual(self.recorded, ["b"])
+        self.assertEqual(self.processed, ["first", "c"])
+        self.assertEqual(self.queue.get_stats()["dropped"], 1)
+
+    def test_failure_is_logged_not_raised(self):
+        def fail(content):
+            raise RuntimeError("boom")
+
+        self.queue.process = fail
+        self.queue.start()
+        self.queue.submit("a")
+        self.queue.stop()
+        self.assertEqual(self.queue.get_stats()["failed"], 1)
+
+
+class TestObserverOnlyProcessing(unittest.TestCase):
+
+    def setUp(self):
+        self.patcher = patch("module_manager.ConfigManager")
+        mock_config = self.patcher.start()
+        mock_config.return_value.get_section.return_value = {}
+        self.calls = []
+        self.manager = ModuleManager()
+        self.manager._load_module_config = lambda snapshot=None: {}
+        self.manager._load_performance_config = lambda snapshot=None: {}
+        self.manager.modules = [
+            SimpleNamespace(__name__="history_module", MODIFIES_CLIPBOARD=False,
+                            process=lambda content, config=None: self.calls.append("history")),
+            SimpleNamespace(__name__="formatter", MODIFIES_CLIPBOARD=True,
+                            process=lambda content, config=None: self.calls.append("formatter")),
+        ]
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.manager.shutdown()
+
+    def test_observers_only_skips_transformers(self):
+        self.manager.process_content("old", observers_only=True)
+        self.assertEqual(self.calls, ["history"])
+
+        self.manager.process_content("new")
+        self.assertEqual(self.calls, ["history", "history", "formatter"])
+
+
+if __name__ == '__main__':
+    unittest.main()
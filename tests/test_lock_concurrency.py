@@ -0,0 +1,139 @@
+"""
+Test cases for per-resource locks and the history reader/writer lock.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lock_manager import LockManager, ReadWriteLock
+from module_executor import ModuleExecutor
+import modules.history_module as history_module
+
+
+class TestReadWriteLock(unittest.TestCase):
+
+    def test_readers_share_the_lock(self):
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=2)
+        errors = []
+
+        def reader():
+            with lock.read_lock():
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        self.assertEqual(errors, [])
+
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        entered = threading.Event()
+        lock.acquire_write()
+        reader = threading.Thread(target=lambda: (lock.acquire_read(), entered.set(), lock.release_read()))
+        reader.start()
+        self.assertFalse(entered.wait(0.2))
+        lock.release_write()
+        self.assertTrue(entered.wait(2))
+        reader.join(timeout=2)
+
+
+class TestResourceLocks(unittest.TestCase):
+
+    def test_same_name_returns_same_lock(self):
+        manager = LockManager()
+        self.assertIs(manager.get_resource_lock("a_module"), manager.get_resource_lock("a_module"))
+        self.assertIsNot(manager.get_resource_lock("a_module"), manager.get_resource_lock("b_module"))
+
+    def test_modules_with_their_own_locks_run_concurrently(self):
+        manager = LockManager()
+        barrier = threading.Barrier(2, timeout=2)
+
+        def make_module(name):
+            def process(content, config=None):
+                with manager.get_resource_lock(name):
+                    barrier.wait()
+                return False
+            return SimpleNamespace(__name__=name, process=process, MODIFIES_CLIPBOARD=False)
+
+        executor = ModuleExecutor(max_workers=2)
+        try:
+            outcomes = executor.run([make_module("first_module"), make_module("second_module")],
+                                    lambda module: module.process("x"), parallel=True)
+        finally:
+            executor.shutdown()
+        self.assertEqual([outcome.error for outcome in outcomes], [None, None])
+
+
+class TestHistoryLocking(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "history.json")
+        self.path_patcher = patch.object(history_module, "get_history_path", return_value=self.path)
+        self.path_patcher.start()
+
+    def tearDown(self):
+        self.path_patcher.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_history_reads_do_not_wait_for_module_execution(self):
+        history_module.save_history([{"content": "x", "hash": "h", "timestamp": 0}])
+        result = []
+        with LockManager().get_module_execution_lock():
+            reader = threading.Thread(target=lambda: result.append(history_module.load_history()))
+            reader.start()
+            reader.join(timeout=2)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0][0]["content"], "x")
+
+    @unittest.skipIf(history_module.fcntl is None, "fcntl is not available")
+    def test_reads_take_a_shared_file_lock(self):
+        history_module.save_history([])
+        fcntl = history_module.fcntl
+        with patch.object(fcntl, "flock", wraps=fcntl.flock) as flock:
+            history_module.load_history()
+        self.assertIn(fcntl.LOCK_SH, [call.args[1] for call in flock.call_args_list])
+        self.assertNotIn(fcntl.LOCK_EX, [call.args[1] for call in flock.call_args_list])
+
+    def test_corrupt_file_is_reset_under_the_write_lock(self):
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        history_lock = history_module._lock_manager.get_history_lock()
+        states = []
+        write = history_module._write_history_file
+
+        def checked_write(history):
+            states.append((history_lock._writer, history_lock._readers))
+            write(history)
+
+        with patch.object(history_module, "_write_history_file", side_effect=checked_write):
+            self.assertEqual(history_module.load_history(), [])
+        self.assertEqual(states, [(True, 0)])
+        self.assertTrue(os.path.exists(self.path.replace(".json", ".corrupt.bak")))
+        self.assertEqual(history_module.load_history(), [])
+
+    def test_concurrent_adds_are_not_lost(self):
+        threads = [threading.Thread(target=history_module.add_to_history, args=(f"item {i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        self.assertEqual(len(history_module.load_history()), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
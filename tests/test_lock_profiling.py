@@ -0,0 +1,108 @@
+"""
+Test cases for instrumented lock profiling.
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lock_manager import (
+    LockManager, LockStats, InstrumentedLock, InstrumentedReadWriteLock, ReadWriteLock
+)
+
+
+def hold_then_release(lock, held, release):
+    """Acquire lock, signal, and release once told to."""
+    with lock:
+        held.set()
+        release.wait(2)
+
+
+class TestInstrumentedLock(unittest.TestCase):
+
+    def test_uncontended_acquisitions_record_hold_time(self):
+        lock = InstrumentedLock(threading.Lock(), LockStats("test"))
+        with lock:
+            time.sleep(0.01)
+        stats = lock.stats.snapshot()
+        self.assertEqual(stats["acquisitions"], 1)
+        self.assertEqual(stats["contended"], 0)
+        self.assertGreaterEqual(stats["hold_max_ms"], 10)
+        self.assertEqual(stats["top_waiters"], [])
+
+    def test_contended_acquisition_records_wait_and_call_site(self):
+        lock = InstrumentedLock(threading.Lock(), LockStats("test"))
+        held, release = threading.Event(), threading.Event()
+        holder = threading.Thread(target=hold_then_release, args=(lock, held, release))
+        holder.start()
+        held.wait(2)
+        threading.Timer(0.05, release.set).start()
+        with lock:
+            pass
+        holder.join(timeout=2)
+
+        stats = lock.stats.snapshot()
+        self.assertEqual(stats["contended"], 1)
+        self.assertGreaterEqual(stats["wait_max_ms"], 40)
+        self.assertEqual(len(stats["top_waiters"]), 1)
+        self.assertIn("test_lock_profiling.py", stats["top_waiters"][0]["site"])
+
+    def test_non_blocking_acquire_fails_without_recording(self):
+        raw = threading.Lock()
+        lock = InstrumentedLock(raw, LockStats("test"))
+        raw.acquire()
+        try:
+            self.assertFalse(lock.acquire(blocking=False))
+        finally:
+            raw.release()
+        self.assertEqual(lock.stats.snapshot()["acquisitions"], 0)
+
+    def test_read_and_write_are_recorded_separately(self):
+        lock = InstrumentedReadWriteLock(ReadWriteLock(), LockStats("h.read"), LockStats("h.write"))
+        with lock.read_lock():
+            with lock.read_lock():
+                pass
+        with lock.write_lock():
+            pass
+        self.assertEqual(lock.read_stats.snapshot()["acquisitions"], 2)
+        self.assertEqual(lock.write_stats.snapshot()["acquisitions"], 1)
+
+
+class TestLockManagerProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = LockManager()
+
+    def tearDown(self):
+        self.manager.enable_profiling(False)
+        self.manager.reset_lock_stats()
+
+    def test_profiling_off_returns_plain_locks(self):
+        self.assertIs(self.manager.get_module_execution_lock(), self.manager.module_execution_lock)
+
+    def test_profiling_wraps_the_shared_lock(self):
+        self.manager.enable_profiling()
+        wrapped = self.manager.get_resource_lock("profiled_module")
+        self.assertIsInstance(wrapped, InstrumentedLock)
+        self.assertIs(wrapped, self.manager.get_resource_lock("profiled_module"))
+        with wrapped:
+            # Plain and wrapped users exclude each other
+            self.assertTrue(self.manager.resource_locks["profiled_module"].locked())
+        with self.manager.get_history_lock().read_lock():
+            pass
+
+        locks = self.manager.get_lock_stats()["locks"]
+        self.assertTrue(self.manager.get_lock_stats()["profiling"])
+        self.assertEqual(locks["resource:profiled_module"]["acquisitions"], 1)
+        self.assertEqual(locks["history.read"]["acquisitions"], 1)
+
+        self.manager.reset_lock_stats()
+        self.assertEqual(self.manager.get_lock_stats()["locks"]["history.read"]["acquisitions"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Test cases for the version 2 module API (detect() split from process()).
+"""
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from clipboard_event import ClipboardEvent
+from module_api import detect, run_detectors, has_detector
+from module_manager import ModuleManager
+from lock_manager import LockManager
+from modules import drawio_module, mermaid_module
+
+
+def make_module(name, score=None, result=None, exclusive=False, modifies=True, log=None):
+    """Build a fake module; a score makes it a version 2 module."""
+    def process(content, config=None):
+        if log is not None:
+            log.append(("process", name))
+        return result
+
+    module = SimpleNamespace(__name__=name, process=process, MODIFIES_CLIPBOARD=modifies, EXCLUSIVE=exclusive)
+    if score is not None:
+        def detect_(event, config=None):
+            if log is not None:
+                log.append(("detect", name))
+            return score
+        module.API_VERSION = 2
+        module.detect = detect_
+    return module
+
+
+class TestDetection(unittest.TestCase):
+
+    def test_v1_module_always_matches(self):
+        module = make_module("legacy")
+        self.assertFalse(has_detector(module))
+        self.assertEqual(detect(module, ClipboardEvent("x")).score, 1.0)
+
+    def test_detector_error_is_no_match(self):
+        module = make_module("broken", score=1.0)
+
+        def fail(event, config=None):
+            raise ValueError("boom")
+        module.detect = fail
+        detection = detect(module, ClipboardEvent("x"))
+        self.assertEqual(detection.score, 0.0)
+        self.assertIsInstance(detection.error, ValueError)
+
+    def test_exclusive_match_cancels_later_transformers(self):
+        log = []
+        modules = [make_module("diagram", score=1.0, exclusive=True, log=log),
+                   make_module("formatter", score=1.0, log=log),
+                   make_module("legacy", log=log),
+                   make_module("history", score=1.0, modifies=False, log=log)]
+        selected, detections = run_detectors(modules, ClipboardEvent("x"))
+        self.assertEqual([module.__name__ for module in selected], ["diagram", "history"])
+        self.assertEqual([detection.name for detection in detections], ["diagram", "history"])
+        self.assertEqual(log, [("detect", "diagram"), ("detect", "history")])
+
+    def test_non_matching_exclusive_does_not_claim(self):
+        modules = [make_module("diagram", score=0.0, exclusive=True), make_module("formatter", score=0.5)]
+        selected, _ = run_detectors(modules, ClipboardEvent("x"))
+        self.assertEqual([module.__name__ for module in selected], ["formatter"])
+
+
+class TestDetectionInManager(unittest.TestCase):
+
+    def _process(self, modules, manager=None):
+        manager = manager or ModuleManager()
+        manager.modules = modules
+        with patch.object(manager, "_load_performance_config", return_value={"content_routing": False}), \
+                patch.object(manager, "_load_module_config", return_value={}):
+            try:
+                return manager.process_content("some content")
+            finally:
+                manager.shutdown()
+
+    def test_only_matching_processors_run(self):
+        log = []
+        result = self._process([make_module("miss", score=0.0, result="miss", log=log),
+                                make_module("hit", score=1.0, result="hit", log=log),
+                                make_module("legacy", log=log)])
+        self.assertEqual(result, "hit")
+        self.assertNotIn(("process", "miss"), log)
+        self.assertIn(("process", "legacy"), log)
+
+    def test_detection_runs_outside_the_execution_lock(self):
+        lock_held = []
+        module = make_module("hit", score=1.0, result="hit")
+
+        def detect_(event, config=None):
+            lock_held.append(LockManager().module_execution_lock.locked())
+            return 1.0
+        module.detect = detect_
+        self.assertEqual(self._process([module]), "hit")
+        self.assertEqual(lock_held, [False])
+
+    def test_superseded_change_runs_only_observers(self):
+        log = []
+        manager = ModuleManager()
+
+        def detect_newer_change(event, config=None):
+            # A newer change is admitted while this one is being detected
+            manager.last_processed_hash = "newer"
+            return 1.0
+        formatter = make_module("formatter", score=1.0, result="formatted", log=log)
+        formatter.detect = detect_newer_change
+        self.assertIsNone(self._process([formatter, make_module("history", modifies=False, log=log)], manager))
+        self.assertEqual(log, [("process", "history")])
+
+    def test_v2_module_without_detect_is_rejected(self):
+        module = make_module("incomplete")
+        module.API_VERSION = 2
+        self.assertFalse(ModuleManager()._validate_module(module))
+
+
+class TestBundledDetectors(unittest.TestCase):
+
+    def test_mermaid_detect(self):
+        self.assertEqual(mermaid_module.detect(ClipboardEvent("graph TD\n  A --> B")), 1.0)
+        self.assertEqual(mermaid_module.detect(ClipboardEvent("plain text")), 0.0)
+
+    def test_drawio_detect(self):
+        xml = '<?xml version="1.0"?>\n<mxfile><diagram id="a">x</diagram></mxfile>'
+        self.assertEqual(drawio_module.detect(ClipboardEvent(xml)), 1.0)
+        self.assertEqual(drawio_module.detect(ClipboardEvent(xml), {"drawio_module": False}), 0.0)
+        self.assertEqual(drawio_module.detect(ClipboardEvent("<html></html>")), 0.0)
+
+    def test_mermaid_process_reuses_the_detect_result(self):
+        event = ClipboardEvent("graph TD\n  A --> B")
+        with patch.object(mermaid_module, "is_mermaid_code", wraps=mermaid_module.is_mermaid_code) as check, \
+                patch.object(mermaid_module, "launch_mermaid_chart", return_value=None), \
+                patch.object(mermaid_module, "submit_notification"):
+            self.assertEqual(mermaid_module.detect(event), 1.0)
+            mermaid_module.process(event)
+        self.assertEqual(check.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
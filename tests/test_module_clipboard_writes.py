@@ -0,0 +1,70 @@
+"""
+Test cases for modules reporting whether their clipboard write happened.
+"""
+import os
+import sys
+import subprocess
+import unittest
+from unittest.mock import patch
+
+import pyperclip
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import markdown_module, code_formatter_module
+
+
+def fail_write(text):
+    raise pyperclip.PyperclipException("no clipboard")
+
+
+class TestMarkdownWrite(unittest.TestCase):
+
+    def setUp(self):
+        markdown_module._content_tracker.clear()
+        patches = [
+            patch.object(markdown_module, "is_markdown", return_value=True),
+            patch.object(markdown_module, "cached_result", return_value="{\\rtf1 converted}"),
+            patch.object(markdown_module, "show_notification"),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_written_rtf_reports_modified(self):
+        with patch.object(markdown_module, "_pbcopy") as pbcopy:
+            self.assertTrue(markdown_module.process("# Title", {"markdown_modify_clipboard": True}))
+        pbcopy.assert_called_once_with("{\\rtf1 converted}")
+
+    def test_failed_write_reports_not_modified(self):
+        with patch.object(markdown_module, "_pbcopy", side_effect=subprocess.SubprocessError("pbcopy")), \
+                patch.object(markdown_module.pyperclip, "copy", side_effect=fail_write):
+            self.assertFalse(markdown_module.process("# Title", {"markdown_modify_clipboard": True}))
+
+
+class TestCodeFormatterWrite(unittest.TestCase):
+
+    def setUp(self):
+        code_formatter_module._content_tracker.clear()
+        patches = [
+            patch.object(code_formatter_module, "is_code", return_value=True),
+            patch.object(code_formatter_module, "cached_result", return_value="x = 1\n"),
+            patch.object(code_formatter_module, "show_notification"),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_failed_write_reports_not_modified(self):
+        with patch.object(code_formatter_module.pyperclip, "copy", side_effect=fail_write):
+            self.assertFalse(code_formatter_module.process("x=1", {"code_formatter_modify_clipboard": True}))
+
+    def test_written_code_reports_modified(self):
+        with patch.object(code_formatter_module.pyperclip, "copy") as copy:
+            self.assertTrue(code_formatter_module.process("x=1", {"code_formatter_modify_clipboard": True}))
+        copy.assert_called_once_with("x = 1\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Test cases for serial and parallel module execution.
+"""
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from module_executor import ModuleExecutor
+from module_manager import ModuleManager
+
+
+def make_module(name, result=None, delay=0.0, priority=None, modifies=True, log=None):
+    """Build a fake processing module."""
+    def process(content, config=None):
+        time.sleep(delay)
+        if log is not None:
+            log.append(name)
+        return result
+
+    module = SimpleNamespace(__name__=name, process=process, MODIFIES_CLIPBOARD=modifies)
+    if priority is not None:
+        module.PRIORITY = priority
+    return module
+
+
+class TestModuleExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ModuleExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_results_keep_module_order(self):
+        modules = [make_module("slow", "a", delay=0.05, modifies=False), make_module("fast", "b", modifies=False)]
+        results = self.executor.run(modules, lambda m: m.process("x"), parallel=True)
+        self.assertEqual([r.name for r in results], ["slow", "fast"])
+        self.assertEqual([r.result for r in results], ["a", "b"])
+
+    def test_read_only_modules_run_concurrently(self):
+        modules = [make_module(f"reader{i}", delay=0.1, modifies=False) for i in range(3)]
+        start = time.perf_counter()
+        self.executor.run(modules, lambda m: m.process("x"), parallel=True)
+        self.assertLess(time.perf_counter() - start, 0.25)
+
+    def test_clipboard_modifying_modules_run_in_order(self):
+        log = []
+        modules = [make_module("first", delay=0.05, log=log), make_module("second", log=log)]
+        self.executor.run(modules, lambda m: m.process("x"), parallel=True)
+        self.assertEqual(log, ["first", "second"])
+
+    def test_errors_are_captured(self):
+        def boom(content, config=None):
+            raise ValueError("boom")
+        modules = [SimpleNamespace(__name__="broken", process=boom), make_module("ok", "fine")]
+        results = self.executor.run(modules, lambda m: m.process("x"), parallel=True)
+        self.assertIsInstance(results[0].error, ValueError)
+        self.assertEqual(results[1].result, "fine")
+
+    def test_stop_skips_later_clipboard_modifying_modules(self):
+        modules = [make_module("claimer", "claimed"), make_module("writer", "other"),
+                   make_module("observer", modifies=False)]
+        for parallel in (False, True):
+            results = self.executor.run(modules, lambda m: m.process("x"), parallel=parallel,
+                                        stop=lambda outcome: outcome.result == "claimed")
+            self.assertEqual([r.name for r in results], ["claimer", "observer"])
+
+
+class TestParallelProcessContent(unittest.TestCase):
+
+    def _process(self, modules, parallel):
+        manager = ModuleManager()
+        manager.modules = modules
+        config = {"parallel_module_execution": parallel}
+        with patch.object(manager, "_load_performance_config", return_value=config), \
+                patch.object(manager, "_load_module_config", return_value={}):
+            try:
+                return manager.process_content("some content")
+            finally:
+                manager.shutdown()
+
+    def test_merge_is_deterministic_by_priority(self):
+        for parallel in (False, True):
+            modules = [make_module("late", "late result", priority=90),
+                       make_module("early", "early result", delay=0.05, priority=10),
+                       make_module("observer", priority=0, modifies=False)]
+            self.assertEqual(self._process(modules, parallel), "late result")
+
+    def test_observer_does_not_wait_for_slow_transformer(self):
+        finished = {}
+        transformer = make_module("slow_transformer", delay=0.2, priority=50)
+
+        def observe(content, config=None):
+            finished["observer"] = time.perf_counter()
+        observer = SimpleNamespace(__name__="observer", process=observe, PRIORITY=10, MODIFIES_CLIPBOARD=False)
+
+        start = time.perf_counter()
+        self._process([transformer, observer], parallel=True)
+        self.assertLess(finished["observer"] - start, 0.1)
+
+
+class TestModuleCapabilities(unittest.TestCase):
+
+    def _process(self, modules, content="some content"):
+        manager = ModuleManager()
+        manager.modules = modules
+        with patch.object(manager, "_load_performance_config", return_value={"content_routing": False}), \
+                patch.object(manager, "_load_module_config", return_value={}):
+            try:
+                return manager.process_content(content)
+            finally:
+                manager.shutdown()
+
+    def test_size_bounds_filter_before_running(self):
+        log = []
+        small_only = make_module("small_only", log=log)
+        small_only.MAX_CONTENT_SIZE = 5
+        large_only = make_module("large_only", log=log)
+        large_only.MIN_CONTENT_SIZE = 5
+        self._process([small_only, large_only], content="123456")
+        self.assertEqual(log, ["large_only"])
+
+    def test_exclusive_module_claims_content(self):
+        log = []
+        claimer = make_module("claimer", "url", priority=20, log=log)
+        claimer.EXCLUSIVE = True
+        later = make_module("later", "rtf", priority=40, log=log)
+        self.assertEqual(self._process([claimer, later]), "url")
+        self.assertEqual(log, ["claimer"])
+
+    def test_exclusive_module_that_passes_does_not_claim(self):
+        log = []
+        claimer = make_module("claimer", None, priority=20, log=log)
+        claimer.EXCLUSIVE = True
+        later = make_module("later", "rtf", priority=40, log=log)
+        self.assertEqual(self._process([claimer, later]), "rtf")
+        self.assertEqual(log, ["claimer", "later"])
+
+    def test_cheaper_modules_run_first_within_a_priority(self):
+        log = []
+        expensive = make_module("expensive", log=log)
+        expensive.COST = "expensive"
+        cheap = make_module("cheap", log=log)
+        cheap.COST = "cheap"
+        undeclared = make_module("undeclared", log=log)
+        self._process([expensive, undeclared, cheap])
+        self.assertEqual(log, ["cheap", "undeclared", "expensive"])
+
+
+if __name__ == "__main__":
+    unittest.main()
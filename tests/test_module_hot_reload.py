@@ -0,0 +1,90 @@
+"""
+Test cases for hot-reloading modules.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from module_manager import ModuleManager
+from content_tracker import get_content_store
+
+class TestModuleHotReload(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.version = 0
+        self.path = os.path.join(self.test_dir, "reload_module.py")
+        self.write_module("MODIFIES_CLIPBOARD = False\n\ndef process(content, config=None):\n    return 'v1'\n")
+        with open(os.path.join(self.test_dir, "other_module.py"), "w") as f:
+            f.write("def process(content, config=None):\n    return None\n")
+
+        self.manager = ModuleManager()
+        with patch.object(self.manager, "_load_module_config", return_value={}):
+            self.manager.load_modules(self.test_dir)
+        self.manager.warm_up()
+
+    def tearDown(self):
+        self.manager.shutdown()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_module(self, source):
+        with open(self.path, "w") as f:
+            f.write(source)
+        # Give each version a distinct mtime even on coarse-grained filesystems
+        self.version += 1
+        os.utime(self.path, ns=(0, self.version * 1_000_000_000))
+
+    def process(self):
+        return self.manager.get_module("reload_module").process("text")
+
+    def test_unchanged_modules_are_not_reloaded(self):
+        self.assertEqual(self.manager.check_module_changes(), [])
+
+    def test_changed_module_is_swapped(self):
+        other = self.manager.get_module("other_module")
+        self.write_module("def process(content, config=None):\n    return 'v2'\n")
+
+        self.assertEqual(self.manager.check_module_changes(), ["reload_module"])
+        self.assertEqual(self.process(), "v2")
+        # Other modules are untouched and keep their position
+        self.assertIs(self.manager.get_module("other_module"), other)
+        self.assertEqual(self.manager.get_loaded_modules_count(), 2)
+
+    def test_reload_clears_the_module_content_tracker(self):
+        store = get_content_store()
+        store.add("reload_module", "seen")
+        store.add("other_module", "seen")
+        self.addCleanup(store.clear, "other_module")
+        self.write_module("def process(content, config=None):\n    return 'v2'\n")
+
+        self.assertEqual(self.manager.check_module_changes(), ["reload_module"])
+        self.assertFalse(store.contains("reload_module", "seen"))
+        self.assertTrue(store.contains("other_module", "seen"))
+
+    def test_broken_module_keeps_old_version(self):
+        self.write_module("def process(content, config=None):\n    return (\n")
+        with patch("module_manager.submit_notification"):
+            self.assertEqual(self.manager.check_module_changes(), [])
+        self.assertEqual(self.process(), "v1")
+        # The broken version is not retried until the file changes again
+        self.assertEqual(self.manager.check_module_changes(), [])
+
+        self.write_module("def process(content, config=None):\n    return 'v3'\n")
+        self.assertEqual(self.manager.check_module_changes(), ["reload_module"])
+        self.assertEqual(self.process(), "v3")
+
+    def test_module_without_process_is_rejected(self):
+        self.write_module("VALUE = 1\n")
+        with patch("module_manager.submit_notification"):
+            self.assertEqual(self.manager.check_module_changes(), [])
+        self.assertEqual(self.process(), "v1")
+
+
+if __name__ == '__main__':
+    unittest.main()
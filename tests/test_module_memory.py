@@ -0,0 +1,104 @@
+"""
+Test cases for per-module memory attribution.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import textwrap
+import tracemalloc
+import importlib.util
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from module_memory import ModuleMemoryTracker
+from module_manager import ModuleManager
+
+
+MODULE_SOURCE = textwrap.dedent("""
+    _retained = []
+
+    def process(content, config=None):
+        if content == "keep":
+            _retained.append(bytearray(200000))
+        else:
+            bytearray(200000)
+""")
+
+
+class TestModuleMemoryTracker(unittest.TestCase):
+
+    def setUp(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc is already tracing")
+        self.test_dir = tempfile.mkdtemp()
+        self.files = {}
+        self.modules = {}
+        for name in ("hoarder_module", "tidy_module"):
+            path = os.path.join(self.test_dir, f"{name}.py")
+            with open(path, "w") as f:
+                f.write(MODULE_SOURCE)
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.files[name] = path
+            self.modules[name] = module
+        self.now = 0.0
+        self.tracker = ModuleMemoryTracker(interval=60, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.tracker.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_retained_memory_is_charged_to_its_module(self):
+        self.assertTrue(self.tracker.begin())
+        self.modules["hoarder_module"].process("keep")
+        self.modules["tidy_module"].process("drop")
+
+        sample = self.tracker.end(self.files)
+        self.assertGreaterEqual(sample["modules"]["hoarder_module"]["bytes"], 200000)
+        self.assertLess(sample["modules"]["tidy_module"]["bytes"], 200000)
+
+    def test_tracing_is_only_on_inside_a_window(self):
+        self.assertFalse(tracemalloc.is_tracing())
+        self.tracker.begin()
+        self.assertTrue(tracemalloc.is_tracing())
+        self.tracker.end(self.files)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNone(self.tracker.end(self.files))
+
+    def test_one_window_per_interval(self):
+        self.assertTrue(self.tracker.begin())
+        self.tracker.end(self.files)
+        self.now = 30.0
+        self.assertFalse(self.tracker.begin())
+        self.now = 61.0
+        self.assertTrue(self.tracker.begin())
+        self.modules["hoarder_module"].process("keep")
+        self.tracker.end(self.files)
+
+        stats = self.tracker.get_stats()
+        self.assertEqual(len(stats["samples"]), 2)
+        self.assertGreaterEqual(stats["latest"]["hoarder_module"], 200000)
+        self.assertGreaterEqual(stats["mean"]["hoarder_module"], 100000)
+
+    def test_manager_samples_a_change(self):
+        hoarder = self.modules["hoarder_module"]
+        manager = ModuleManager()
+        manager.modules = [SimpleNamespace(__name__="hoarder_module", __file__=self.files["hoarder_module"],
+                                           process=lambda content, config=None: hoarder.process("keep"))]
+        manager.start_memory_tracking()
+        with patch.object(manager, "_load_performance_config", return_value={"max_module_execution_time": 0}), \
+                patch.object(manager, "_load_module_config", return_value={}):
+            manager.process_content("anything")
+            stats = manager.get_memory_stats()
+        manager.shutdown()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreaterEqual(stats["latest"]["hoarder_module"], 200000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Test cases for per-module metrics.
+"""
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from module_metrics import LatencyHistogram, ModuleMetrics
+from module_manager import ModuleManager
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_empty_histogram(self):
+        stats = LatencyHistogram().get_stats()
+        self.assertEqual(stats["count"], 0)
+        self.assertEqual(stats["p99_ms"], 0.0)
+
+    def test_percentiles_fall_in_the_right_buckets(self):
+        histogram = LatencyHistogram(bounds=(1, 10, 100))
+        for _ in range(90):
+            histogram.record(0.5)
+        for _ in range(9):
+            histogram.record(50)
+        histogram.record(500)
+
+        self.assertLessEqual(histogram.percentile(0.50), 1)
+        self.assertGreater(histogram.percentile(0.95), 10)
+        self.assertLessEqual(histogram.percentile(0.95), 100)
+        self.assertLessEqual(histogram.percentile(1.0), 500)
+        self.assertEqual(histogram.get_stats()["buckets"], {"<=1": 90, "<=10": 0, "<=100": 9, ">100": 1})
+
+    def test_percentile_never_exceeds_max_sample(self):
+        histogram = LatencyHistogram(bounds=(1, 1000))
+        histogram.record(2)
+        self.assertLessEqual(histogram.percentile(0.99), 2)
+
+
+class TestModuleMetrics(unittest.TestCase):
+
+    def test_counters(self):
+        metrics = ModuleMetrics()
+        metrics.record("a", 0.002, 100, result=True)
+        metrics.record("a", 0.004, 50, error=True)
+        metrics.record("a", 0.5, 50, timeout=True)
+
+        stats = metrics.get_stats()["a"]
+        self.assertEqual(stats["invocations"], 3)
+        self.assertEqual(stats["results"], 1)
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertEqual(stats["bytes_processed"], 200)
+        self.assertEqual(stats["latency"]["count"], 3)
+        self.assertEqual(stats["detect_latency"]["count"], 0)
+
+    def test_detections_are_counted_apart_from_processing(self):
+        metrics = ModuleMetrics()
+        metrics.record_detection("a", 0.0001, hit=True)
+        metrics.record_detection("a", 0.0002, hit=False)
+        metrics.record_detection("a", 0.0003, error=True)
+
+        stats = metrics.get_stats()["a"]
+        self.assertEqual(stats["detections"], 3)
+        self.assertEqual(stats["detect_hits"], 1)
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["detect_latency"]["count"], 3)
+        self.assertEqual(stats["invocations"], 0)
+        self.assertEqual(stats["latency"]["count"], 0)
+
+    def test_process_content_records_metrics(self):
+        def fail(content, config=None):
+            raise ValueError("bad")
+
+        manager = ModuleManager()
+        manager.modules = [
+            SimpleNamespace(__name__="hit_module", process=lambda content, config=None: "new"),
+            SimpleNamespace(__name__="miss_module", process=lambda content, config=None: None),
+            SimpleNamespace(__name__="fail_module", process=fail),
+        ]
+        with patch.object(manager, "_load_performance_config", return_value={"max_module_execution_time": 0}), \
+                patch.object(manager, "_load_module_config", return_value={}):
+            manager.process_content("héllo")
+        manager.shutdown()
+
+        stats = manager.get_module_stats()
+        self.assertEqual(stats["hit_module"]["results"], 1)
+        self.assertEqual(stats["miss_module"]["results"], 0)
+        self.assertEqual(stats["fail_module"]["errors"], 1)
+        self.assertEqual(stats["hit_module"]["bytes_processed"], len("héllo".encode("utf-8")))
+        # Version 1 modules have no detect() to measure
+        self.assertEqual(stats["hit_module"]["detections"], 0)
+
+    def test_process_content_records_detect_hits(self):
+        manager = ModuleManager()
+        manager.modules = [
+            SimpleNamespace(__name__="match_module", API_VERSION=2,
+                            detect=lambda event, config=None: 1.0, process=lambda content, config=None: None),
+            SimpleNamespace(__name__="other_module", API_VERSION=2,
+                            detect=lambda event, config=None: 0.0, process=lambda content, config=None: "x"),
+        ]
+        with patch.object(manager, "_load_performance_config", return_value={"max_module_execution_time": 0}), \
+                patch.object(manager, "_load_module_config", return_value={}):
+            manager.process_content("hello")
+        manager.shutdown()
+
+        stats = manager.get_module_stats()
+        self.assertEqual(stats["match_module"]["detect_hits"], 1)
+        self.assertEqual(stats["match_module"]["invocations"], 1)
+        self.assertEqual(stats["match_module"]["results"], 0)
+        self.assertEqual(stats["other_module"]["detections"], 1)
+        self.assertEqual(stats["other_module"]["detect_hits"], 0)
+        self.assertEqual(stats["other_module"]["invocations"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Test cases for profile-guided detection ordering.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from clipboard_event import ClipboardEvent
+from module_api import run_detectors
+from module_manager import ModuleManager
+from module_profile import ModuleProfiler
+
+
+def make_module(name, score=0.0, priority=100, exclusive=False, cost=None, log=None):
+    """Build a fake version 2 module."""
+    def detect(event, config=None):
+        if log is not None:
+            log.append(name)
+        return score
+
+    module = SimpleNamespace(__name__=name, API_VERSION=2, detect=detect, process=lambda content, config=None: None,
+                             PRIORITY=priority, EXCLUSIVE=exclusive, MODIFIES_CLIPBOARD=True)
+    if cost is not None:
+        module.COST = cost
+    return module
+
+
+class TestModuleProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "module_profile.json")
+        self.profiler = ModuleProfiler(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def names(self, modules):
+        return [module.__name__ for module in modules]
+
+    def test_declared_cost_orders_unprofiled_modules(self):
+        modules = [make_module("slow", cost="expensive", exclusive=True),
+                   make_module("fast", cost="cheap", exclusive=True),
+                   make_module("plain", cost="cheap")]
+        self.assertEqual(self.names(self.profiler.order(modules)), ["fast", "slow", "plain"])
+
+    def test_selective_detector_moves_first(self):
+        rare = make_module("rare", exclusive=True)
+        common = make_module("common", exclusive=True)
+        for _ in range(50):
+            self.profiler.record("rare", 0.001, matched=False)
+            self.profiler.record("common", 0.001, matched=True)
+        self.assertEqual(self.names(self.profiler.order([rare, common])), ["common", "rare"])
+
+    def test_profile_survives_restart(self):
+        self.profiler.record("module", 0.002, matched=True)
+        self.assertTrue(self.profiler.save())
+
+        restored = ModuleProfiler()
+        self.assertTrue(restored.load(self.path))
+        report = restored.get_report([make_module("module", exclusive=True)])
+        self.assertEqual(report[0]["detections"], 1)
+        self.assertEqual(report[0]["matches"], 1)
+        self.assertIn("per match", report[0]["reason"])
+
+    def test_unreadable_profile_is_ignored(self):
+        with open(self.path, "w") as f:
+            f.write("not json")
+        self.assertFalse(self.profiler.load())
+
+    def test_record_does_not_write_the_file(self):
+        for _ in range(100):
+            self.profiler.record("module", 0.001, matched=False)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertTrue(self.profiler.flush())
+        self.assertTrue(os.path.exists(self.path))
+        # Nothing changed since, so nothing is written
+        self.assertFalse(self.profiler.flush())
+
+    def test_background_saver_writes_a_changed_profile(self):
+        profiler = ModuleProfiler(self.path, save_interval=0.01)
+        profiler.start_autosave()
+        try:
+            profiler.record("module", 0.001, matched=False)
+            deadline = time.monotonic() + 2
+            while not os.path.exists(self.path) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(os.path.exists(self.path))
+        finally:
+            profiler.stop()
+
+    def test_stop_saves_remaining_changes(self):
+        self.profiler.start_autosave()
+        self.profiler.record("module", 0.001, matched=True)
+        self.profiler.stop()
+        restored = ModuleProfiler()
+        self.assertTrue(restored.load(self.path))
+        self.assertEqual(restored.get_report([make_module("module")])[0]["detections"], 1)
+
+
+class TestDetectionOrder(unittest.TestCase):
+
+    def test_detection_order_does_not_change_outcome(self):
+        log = []
+        modules = [make_module("early", score=1.0, priority=10, log=log),
+                   make_module("diagram", score=1.0, priority=30, exclusive=True, log=log),
+                   make_module("late", score=1.0, priority=40, log=log)]
+        event = ClipboardEvent("x")
+
+        in_order, _ = run_detectors(modules, event)
+        profiled, _ = run_detectors(modules, event, detection_order=[modules[1], modules[2], modules[0]])
+        self.assertEqual(profiled, in_order)
+        self.assertEqual([module.__name__ for module in profiled], ["early", "diagram"])
+        # The exclusive match was tried first, so "late" was never detected
+        self.assertEqual(log[-2:], ["diagram", "early"])
+        self.assertNotIn("late", log)
+
+    def test_manager_records_detections_and_reports_order(self):
+        manager = ModuleManager()
+        manager.modules = [make_module("miss", exclusive=True), make_module("hit", score=1.0)]
+        with patch.object(manager, "_load_performance_config", return_value={"content_routing": False}), \
+                patch.object(manager, "_load_module_config", return_value={}):
+            try:
+                manager.process_content("some content")
+                report = {entry["name"]: entry for entry in manager.get_module_order_report()}
+            finally:
+                manager.shutdown()
+        self.assertEqual(report["miss"]["detections"], 1)
+        self.assertEqual(report["miss"]["matches"], 0)
+        self.assertEqual(report["hit"]["matches"], 1)
+        self.assertEqual(report["miss"]["position"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Test cases for background module warm-up.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import textwrap
+import threading
+import unittest
+from unittest.mock import patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from module_manager import ModuleManager
+
+MODULE_SOURCE = textwrap.dedent('''
+    LOADS = []
+    LOADS.append(1)
+
+    def process(content, config=None):
+        return None
+''')
+
+
+class TestModuleWarmup(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.test_dir, "warm_module.py"), "w") as f:
+            f.write(MODULE_SOURCE)
+        self.manager = ModuleManager()
+        with patch.object(self.manager, "_load_module_config", return_value={}):
+            self.manager.load_modules(self.test_dir)
+
+    def tearDown(self):
+        self.manager.shutdown()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_warm_up_loads_modules_and_sets_ready(self):
+        self.assertFalse(self.manager.is_ready())
+        self.manager.warm_up()
+        self.assertTrue(self.manager.is_ready())
+        self.assertEqual(self.manager.get_loaded_modules_count(), 1)
+
+    def test_first_change_reuses_warmed_modules(self):
+        self.manager.warm_up()
+        module = self.manager.get_module("warm_module")
+        self.manager.process_content("hello")
+        self.assertIs(self.manager.get_module("warm_module"), module)
+        self.assertEqual(module.LOADS, [1])
+
+    def test_concurrent_warm_up_and_change_load_once(self):
+        thread = threading.Thread(target=self.manager.warm_up)
+        thread.start()
+        self.manager.process_content("hello")
+        thread.join(5)
+        self.assertEqual(self.manager.get_loaded_modules_count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
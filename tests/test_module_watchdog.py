@@ -0,0 +1,223 @@
+"""
+Test cases for enforcing max_module_execution_time.
+"""
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from module_executor import ModuleExecutor, ModuleTimeoutError, get_module_budget
+from module_manager import ModuleManager
+from module_watchdog import ModuleWatchdog, CIRCUIT_OPEN, CIRCUIT_HALF_OPEN, CIRCUIT_CLOSED
+from constants import WATCHDOG_MIN_CALLS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_module(name, result=None, delay=0.0, modifies=True):
+    def process(content, config=None):
+        time.sleep(delay)
+        return result
+    return SimpleNamespace(__name__=name, process=process, MODIFIES_CLIPBOARD=modifies)
+
+
+class TestModuleWatchdog(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.watchdog = ModuleWatchdog(backoff_after=2, backoff_initial=10, backoff_max=25, clock=self.clock)
+
+    def test_backs_off_after_repeated_timeouts(self):
+        self.assertEqual(self.watchdog.record_timeout("slow")[0], 0)
+        self.assertFalse(self.watchdog.is_backed_off("slow"))
+        self.assertEqual(self.watchdog.record_timeout("slow")[0], 10)
+        self.assertTrue(self.watchdog.is_backed_off("slow"))
+        self.clock.now += 11
+        self.assertFalse(self.watchdog.is_backed_off("slow"))
+
+    def test_backoff_doubles_up_to_max(self):
+        backoffs = [self.watchdog.record_timeout("slow")[0] for _ in range(4)]
+        self.assertEqual(backoffs, [0, 10, 20, 25])
+
+    def test_success_resets_consecutive_count(self):
+        self.watchdog.record_timeout("slow")
+        self.watchdog.record_success("slow")
+        self.assertEqual(self.watchdog.record_timeout("slow")[0], 0)
+        self.assertEqual(self.watchdog.get_stats()["slow"]["timeouts"], 2)
+
+    def test_notifications_are_rate_limited(self):
+        watchdog = ModuleWatchdog(backoff_after=10, clock=self.clock)
+        self.assertTrue(watchdog.record_timeout("slow")[1])
+        self.assertFalse(watchdog.record_timeout("slow")[1])
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.watchdog = ModuleWatchdog(backoff_after=2, backoff_initial=10, backoff_max=100, clock=self.clock)
+
+    def state(self, name="flaky"):
+        return self.watchdog.get_stats()[name]["state"]
+
+    def test_errors_open_the_circuit(self):
+        self.assertEqual(self.watchdog.record_error("flaky"), (0, False))
+        self.assertEqual(self.watchdog.record_error("flaky"), (10, True))
+        self.assertEqual(self.state(), CIRCUIT_OPEN)
+        self.assertFalse(self.watchdog.allow("flaky"))
+        self.assertEqual(self.watchdog.get_stats()["flaky"]["skipped"], 1)
+        self.assertEqual(self.watchdog.get_open_circuits(), ["flaky"])
+
+    def test_half_open_allows_a_single_trial(self):
+        self.watchdog.record_error("flaky")
+        self.watchdog.record_error("flaky")
+        self.clock.now += 11
+        self.assertTrue(self.watchdog.allow("flaky"))
+        self.assertEqual(self.state(), CIRCUIT_HALF_OPEN)
+        self.assertFalse(self.watchdog.allow("flaky"))
+
+        self.watchdog.cancel_trial("flaky")
+        self.assertTrue(self.watchdog.allow("flaky"))
+
+    def test_successful_trial_closes_the_circuit(self):
+        self.watchdog.record_error("flaky")
+        self.watchdog.record_error("flaky")
+        self.clock.now += 11
+        self.watchdog.allow("flaky")
+        self.watchdog.record_success("flaky")
+        self.assertEqual(self.state(), CIRCUIT_CLOSED)
+        self.assertEqual(self.watchdog.get_open_circuits(), [])
+
+    def test_failed_trial_reopens_for_longer(self):
+        self.watchdog.record_error("flaky")
+        self.watchdog.record_error("flaky")
+        self.clock.now += 11
+        self.watchdog.allow("flaky")
+        self.assertEqual(self.watchdog.record_timeout("flaky")[0], 20)
+        self.assertEqual(self.state(), CIRCUIT_OPEN)
+
+    def test_failure_rate_opens_the_circuit(self):
+        watchdog = ModuleWatchdog(backoff_after=100, backoff_initial=10, clock=self.clock)
+        backoff = 0
+        for _ in range(WATCHDOG_MIN_CALLS // 2):
+            watchdog.record_success("flaky")
+            backoff = watchdog.record_error("flaky")[0]
+        self.assertEqual(backoff, 10)
+        self.assertTrue(watchdog.is_backed_off("flaky"))
+
+
+class TestExecutorBudget(unittest.TestCase):
+
+    def test_in_process_module_runs_to_completion(self):
+        executor = ModuleExecutor()
+        modules = [make_module("slow", "late", delay=0.1), make_module("quick", "done")]
+        results = executor.run(modules, lambda m: m.process("x"))
+        self.assertEqual([r.result for r in results], ["late", "done"])
+        self.assertIsNone(results[0].error)
+
+    def test_configured_budget_caps_declared_budget(self):
+        module = SimpleNamespace(__name__="converter", MAX_EXECUTION_TIME=35000)
+        self.assertEqual(get_module_budget(module, 500), 500)
+        self.assertEqual(get_module_budget(SimpleNamespace(MAX_EXECUTION_TIME=200), 500), 200)
+        self.assertEqual(get_module_budget(module, 0), 0)
+        self.assertEqual(get_module_budget(SimpleNamespace(), 500), 500)
+
+
+class TestManagerWatchdog(unittest.TestCase):
+
+    def _process(self, manager, content):
+        config = {"max_module_execution_time": 50}
+        with patch.object(manager, "_load_performance_config", return_value=config), \
+                patch.object(manager, "_load_module_config", return_value={}), \
+                patch("module_manager.show_notification") as notify:
+            result = manager.process_content(content)
+        return result, notify
+
+    def test_in_process_overrun_counts_as_a_timeout(self):
+        manager = ModuleManager()
+
+        def slow(content, config=None):
+            time.sleep(0.1)
+            return "converted"
+        manager.modules = [SimpleNamespace(__name__="slow_module", process=slow)]
+
+        result, notify = self._process(manager, "content")
+        # The module could not be stopped, so its result is still used
+        self.assertEqual(result, "converted")
+        notify.assert_called_once()
+        self.assertEqual(manager.get_timeout_stats()["slow_module"]["timeouts"], 1)
+        self.assertEqual(manager.get_module_stats()["slow_module"]["timeouts"], 1)
+
+    def test_repeated_in_process_overruns_open_the_circuit(self):
+        manager = ModuleManager()
+        calls = []
+
+        def slow(content, config=None):
+            calls.append(content)
+            time.sleep(0.1)
+        manager.modules = [SimpleNamespace(__name__="slow_module", process=slow)]
+
+        for i in range(4):
+            self._process(manager, f"content {i}")
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(manager.get_timeout_stats()["slow_module"]["state"], CIRCUIT_OPEN)
+
+    def test_isolated_module_worker_is_stopped_at_its_budget(self):
+        manager = ModuleManager()
+        manager.modules = [SimpleNamespace(__name__="converter_module", process=lambda content, config=None: None,
+                                           ISOLATION="process", MAX_EXECUTION_TIME=20)]
+        pool = MagicMock()
+        pool.run.return_value = None
+        with patch.object(manager, "_get_process_pool", return_value=pool):
+            self._process(manager, "content")
+        self.assertEqual(pool.run.call_args.kwargs["timeout"], 0.02)
+
+    def test_timeout_notifies_and_backs_off(self):
+        manager = ModuleManager()
+        calls = []
+
+        def hang(content, config=None):
+            # What the process pool raises after stopping a worker at its budget
+            calls.append(content)
+            raise ModuleTimeoutError("stopped")
+        manager.modules = [SimpleNamespace(__name__="hung_module", process=hang)]
+
+        for i in range(4):
+            _, notify = self._process(manager, f"content {i}")
+            if i == 0:
+                notify.assert_called_once()
+        # The third consecutive timeout backs the module off, so the fourth change skips it
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(manager.get_timeout_stats()["hung_module"]["timeouts"], 3)
+
+    def test_failing_module_is_skipped_once_circuit_opens(self):
+        manager = ModuleManager()
+        calls = []
+
+        def fail(content, config=None):
+            calls.append(content)
+            raise FileNotFoundError("black")
+        manager.modules = [SimpleNamespace(__name__="broken_module", process=fail)]
+
+        for i in range(5):
+            self._process(manager, f"content {i}")
+        self.assertEqual(len(calls), 3)
+        stats = manager.get_timeout_stats()["broken_module"]
+        self.assertEqual(stats["state"], CIRCUIT_OPEN)
+        self.assertEqual(stats["errors"], 3)
+        self.assertEqual(manager.get_open_circuits(), ["broken_module"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Test cases for running isolated modules in worker processes.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import textwrap
+import unittest
+import importlib.util
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from module_executor import ModuleTimeoutError
+from process_pool import ModuleProcessPool, ModuleCrashError, IsolatedModuleError
+from clipboard_writer import get_self_write_registry
+
+MODULE_SOURCE = textwrap.dedent('''
+    import os
+    import time
+
+    ISOLATION = "process"
+
+    def process(content, config=None):
+        if content.startswith("write "):
+            from clipboard_writer import write_clipboard
+            write_clipboard(content[6:], lambda text: None)
+            return None
+        if content == "pid":
+            return os.getpid()
+        if content == "crash":
+            os._exit(1)
+        if content == "hang":
+            time.sleep(10)
+        if content == "raise":
+            raise ValueError("bad content")
+        return content.upper()
+''')
+
+
+class TestModuleProcessPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_dir = tempfile.mkdtemp()
+        path = os.path.join(cls.test_dir, "isolated_test_module.py")
+        with open(path, "w") as f:
+            f.write(MODULE_SOURCE)
+        spec = importlib.util.spec_from_file_location("isolated_test_module", path)
+        cls.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.module)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_dir)
+
+    def setUp(self):
+        self.pool = ModuleProcessPool(workers=1, max_tasks=3)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_runs_in_a_warm_worker_process(self):
+        self.assertEqual(self.pool.run(self.module, "hello"), "HELLO")
+        pid = self.pool.run(self.module, "pid")
+        self.assertNotEqual(pid, os.getpid())
+        # The same worker serves the next call
+        self.assertEqual(self.pool.run(self.module, "pid"), pid)
+
+    def test_prestart_starts_idle_workers(self):
+        self.pool.prestart()
+        self.assertEqual(self.pool.get_stats()["workers"], 1)
+        self.assertEqual(self.pool.get_stats()["idle"], 1)
+        # The prestarted worker serves the first call
+        self.assertEqual(self.pool.run(self.module, "ok"), "OK")
+        self.assertEqual(self.pool.get_stats()["workers"], 1)
+
+    def test_worker_recycled_after_max_tasks(self):
+        pids = [self.pool.run(self.module, "pid") for _ in range(4)]
+        self.assertEqual(len(set(pids[:3])), 1)
+        self.assertNotEqual(pids[3], pids[0])
+        self.assertEqual(self.pool.get_stats()["recycled"], 1)
+
+    def test_crash_is_contained(self):
+        with self.assertRaises(ModuleCrashError):
+            self.pool.run(self.module, "crash")
+        self.assertEqual(self.pool.run(self.module, "ok"), "OK")
+
+    def test_module_exception_is_reported(self):
+        with self.assertRaises(IsolatedModuleError):
+            self.pool.run(self.module, "raise")
+
+    def test_timeout_kills_worker(self):
+        with self.assertRaises(ModuleTimeoutError):
+            self.pool.run(self.module, "hang", timeout=0.5)
+        self.assertEqual(self.pool.run(self.module, "ok"), "OK")
+
+    def test_worker_clipboard_writes_are_registered_in_the_service(self):
+        self.assertIsNone(self.pool.run(self.module, "write converted text"))
+        self.assertTrue(get_self_write_registry().is_own_content("converted text"))
+        # The worker keeps serving tasks after the write handshake
+        self.assertEqual(self.pool.run(self.module, "ok"), "OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Test cases for the module result cache.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import result_cache
+from result_cache import ResultCache, cached_result, make_cache_key
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_key_depends_on_every_part(self):
+        base = make_cache_key("m", "1", "op", {"theme": "dark"}, "content")
+        self.assertEqual(base, make_cache_key("m", "1", "op", {"theme": "dark"}, "content"))
+        self.assertNotEqual(base, make_cache_key("m", "2", "op", {"theme": "dark"}, "content"))
+        self.assertNotEqual(base, make_cache_key("m", "1", "op", {"theme": "forest"}, "content"))
+        self.assertNotEqual(base, make_cache_key("m", "1", "op", {"theme": "dark"}, "other"))
+        self.assertNotEqual(base, make_cache_key("n", "1", "op", {"theme": "dark"}, "content"))
+
+    def test_memory_hit_and_miss(self):
+        cache = ResultCache()
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", "value")
+        self.assertEqual(cache.get("k"), "value")
+        stats = cache.get_stats()
+        self.assertEqual((stats["memory_hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_memory_evicts_least_recently_used_by_size(self):
+        cache = ResultCache(memory_bytes=10)
+        cache.put("a", "aaaa")
+        cache.put("b", "bbbb")
+        cache.get("a")
+        cache.put("c", "cccc")
+        self.assertEqual(cache.get("a"), "aaaa")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get_stats()["memory_bytes"], 8)
+
+    def test_memory_is_bounded_in_bytes(self):
+        cache = ResultCache(memory_bytes=10)
+        cache.put("a", "é" * 4)
+        self.assertEqual(cache.get_stats()["memory_bytes"], 8)
+        cache.put("b", "é" * 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get_stats()["memory_bytes"], 4)
+
+    def test_processes_sharing_the_disk_keep_its_limit(self):
+        # Each worker process has its own ResultCache on the same directory
+        service = ResultCache(directory=self.test_dir, memory_bytes=0, disk_bytes=10)
+        worker = ResultCache(directory=self.test_dir, memory_bytes=0, disk_bytes=10)
+        service.put("a", "aaaa")
+        worker.put("b", "bbbb")
+        service.put("c", "cccc")
+        worker.put("d", "dddd")
+        self.assertLessEqual(service.get_stats()["disk_bytes"], 10)
+        self.assertEqual(len(os.listdir(self.test_dir)), 2)
+        self.assertEqual(worker.get("d"), "dddd")
+
+    def test_resize_trims_memory(self):
+        cache = ResultCache(memory_bytes=100)
+        cache.put("a", "aaaa")
+        cache.put("b", "bbbb")
+        cache.resize(4, 100)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), "bbbb")
+
+    def test_configuration_is_read_once_and_updated_on_change(self):
+        with patch("result_cache._result_cache", None), \
+                patch("result_cache._performance_config", None), \
+                patch("config_manager.ConfigManager") as config_manager:
+            config_manager.return_value.get_section.return_value = {"result_cache": True, "result_cache_disk_bytes": 0}
+            with patch("result_cache.get_app_paths", return_value={"base_dir": self.test_dir}):
+                cache = result_cache.get_result_cache()
+                self.assertIs(result_cache.get_result_cache(), cache)
+            config_manager.return_value.get_section.assert_called_once()
+
+            result_cache.on_config_change({"result_cache": True, "result_cache_memory_bytes": 4})
+            self.assertEqual(cache.memory_bytes, 4)
+            result_cache.on_config_change({"result_cache": False})
+            self.assertIsNone(result_cache.get_result_cache())
+            config_manager.return_value.get_section.assert_called_once()
+
+    def test_disk_store_survives_restart(self):
+        ResultCache(directory=self.test_dir).put("k", "persisted")
+        cache = ResultCache(directory=self.test_dir)
+        self.assertEqual(cache.get("k"), "persisted")
+        self.assertEqual(cache.get_stats()["disk_hits"], 1)
+        # Promoted to memory
+        self.assertEqual(cache.get("k"), "persisted")
+        self.assertEqual(cache.get_stats()["memory_hits"], 1)
+
+    def test_disk_evicts_by_size(self):
+        cache = ResultCache(directory=self.test_dir, memory_bytes=0, disk_bytes=10)
+        cache.put("a", "aaaa")
+        cache.put("b", "bbbb")
+        cache.put("c", "cccc")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), "cccc")
+        self.assertLessEqual(cache.get_stats()["disk_bytes"], 10)
+        self.assertEqual(len(os.listdir(self.test_dir)), 2)
+
+    def test_clear(self):
+        cache = ResultCache(directory=self.test_dir)
+        cache.put("k", "value")
+        cache.clear()
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+    def test_cached_result_computes_once(self):
+        cache = ResultCache()
+        compute = MagicMock(return_value="converted")
+        with patch("result_cache.get_result_cache", return_value=cache):
+            self.assertEqual(cached_result(__file__, "op", "source", compute), "converted")
+            self.assertEqual(cached_result(__file__, "op", "source", compute), "converted")
+        compute.assert_called_once_with("source")
+
+    def test_unchanged_and_empty_results_are_not_cached(self):
+        cache = ResultCache()
+        compute = MagicMock(side_effect=lambda content: content)
+        with patch("result_cache.get_result_cache", return_value=cache):
+            cached_result(__file__, "op", "source", compute)
+            cached_result(__file__, "op", "source", compute)
+            cached_result(__file__, "none", "source", lambda content: None)
+        self.assertEqual(compute.call_count, 2)
+        self.assertEqual(cache.get_stats()["stores"], 0)
+
+    def test_disabled_cache_always_computes(self):
+        compute = MagicMock(return_value="converted")
+        with patch("result_cache.get_result_cache", return_value=None):
+            cached_result(__file__, "op", "source", compute)
+            cached_result(__file__, "op", "source", compute)
+        self.assertEqual(compute.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
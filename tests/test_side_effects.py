@@ -0,0 +1,123 @@
+"""
+Test cases for the asynchronous side-effect executor.
+"""
+import os
+import sys
+import time
+import threading
+import unittest
+
+# Add project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from side_effects import SideEffectExecutor
+from constants import NOTIFICATION_DUPLICATE_WINDOW, NOTIFICATION_RATE_LIMIT
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSideEffectExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.executor = SideEffectExecutor(clock=self.clock)
+        self.calls = []
+
+    def tearDown(self):
+        self.executor.stop()
+
+    def record(self, *args):
+        self.calls.append(args)
+
+    def test_runs_inline_when_not_started(self):
+        self.assertTrue(self.executor.submit(self.record, "a"))
+        self.assertEqual(self.calls, [("a",)])
+
+    def test_inline_failure_is_logged_not_raised(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        self.executor.submit(fail)
+        self.assertEqual(self.executor.get_stats()["failed"], 1)
+
+    def test_submit_does_not_wait_for_action(self):
+        release = threading.Event()
+        self.executor.start()
+
+        start = time.perf_counter()
+        self.executor.submit(release.wait, 5)
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+        release.set()
+        self.executor.stop()
+        self.assertEqual(self.executor.get_stats()["executed"], 1)
+
+    def test_actions_run_in_submission_order(self):
+        self.executor.start()
+        for i in range(20):
+            self.executor.submit(self.record, i)
+        self.executor.stop()
+        self.assertEqual(self.calls, [(i,) for i in range(20)])
+
+    def test_pending_duplicates_are_coalesced(self):
+        release = threading.Event()
+        self.executor.start()
+        self.executor.submit(release.wait, 5)
+
+        self.assertTrue(self.executor.submit(self.record, "n", coalesce_key="n"))
+        self.assertFalse(self.executor.submit(self.record, "n", coalesce_key="n"))
+        release.set()
+        self.executor.stop()
+
+        self.assertEqual(self.calls, [("n",)])
+        self.assertEqual(self.executor.get_stats()["coalesced"], 1)
+
+    def test_identical_notification_suppressed_within_window(self):
+        self.executor.start()
+        self.executor.submit(self.record, "n", coalesce_key="n", rate_limited=True)
+        self.executor.stop()
+        self.executor.start()
+        self.executor.submit(self.record, "n", coalesce_key="n", rate_limited=True)
+        self.executor.stop()
+        self.assertEqual(len(self.calls), 1)
+
+        self.clock.now += NOTIFICATION_DUPLICATE_WINDOW + 1
+        self.executor.start()
+        self.executor.submit(self.record, "n", coalesce_key="n", rate_limited=True)
+        self.executor.stop()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_notification_burst_is_rate_limited(self):
+        self.executor.start()
+        for i in range(NOTIFICATION_RATE_LIMIT + 3):
+            self.executor.submit(self.record, i, coalesce_key=i, rate_limited=True)
+        self.executor.stop()
+
+        self.assertEqual(len(self.calls), NOTIFICATION_RATE_LIMIT)
+        self.assertEqual(self.executor.get_stats()["rate_limited"], 3)
+
+    def test_full_queue_drops_action(self):
+        executor = SideEffectExecutor(max_queue=1)
+        release = threading.Event()
+        started = threading.Event()
+        executor.start()
+        executor.submit(lambda: (started.set(), release.wait(5)))
+        started.wait(2)
+
+        self.assertTrue(executor.submit(self.record, 1))
+        self.assertFalse(executor.submit(self.record, 2))
+        release.set()
+        executor.stop()
+
+        self.assertEqual(self.calls, [(1,)])
+        self.assertEqual(executor.get_stats()["dropped"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
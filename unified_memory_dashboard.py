@@ -17,6 +17,7 @@ import gc
 import tracemalloc
 from collections import defaultdict, deque
 from utils import safe_expanduser, log_event, log_error
+from control_server import send_control_command
 
 # Fix psutil import issue when running from bundled app
 # The bundled psutil may be incomplete, so we need to handle this carefully
@@ -590,6 +591,28 @@ class UnifiedMemoryDashboard:
                     self.wfile.write(data.encode())
                 except BrokenPipeError:
                     pass
+            elif path == '/api/modules':
+                # Per-module counters and latency percentiles from the clipboard service
+                self.send_response(200)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+                self.end_headers()
+                data = json.dumps(self.dashboard.get_module_metrics())
+                try:
+                    self.wfile.write(data.encode())
+                except BrokenPipeError:
+                    pass
+            elif path == '/api/locks':
+                # Lock wait/hold times and contention from the clipboard service (when lock profiling is on)
+                self.send_response(200)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+                self.end_headers()
+                data = json.dumps(self.dashboard.get_lock_metrics())
+                try:
+                    self.wfile.write(data.encode())
+                except BrokenPipeError:
+                    pass
             elif path == '/api/events':
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
@@ -4909,6 +4932,35 @@ class UnifiedMemoryDashboard:
 
         # Background monitoring loop stopped
 
+    def get_module_metrics(self):
+        """Get per-module metrics from the running clipboard service over its control socket."""
+        response = send_control_command("modules")
+        if not response or not response.get("ok"):
+            return {"available": False, "ready": False, "loaded": [], "modules": {}, "circuits": {},
+                    "detection_order": [], "memory": None}
+        result = response.get("result") or {}
+        return {
+            "available": True,
+            "ready": result.get("ready", False),
+            "loaded": result.get("loaded", []),
+            "modules": result.get("metrics", {}),
+            "circuits": result.get("circuits", {}),
+            "detection_order": result.get("detection_order", []),
+            "memory": result.get("memory"),
+        }
+
+    def get_lock_metrics(self):
+        """Get lock contention statistics from the running clipboard service over its control socket."""
+        response = send_control_command("lock-stats")
+        if not response or not response.get("ok"):
+            return {"available": False, "profiling": False, "locks": {}}
+        result = response.get("result") or {}
+        return {
+            "available": True,
+            "profiling": result.get("profiling", False),
+            "locks": result.get("locks", {}),
+        }
+
     def force_garbage_collection(self):
         """Force garbage collection and return stats"""
         try:
@@ -2,9 +2,10 @@
 Shared utilities for the Clipboard Monitor application.
 """
 
+import codecs
 import subprocess
-import hashlib
 import logging
+import time
 import re
 import threading
 import os
@@ -19,6 +20,11 @@ except ImportError:
     PYPERCLIP_AVAILABLE = False
     pyperclip = None
 
+from constants import DEFAULT_LARGE_CONTENT_WINDOW, CONTENT_TRACKER_MAX_HISTORY
+from clipboard_event import ClipboardEvent
+from content_tracker import ContentStore, get_content_store
+from content_hashing import hash_bytes, new_hasher
+
 logger = logging.getLogger("utils")
 
 def setup_logging(out_log_path=None, err_log_path=None):
@@ -333,86 +339,79 @@ def ensure_directory_exists(path):
 class ContentTracker:
     """
     Track content to prevent processing loops.
-    
-    This class maintains a history of processed content hashes
-    to prevent the same content from being processed multiple times.
+
+    A tracker created with a namespace is a handle onto that namespace of the
+    process-wide ContentStore (see content_tracker.py), so trackers sharing a
+    namespace share their history. A tracker without a namespace keeps its own
+    private store.
     """
-    
-    def __init__(self, max_history=10):
+
+    def __init__(self, max_history=None, namespace=None):
         """
         Initialize the content tracker.
-        
+
         Args:
-            max_history (int): Maximum number of content hashes to track
+            max_history (int, optional): Maximum number of content hashes to track.
+                If None, uses the store's configured capacity.
+            namespace (str, optional): Shared store namespace, usually the module name
         """
-        self.max_history = max_history
-        self.content_hashes = []
-        self.lock = threading.Lock()
-        self.content_sizes = {}  # Track content sizes
-        
+        if namespace is None:
+            self.store = ContentStore(max_history or CONTENT_TRACKER_MAX_HISTORY)
+            self.namespace = "default"
+        else:
+            self.store = get_content_store()
+            self.namespace = namespace
+            if max_history is not None:
+                self.store.set_capacity(namespace, max_history)
+        self.lock = self.store.lock
+
+    @property
+    def max_history(self):
+        """Maximum number of content hashes tracked."""
+        return self.store.get_stats().get(self.namespace, {}).get("capacity", self.store.default_capacity)
+
     def add_content(self, content):
         """
         Add content to the tracker.
-        
+
         Args:
             content (str): The content to track
         """
         if not content:
             return
-        
-        content_hash = self._hash_content(content)
-        content_size = len(content)
-        
-        with self.lock:
-            # Add to the front of the list
-            self.content_hashes.insert(0, content_hash)
-            self.content_sizes[content_hash] = content_size
-            
-            # Trim the list if needed
-            if len(self.content_hashes) > self.max_history:
-                old_hash = self.content_hashes.pop()
-                if old_hash in self.content_sizes:
-                    del self.content_sizes[old_hash]
-    
+
+        self.store.add(self.namespace, self._hash_content(content), len(content))
+
     def has_processed(self, content):
         """
         Check if content has been processed recently.
-        
+
         Args:
             content (str): The content to check
-            
+
         Returns:
             bool: True if the content has been processed recently
         """
         if not content:
             return False
-        
-        content_hash = self._hash_content(content)
-        
-        with self.lock:
-            return content_hash in self.content_hashes
-    
+
+        return self.store.contains(self.namespace, self._hash_content(content))
+
     def _hash_content(self, content):
         """
-        Create a hash of the content.
-        
+        Create a hash of the full content.
+
         Args:
             content (str): The content to hash
-            
+
         Returns:
-            str: The content hash
+            str: The content hash (memoized when content is a ClipboardEvent)
         """
-        # Use faster hashing for large content
-        if len(content) > 10000:
-            # Only hash first and last 5000 chars for very large content
-            return hashlib.md5((content[:5000] + content[-5000:]).encode('utf-8')).hexdigest()
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
-    
+        return ClipboardEvent.from_content(content).content_hash
+
     def clear(self):
         """Clear all tracked content."""
-        with self.lock:
-            self.content_hashes = []
-            self.content_sizes.clear()
+        self.store.clear(self.namespace)
 
 def get_app_paths():
     """Return a dict of important app paths, unified with plist log locations."""
@@ -424,6 +423,7 @@ def get_app_paths():
         "history_file": str(base_dir / "clipboard_history.json"),
         "out_log": str(log_dir / "ClipboardMonitor.out.log"),
         "pause_flag": str(base_dir / "pause_flag"),
+        "control_socket": str(base_dir / "control.sock"),
         "err_log": str(log_dir / "ClipboardMonitor.err.log"),
         "status_file": str(base_dir / "status.txt")
     }
@@ -514,38 +514,205 @@ def load_clipboard_history():
         logger.error(f"Error loading clipboard history from {history_path}: {e}")
         return []
 
+class TruncatedContent(ClipboardEvent):
+    """
+    Prefix window of clipboard content that exceeded the size limit.
+
+    The full content is never materialized as a Python string; only this prefix,
+    the total size in bytes and a hash of the complete content are kept. Two
+    instances compare equal when their full-content hashes match.
+    """
+    truncated = True
+
+    def __new__(cls, prefix, total_bytes=None, content_hash=None):
+        return super().__new__(cls, prefix, total_bytes=total_bytes, content_hash=content_hash, truncated=True)
+
+    @classmethod
+    def from_text(cls, text, window_bytes):
+        """
+        Build a window from content that has already been read into memory.
+
+        The hash and size are those of text.encode('utf-8'), exactly what a
+        ClipboardEvent of the same text reports, so text read in canonical form (see
+        read_clipboard_bounded) hashes the same on either path.
+
+        Args:
+            text (str): The full content
+            window_bytes (int): Size of the prefix window in bytes
+
+        Returns:
+            TruncatedContent: Prefix window with the full content's size and hash
+        """
+        data = text.encode('utf-8')
+        prefix = data[:window_bytes].decode('utf-8', errors='ignore')
+        return cls(prefix, len(data), hash_bytes(data))
+
+def _normalize_newlines(text):
+    """Apply the same newline translation as universal_newlines=True."""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+class _CanonicalHasher:
+    """
+    Hash a UTF-8 byte stream in its canonical text form: decoded (invalid bytes
+    replaced), newlines normalized, and encoded again. This is the form the bounded
+    read returns, so the hash and size match a ClipboardEvent of the same text.
+    """
+
+    def __init__(self):
+        self.hasher = new_hasher()
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.pending_cr = False  # A '\r' at the end of a chunk may start a '\r\n'
+        self.total = 0
+
+    def update(self, chunk, final=False):
+        text = self.decoder.decode(chunk, final)
+        if self.pending_cr:
+            text = '\r' + text
+        self.pending_cr = not final and text.endswith('\r')
+        if self.pending_cr:
+            text = text[:-1]
+        data = _normalize_newlines(text).encode('utf-8')
+        self.hasher.update(data)
+        self.total += len(data)
+
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
+def read_clipboard_bounded(cmd, max_bytes, window_bytes, timeout=2):
+    """
+    Read command output (e.g. pbpaste) without ever holding more than max_bytes of it.
+
+    Output up to max_bytes is returned as a normal string. Beyond that, the rest of
+    the stream is only hashed and counted, and a TruncatedContent holding the first
+    window_bytes is returned instead. Either way the content is in canonical form
+    (UTF-8 decoded with replacement, newlines normalized), and a truncated read's
+    size and hash are those of that form, so they match the ClipboardEvent the same
+    content would produce if it were read in full.
+
+    Args:
+        cmd (list): Command and arguments
+        max_bytes (int): Largest content returned in full
+        window_bytes (int): Prefix kept for oversized content
+        timeout (float): Seconds before the read is abandoned
+
+    Returns:
+        str, TruncatedContent or None: Content, prefix window, or None on error
+    """
+    hasher = _CanonicalHasher()
+    buffer = bytearray()
+    truncated = False
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        logger.debug(f"Could not run {cmd[0]}: {e}")
+        return None
+
+    # Reads block, so the deadline is enforced by killing the process, which ends the stream
+    timed_out = threading.Event()
+
+    def kill_at_deadline():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill_at_deadline)
+    timer.daemon = True
+    start = time.monotonic()
+    timer.start()
+    try:
+        while True:
+            chunk = proc.stdout.read(65536)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            if not truncated:
+                buffer.extend(chunk)
+                if len(buffer) > max_bytes:
+                    truncated = True
+                    del buffer[window_bytes:]
+        hasher.update(b"", final=True)
+        proc.wait()
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Error reading clipboard via {cmd[0]}: {e}")
+        return None
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        logger.warning(f"Timed out reading clipboard via {cmd[0]} after {time.monotonic() - start:.1f}s")
+        return None
+    if proc.returncode != 0:
+        return None
+    if truncated:
+        prefix = _normalize_newlines(bytes(buffer).decode('utf-8', errors='ignore'))
+        logger.info(f"Clipboard content exceeds {max_bytes} bytes ({hasher.total} bytes); "
+                    f"keeping a {window_bytes}-byte window")
+        return TruncatedContent(prefix, hasher.total, hasher.hexdigest())
+    return _normalize_newlines(bytes(buffer).decode('utf-8', errors='replace'))
+
 # Moved from main.py and ClipboardMonitorHandler
-def get_clipboard_content():
-    """Get clipboard content, trying multiple formats to capture RTF content."""
+def get_clipboard_content(max_bytes=None, window_bytes=None):
+    """
+    Get clipboard content, trying multiple formats to capture RTF content.
+
+    Args:
+        max_bytes (int, optional): If given, content larger than this (in UTF-8 bytes)
+            is returned as a TruncatedContent prefix window instead. The pbpaste reads
+            never hold more than max_bytes; the pyperclip fallback has no streaming
+            API, so it reads the whole clipboard before truncating.
+        window_bytes (int, optional): Prefix size kept for oversized content
+
+    Returns:
+        str, TruncatedContent or None: Clipboard content
+    """
     try:
-        # Try to get plain text first (most common case)
-        try:
-            text_content = subprocess.check_output(['pbpaste'],
-                                                 universal_newlines=True,
-                                                 timeout=2)
-            if text_content and text_content.strip():
-                logger.debug("Found plain text content in clipboard")
-                return text_content
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            pass
-
-        # If no plain text, try RTF content
-        try:
-            rtf_content = subprocess.check_output(['pbpaste', '-Prefer', 'rtf'],
-                                                universal_newlines=True,
-                                                timeout=2)
-            if rtf_content and rtf_content.strip():
-                logger.debug("Found RTF content in clipboard")
-                return rtf_content
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            pass
+        if max_bytes is not None:
+            if window_bytes is None:
+                window_bytes = min(DEFAULT_LARGE_CONTENT_WINDOW, max_bytes)
+            # The stream is capped while it is read, so oversized content is never held in full
+            for cmd in (['pbpaste'], ['pbpaste', '-Prefer', 'rtf']):
+                content = read_clipboard_bounded(cmd, max_bytes, window_bytes)
+                if content and content.strip():
+                    logger.debug(f"Found clipboard content via {' '.join(cmd)} (bounded read)")
+                    return content
+        else:
+            # Try to get plain text first (most common case)
+            try:
+                text_content = subprocess.check_output(['pbpaste'],
+                                                     universal_newlines=True,
+                                                     timeout=2)
+                if text_content and text_content.strip():
+                    logger.debug("Found plain text content in clipboard")
+                    return text_content
+            except (subprocess.SubprocessError, subprocess.TimeoutExpired):
+                pass
+
+            # If no plain text, try RTF content
+            try:
+                rtf_content = subprocess.check_output(['pbpaste', '-Prefer', 'rtf'],
+                                                    universal_newlines=True,
+                                                    timeout=2)
+                if rtf_content and rtf_content.strip():
+                    logger.debug("Found RTF content in clipboard")
+                    return rtf_content
+            except (subprocess.SubprocessError, subprocess.TimeoutExpired):
+                pass
 
         # Fallback to pyperclip (if available)
         if PYPERCLIP_AVAILABLE:
             try:
+                # Not bounded: pyperclip returns the whole clipboard at once
                 pyperclip_content = pyperclip.paste()
                 if pyperclip_content and pyperclip_content.strip():
                     logger.debug("Found content via pyperclip")
+                    if max_bytes is not None:
+                        # The same canonical form as the bounded pbpaste read
+                        pyperclip_content = ClipboardEvent(_normalize_newlines(pyperclip_content))
+                        if pyperclip_content.byte_length > max_bytes:
+                            return TruncatedContent.from_text(pyperclip_content, window_bytes)
                     return pyperclip_content
             except pyperclip.PyperclipException:
                 pass
@@ -664,6 +831,7 @@ __all__ = [
     'show_notification', 'validate_string_input', 'safe_subprocess_run',
     'get_home_directory', 'safe_expanduser', 'ensure_directory_exists',
     'ContentTracker', 'get_app_paths', 'get_config', 'reload_config', 'set_config_value',
-    'load_clipboard_history', 'get_clipboard_content', 'update_service_status',
+    'load_clipboard_history', 'get_clipboard_content', 'TruncatedContent',
+    'read_clipboard_bounded', 'update_service_status',
     'get_service_status', 'log_event', 'log_error'
 ]